@@ -7,6 +7,7 @@ from models.schemas import BidNotice, LineItem, ScrapingLog, AwardedContract, Aw
 from models.database import Database
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 import logging
 import asyncio
@@ -17,8 +18,20 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Held for the whole of a scraper run, so a second run can't start alongside it
+scraper_run_lock = asyncio.Lock()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the browser kept open between scraper runs on shutdown."""
+    yield
+    if public_scraper is not None:
+        await public_scraper.close()
+
+
 # Initialize FastAPI app
-app = FastAPI(title="PhilGEPS Dashboard API", version="1.0.0")
+app = FastAPI(title="PhilGEPS Dashboard API", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware for React frontend
 app.add_middleware(
@@ -44,6 +57,10 @@ scraper_status = {
     "error": None
 }
 
+# Public scraper reused across runs so its browser stays warm
+# (created on first run, closed on shutdown)
+public_scraper = None
+
 
 # Pydantic models for API requests
 class ScraperConfig(BaseModel):
@@ -585,6 +602,7 @@ async def _run_scraper_async(config: Optional[Dict[str, Any]] = None) -> Dict:
     Async scraper execution using PublicPhilGEPSScraper (no authentication required).
     This function runs the public scraper which doesn't need credentials.
     """
+    global public_scraper
     import os
 
     # Import public scraper here to avoid circular imports
@@ -645,8 +663,9 @@ async def _run_scraper_async(config: Optional[Dict[str, Any]] = None) -> Dict:
 
         # Run public scraper (no authentication required)
         logger.info(f"Executing PUBLIC scraper with {num_workers} workers...")
-        scraper = PublicPhilGEPSScraper(num_workers=num_workers)
-        results = await scraper.run()
+        if public_scraper is None:
+            public_scraper = PublicPhilGEPSScraper(num_workers=num_workers, keep_browser_open=True)
+        results = await public_scraper.run(num_workers=num_workers)
         logger.info(f"Public scraper execution completed: {results}")
         return results
 
@@ -666,6 +685,9 @@ async def run_scraper_background(config: Optional[Dict[str, Any]] = None):
 
     Args:
         config: Optional configuration to override defaults
+
+    Note: run_scraper acquires scraper_run_lock before scheduling this task;
+    it is released here once the run ends.
     """
     global scraper_status
 
@@ -698,6 +720,7 @@ async def run_scraper_background(config: Optional[Dict[str, Any]] = None):
         scraper_status["current_progress"] = "Failed"
     finally:
         scraper_status["running"] = False
+        scraper_run_lock.release()
 
 
 @app.post("/api/scraper/run")
@@ -712,15 +735,19 @@ async def run_scraper(request: ScraperRunRequest, background_tasks: BackgroundTa
     Returns:
     - Success message with task ID
     """
-    if scraper_status["running"]:
+    # Checked on the lock, not scraper_status: a stopped run may still be finishing
+    if scraper_run_lock.locked():
         raise HTTPException(status_code=409, detail="Scraper is already running")
 
+    # Taken now so a second request can't get in before the background task starts
+    await scraper_run_lock.acquire()
+
     try:
         config_dict = None
         if request.config:
             config_dict = request.config.dict(exclude_none=True)
 
-        # Add scraper task to background
+        # Add scraper task to background (it releases the lock)
         background_tasks.add_task(run_scraper_background, config_dict)
 
         return {
@@ -729,6 +756,7 @@ async def run_scraper(request: ScraperRunRequest, background_tasks: BackgroundTa
             "one_time": request.one_time
         }
     except Exception as e:
+        scraper_run_lock.release()
         logger.error(f"Error starting scraper: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error starting scraper: {str(e)}")
 
@@ -49,6 +49,12 @@ class Settings:
     SCHEDULE_TIMEZONE = os.getenv("SCHEDULE_TIMEZONE", "Asia/Manila")  # Philippine time
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
     REQUEST_DELAY_SECONDS = int(os.getenv("REQUEST_DELAY_SECONDS", "2"))
+    # Scraped bids are written to the database in batches of this size
+    # (a batch is also flushed when a worker finishes)
+    SAVE_BATCH_SIZE = int(os.getenv("SAVE_BATCH_SIZE", "25"))
+    # Scales the human-like reading and pagination pauses (1.0 = full stealth
+    # timing, 0 = skip them, e.g. for bulk historical imports)
+    HUMAN_DELAY_MULT = float(os.getenv("HUMAN_DELAY_MULT", "1.0"))
 
     # Date Filtering (format: DD-MMM-YYYY, e.g., "13-Nov-2025")
     # Special values: "TODAY", "YESTERDAY", "AUTO" (yesterday to today)
@@ -105,6 +111,20 @@ class Settings:
     HEADLESS_MODE = os.getenv("HEADLESS_MODE", "true").lower() == "true"
     BROWSER_TYPE = os.getenv("BROWSER_TYPE", "chromium")  # chromium, firefox, webkit
     BROWSER_TIMEOUT = 30000  # milliseconds
+    # Abort image/font/media/stylesheet requests; the scraper only reads HTML
+    BLOCK_SUBRESOURCES = os.getenv("BLOCK_SUBRESOURCES", "true").lower() == "true"
+    # Fetch detail pages with a plain HTTP GET (browser cookies and user agent)
+    # and only fall back to rendering them in a tab when that fails
+    HTTP_DETAIL_FETCH = os.getenv("HTTP_DETAIL_FETCH", "true").lower() == "true"
+    # Listing pages 2..N are fetched over HTTP this many at a time
+    # (0 walks them one by one in the browser)
+    HTTP_LISTING_CONCURRENCY = int(os.getenv("HTTP_LISTING_CONCURRENCY", "4"))
+    # Cap on concurrent HTTP requests to one host (X-RateLimit-* headers and
+    # 429/5xx backoff are honoured on top of this; retries use MAX_RETRIES)
+    HTTP_MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "8"))
+    # Threads fetching listing and detail pages over HTTP in the authenticated
+    # scraper; requests are paced to this many per REQUEST_DELAY_SECONDS
+    HTTP_FETCH_WORKERS = int(os.getenv("HTTP_FETCH_WORKERS", "4"))
 
     # Persistent Browser Profile (RECOMMENDED for easier reCAPTCHA)
     USE_PERSISTENT_PROFILE = os.getenv("USE_PERSISTENT_PROFILE", "true").lower() == "true"
@@ -118,11 +138,15 @@ class Settings:
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = os.getenv("LOG_FILE", "logs/scraper.log")
+    # Dump pages the parser found nothing on to DEBUG_HTML_DIR (gzipped)
+    DEBUG_SAVE_HTML = os.getenv("DEBUG_SAVE_HTML", "false").lower() == "true"
 
     # Paths
     BASE_DIR = Path(__file__).resolve().parent.parent
     DATA_DIR = BASE_DIR / "data"
     LOGS_DIR = BASE_DIR / "logs"
+    # Relative to BASE_DIR unless absolute
+    DEBUG_HTML_DIR = BASE_DIR / os.getenv("DEBUG_HTML_DIR", "logs/debug_html")
     PROFILE_DIR = Path(USER_DATA_DIR) if USER_DATA_DIR else None
 
     # Notifications (optional)
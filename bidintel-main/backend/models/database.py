@@ -1,22 +1,53 @@
 """Database connection and operations."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from models.schemas import Base, BidNotice, ScrapingLog, LineItem, BidDocument, AwardedContract, AwardLineItem, AwardDocument
 from config.settings import settings
 from utils.logger import logger
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set, Union
 from datetime import datetime
 
+# Applied to every new SQLite connection: WAL lets readers (the dashboard API)
+# run alongside a scraper commit, and synchronous=NORMAL is crash-safe under
+# WAL while skipping an fsync per transaction
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune a new SQLite connection for batched writes."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _award_dict(award_data: Dict) -> Dict:
+    """Plain dict of award data to merge (a record's as_dict(), or a copy of the dict)."""
+    # Duck-typed so the models layer doesn't import scraper.parser for AwardRecord
+    return award_data.as_dict() if hasattr(award_data, 'as_dict') else dict(award_data)
+
 
 class Database:
     """Database manager for PhilGEPS scraper."""
 
+    # Most values bound into one IN (...) clause
+    IN_QUERY_CHUNK_SIZE = 900
+
     def __init__(self):
         """Initialize database connection."""
         self.engine = create_engine(settings.DATABASE_URL, echo=False)
+        if self.engine.dialect.name == 'sqlite':
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        self._log_insert = ScrapingLog.__table__.insert()
         self._create_tables()
 
     def _create_tables(self):
@@ -49,51 +80,12 @@ class Database:
         """
         session = self.get_session()
         try:
-            # Extract line_items and documents from bid_data to handle separately
-            line_items_data = bid_data.pop('line_items', [])
-            documents_data = bid_data.pop('documents', [])
-
             # Check if already exists
             existing = session.query(BidNotice).filter_by(
                 reference_number=bid_data['reference_number']
             ).first()
 
-            if existing:
-                # Update existing record
-                for key, value in bid_data.items():
-                    if hasattr(existing, key) and key not in ['line_items', 'documents']:
-                        setattr(existing, key, value)
-
-                # Clear and update line items
-                existing.line_items.clear()
-                for item_data in line_items_data:
-                    line_item = LineItem(**item_data)
-                    existing.line_items.append(line_item)
-
-                # Clear and update documents
-                existing.documents.clear()
-                for doc_data in documents_data:
-                    document = BidDocument(**doc_data)
-                    existing.documents.append(document)
-
-                logger.debug(f"Updated bid: {bid_data['reference_number']}")
-                bid_notice = existing
-            else:
-                # Create new record without line_items and documents
-                bid_notice = BidNotice(**bid_data)
-                session.add(bid_notice)
-
-                # Add line items as ORM instances
-                for item_data in line_items_data:
-                    line_item = LineItem(**item_data)
-                    bid_notice.line_items.append(line_item)
-
-                # Add documents as ORM instances
-                for doc_data in documents_data:
-                    document = BidDocument(**doc_data)
-                    bid_notice.documents.append(document)
-
-                logger.debug(f"Created new bid: {bid_data['reference_number']}")
+            bid_notice = self._merge_bid_notice(session, bid_data, existing)
 
             session.commit()
             session.refresh(bid_notice)
@@ -110,6 +102,110 @@ class Database:
         finally:
             session.close()
 
+    def save_bid_notices(self, bids: List[Dict]) -> int:
+        """
+        Save or update a batch of bid notices in one transaction.
+
+        Existing rows for the whole batch are loaded with a single query and
+        everything is committed together. If the batch fails, each bid is
+        retried on its own with save_bid_notice so one bad record does not
+        drop the rest.
+
+        Args:
+            bids: Bid notice dictionaries (as for save_bid_notice)
+
+        Returns:
+            int: Number of bid notices saved
+        """
+        if not bids:
+            return 0
+
+        session = self.get_session()
+        try:
+            references = {bid_data['reference_number'] for bid_data in bids}
+            existing_by_reference = {
+                bid_notice.reference_number: bid_notice
+                for bid_notice in session.query(BidNotice).filter(
+                    BidNotice.reference_number.in_(references)
+                )
+            }
+
+            for bid_data in bids:
+                # Copy so a failed batch can be retried with the original data
+                bid_data = dict(bid_data)
+                reference_number = bid_data['reference_number']
+                # A reference repeated within the batch updates the row created for it
+                existing_by_reference[reference_number] = self._merge_bid_notice(
+                    session, bid_data, existing_by_reference.get(reference_number)
+                )
+
+            session.commit()
+            logger.debug(f"Saved batch of {len(bids)} bids")
+            return len(bids)
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error saving batch of {len(bids)} bids, saving one at a time: {str(e)}")
+        finally:
+            session.close()
+
+        return sum(self.save_bid_notice(bid_data) is not None for bid_data in bids)
+
+    @staticmethod
+    def _merge_bid_notice(session: Session, bid_data: Dict, existing: Optional[BidNotice]) -> BidNotice:
+        """
+        Apply bid_data to existing (or a new BidNotice added to session).
+
+        Args:
+            session: Session the bid notice belongs to
+            bid_data: Bid notice data; line_items and documents are popped off
+            existing: Stored bid notice with the same reference number, or None
+
+        Returns:
+            BidNotice: The updated or newly added bid notice
+        """
+        # Extract line_items and documents from bid_data to handle separately
+        line_items_data = bid_data.pop('line_items', [])
+        documents_data = bid_data.pop('documents', [])
+
+        if existing:
+            # Update existing record
+            for key, value in bid_data.items():
+                if hasattr(existing, key) and key not in ['line_items', 'documents']:
+                    setattr(existing, key, value)
+
+            # Clear and update line items
+            existing.line_items.clear()
+            for item_data in line_items_data:
+                line_item = LineItem(**item_data)
+                existing.line_items.append(line_item)
+
+            # Clear and update documents
+            existing.documents.clear()
+            for doc_data in documents_data:
+                document = BidDocument(**doc_data)
+                existing.documents.append(document)
+
+            logger.debug(f"Updated bid: {bid_data['reference_number']}")
+            return existing
+
+        # Create new record without line_items and documents
+        bid_notice = BidNotice(**bid_data)
+        session.add(bid_notice)
+
+        # Add line items as ORM instances
+        for item_data in line_items_data:
+            line_item = LineItem(**item_data)
+            bid_notice.line_items.append(line_item)
+
+        # Add documents as ORM instances
+        for doc_data in documents_data:
+            document = BidDocument(**doc_data)
+            bid_notice.documents.append(document)
+
+        logger.debug(f"Created new bid: {bid_data['reference_number']}")
+        return bid_notice
+
     def bid_exists(self, reference_number: str) -> bool:
         """
         Check if bid notice already exists in database.
@@ -129,6 +225,32 @@ class Database:
         finally:
             session.close()
 
+    def get_existing_reference_numbers(self, reference_numbers: List[str]) -> Set[str]:
+        """
+        Find which of the given bid reference numbers are already stored.
+
+        Args:
+            reference_numbers: Bid reference numbers to look up
+
+        Returns:
+            set: The reference numbers that exist in the database
+        """
+        reference_numbers = list(dict.fromkeys(reference_numbers))
+        existing = set()
+        session = self.get_session()
+        try:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(reference_numbers), self.IN_QUERY_CHUNK_SIZE):
+                chunk = reference_numbers[start:start + self.IN_QUERY_CHUNK_SIZE]
+                existing.update(
+                    reference_number for (reference_number,) in session.query(BidNotice.reference_number).filter(
+                        BidNotice.reference_number.in_(chunk)
+                    )
+                )
+            return existing
+        finally:
+            session.close()
+
     def get_bid_by_reference(self, reference_number: str) -> Optional[BidNotice]:
         """
         Get bid notice by reference number.
@@ -308,28 +430,30 @@ class Database:
         finally:
             session.close()
 
-    def save_scraping_log(self, log_entry: ScrapingLog) -> Optional[ScrapingLog]:
+    def save_scraping_log(self, log_entry: Union[Dict, ScrapingLog]) -> bool:
         """
-        Save a scraping log entry.
+        Save a scraping log entry with a single INSERT (no ORM session).
 
         Args:
-            log_entry: ScrapingLog instance
+            log_entry: Column values for the log row, or a ScrapingLog instance
 
         Returns:
-            ScrapingLog: Saved log entry or None
+            bool: True if the entry was saved
         """
-        session = self.get_session()
+        if isinstance(log_entry, ScrapingLog):
+            log_entry = {
+                column.key: getattr(log_entry, column.key)
+                for column in ScrapingLog.__table__.columns
+                if getattr(log_entry, column.key) is not None
+            }
+
         try:
-            session.add(log_entry)
-            session.commit()
-            session.refresh(log_entry)
-            return log_entry
+            with self.engine.begin() as connection:
+                connection.execute(self._log_insert, log_entry)
+            return True
         except Exception as e:
-            session.rollback()
             logger.error(f"Error saving scraping log: {str(e)}")
-            return None
-        finally:
-            session.close()
+            return False
 
     def get_recent_logs(self, limit: int = 10) -> List[ScrapingLog]:
         """
@@ -385,58 +509,21 @@ class Database:
         Save or update an awarded contract.
 
         Args:
-            award_data: Dictionary containing awarded contract data
+            award_data: Awarded contract data, as a dictionary or a
+                scraper.parser.AwardRecord (anything with as_dict())
 
         Returns:
             AwardedContract: Saved awarded contract instance or None
         """
+        award_data = _award_dict(award_data)
         session = self.get_session()
         try:
-            # Extract line_items and documents from award_data to handle separately
-            line_items_data = award_data.pop('line_items', [])
-            documents_data = award_data.pop('documents', [])
-
             # Check if already exists
             existing = session.query(AwardedContract).filter_by(
                 award_notice_number=award_data['award_notice_number']
             ).first()
 
-            if existing:
-                # Update existing record
-                for key, value in award_data.items():
-                    if hasattr(existing, key) and key not in ['line_items', 'documents']:
-                        setattr(existing, key, value)
-
-                # Clear and update line items
-                existing.line_items.clear()
-                for item_data in line_items_data:
-                    line_item = AwardLineItem(**item_data)
-                    existing.line_items.append(line_item)
-
-                # Clear and update documents
-                existing.documents.clear()
-                for doc_data in documents_data:
-                    document = AwardDocument(**doc_data)
-                    existing.documents.append(document)
-
-                logger.debug(f"Updated awarded contract: {award_data['award_notice_number']}")
-                awarded_contract = existing
-            else:
-                # Create new record without line_items and documents
-                awarded_contract = AwardedContract(**award_data)
-                session.add(awarded_contract)
-
-                # Add line items as ORM instances
-                for item_data in line_items_data:
-                    line_item = AwardLineItem(**item_data)
-                    awarded_contract.line_items.append(line_item)
-
-                # Add documents as ORM instances
-                for doc_data in documents_data:
-                    document = AwardDocument(**doc_data)
-                    awarded_contract.documents.append(document)
-
-                logger.debug(f"Created new awarded contract: {award_data['award_notice_number']}")
+            awarded_contract = self._merge_awarded_contract(session, award_data, existing)
 
             session.commit()
             session.refresh(awarded_contract)
@@ -453,6 +540,113 @@ class Database:
         finally:
             session.close()
 
+    def save_awarded_contracts(self, awards: List[Dict]) -> int:
+        """
+        Save or update a batch of awarded contracts in one transaction.
+
+        Works like save_bid_notices: one query loads the existing rows, one
+        commit saves the batch, and a failed batch is retried one award at a
+        time with save_awarded_contract.
+
+        Args:
+            awards: Awarded contract dictionaries or AwardRecords (as for
+                save_awarded_contract)
+
+        Returns:
+            int: Number of awarded contracts saved
+        """
+        if not awards:
+            return 0
+
+        awards = [_award_dict(award_data) for award_data in awards]
+        session = self.get_session()
+        try:
+            numbers = {award_data['award_notice_number'] for award_data in awards}
+            existing_by_number = {
+                awarded_contract.award_notice_number: awarded_contract
+                for awarded_contract in session.query(AwardedContract).filter(
+                    AwardedContract.award_notice_number.in_(numbers)
+                )
+            }
+
+            for award_data in awards:
+                # Copy so a failed batch can be retried with the original data
+                award_data = dict(award_data)
+                award_notice_number = award_data['award_notice_number']
+                # A number repeated within the batch updates the row created for it
+                existing_by_number[award_notice_number] = self._merge_awarded_contract(
+                    session, award_data, existing_by_number.get(award_notice_number)
+                )
+
+            session.commit()
+            logger.debug(f"Saved batch of {len(awards)} awarded contracts")
+            return len(awards)
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error saving batch of {len(awards)} awarded contracts, saving one at a time: {str(e)}")
+        finally:
+            session.close()
+
+        return sum(self.save_awarded_contract(award_data) is not None for award_data in awards)
+
+    @staticmethod
+    def _merge_awarded_contract(
+        session: Session, award_data: Dict, existing: Optional[AwardedContract]
+    ) -> AwardedContract:
+        """
+        Apply award_data to existing (or a new AwardedContract added to session).
+
+        Args:
+            session: Session the awarded contract belongs to
+            award_data: Awarded contract data; line_items and documents are popped off
+            existing: Stored awarded contract with the same award notice number, or None
+
+        Returns:
+            AwardedContract: The updated or newly added awarded contract
+        """
+        # Extract line_items and documents from award_data to handle separately
+        line_items_data = award_data.pop('line_items', [])
+        documents_data = award_data.pop('documents', [])
+
+        if existing:
+            # Update existing record
+            for key, value in award_data.items():
+                if hasattr(existing, key) and key not in ['line_items', 'documents']:
+                    setattr(existing, key, value)
+
+            # Clear and update line items
+            existing.line_items.clear()
+            for item_data in line_items_data:
+                line_item = AwardLineItem(**item_data)
+                existing.line_items.append(line_item)
+
+            # Clear and update documents
+            existing.documents.clear()
+            for doc_data in documents_data:
+                document = AwardDocument(**doc_data)
+                existing.documents.append(document)
+
+            logger.debug(f"Updated awarded contract: {award_data['award_notice_number']}")
+            return existing
+
+        # Create new record without line_items and documents
+        awarded_contract = AwardedContract(**award_data)
+        session.add(awarded_contract)
+
+        # Add line items as ORM instances
+        for item_data in line_items_data:
+            line_item = AwardLineItem(**item_data)
+            awarded_contract.line_items.append(line_item)
+
+        # Add documents as ORM instances
+        for doc_data in documents_data:
+            document = AwardDocument(**doc_data)
+            awarded_contract.documents.append(document)
+
+        logger.debug(f"Created new awarded contract: {award_data['award_notice_number']}")
+        return awarded_contract
+
     def awarded_contract_exists(self, award_notice_number: str) -> bool:
         """
         Check if awarded contract already exists in database.
@@ -472,6 +666,32 @@ class Database:
         finally:
             session.close()
 
+    def get_existing_award_numbers(self, award_notice_numbers: List[str]) -> Set[str]:
+        """
+        Find which of the given award notice numbers are already stored.
+
+        Args:
+            award_notice_numbers: Award notice numbers to look up
+
+        Returns:
+            set: The award notice numbers that exist in the database
+        """
+        award_notice_numbers = list(dict.fromkeys(award_notice_numbers))
+        existing = set()
+        session = self.get_session()
+        try:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(award_notice_numbers), self.IN_QUERY_CHUNK_SIZE):
+                chunk = award_notice_numbers[start:start + self.IN_QUERY_CHUNK_SIZE]
+                existing.update(
+                    number for (number,) in session.query(AwardedContract.award_notice_number).filter(
+                        AwardedContract.award_notice_number.in_(chunk)
+                    )
+                )
+            return existing
+        finally:
+            session.close()
+
     def get_awarded_contract_by_number(self, award_notice_number: str) -> Optional[AwardedContract]:
         """
         Get awarded contract by award notice number.
@@ -503,7 +723,9 @@ class Database:
         """
         session = self.get_session()
         try:
-            query = session.query(AwardedContract)
+            # Documents loaded with the contracts (one extra query), so they
+            # can be read after the session is closed
+            query = session.query(AwardedContract).options(selectinload(AwardedContract.documents))
 
             # Apply filters if provided
             if filters:
@@ -696,6 +918,40 @@ class Database:
         finally:
             session.close()
 
+    def get_award_totals(self) -> Dict:
+        """
+        Get record count, amount totals and distinct entity counts in one query.
+
+        Unlike get_award_stats, each amount is summed over every contract that
+        has it, whether or not the other amount is known.
+
+        Returns:
+            dict: total_awards, total_abc, total_contract_amount,
+                  unique_agencies and unique_awardees
+        """
+        session = self.get_session()
+        try:
+            from sqlalchemy import func
+
+            totals = session.query(
+                func.count(AwardedContract.id).label('total_awards'),
+                func.sum(AwardedContract.approved_budget).label('total_abc'),
+                func.sum(AwardedContract.contract_amount).label('total_contract_amount'),
+                # NULLIF so blank names don't count as an entity
+                func.count(func.distinct(func.nullif(AwardedContract.procuring_entity, ''))).label('unique_agencies'),
+                func.count(func.distinct(func.nullif(AwardedContract.awardee_name, ''))).label('unique_awardees')
+            ).one()
+
+            return {
+                'total_awards': totals.total_awards,
+                'total_abc': float(totals.total_abc) if totals.total_abc else 0,
+                'total_contract_amount': float(totals.total_contract_amount) if totals.total_contract_amount else 0,
+                'unique_agencies': totals.unique_agencies,
+                'unique_awardees': totals.unique_awardees
+            }
+        finally:
+            session.close()
+
     def get_award_stats(self) -> Dict:
         """
         Get statistics about awarded contracts.
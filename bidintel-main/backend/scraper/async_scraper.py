@@ -142,11 +142,8 @@ class AsyncPhilGEPSScraper:
                     page = await self.context.new_page()
                     page.set_default_timeout(settings.BROWSER_TIMEOUT)
 
-                    # Apply stealth to worker page
-                    await self.stealth.apply_stealth(page)
-
                     worker_pages.append(page)
-                    logger.info(f"  Worker {i+1}: {len(work_chunks[i])} bids assigned, stealth applied")
+                    logger.info(f"  Worker {i+1}: {len(work_chunks[i])} bids assigned")
 
             # Step 8: Run workers concurrently using asyncio.gather
             logger.info(f"Starting async scraping with {self.num_workers} concurrent workers...")
@@ -334,7 +331,7 @@ class AsyncPhilGEPSScraper:
 
                     # Parse document links from modal
                     html = await page.content()
-                    parser = PhilGEPSParser(html)
+                    parser = PhilGEPSParser.for_documents(html)
                     return parser.parse_document_links()
 
             except Exception as e:
@@ -383,9 +380,9 @@ class AsyncPhilGEPSScraper:
                 else:
                     self.main_page = await self.context.new_page()
 
-                # Apply stealth JavaScript injections to main page
-                await self.stealth.apply_stealth(self.main_page)
-                logger.info("✓ Stealth measures applied to main page")
+                # Apply stealth JavaScript injections to every page in the context
+                await self.stealth.apply_stealth_context(self.context)
+                logger.info("✓ Stealth measures applied to browser context")
             else:
                 logger.info("Using temporary browser profile with stealth")
 
@@ -399,9 +396,9 @@ class AsyncPhilGEPSScraper:
                 self.context = await self.browser.new_context(**context_options)
                 self.main_page = await self.context.new_page()
 
-                # Apply stealth JavaScript injections to main page
-                await self.stealth.apply_stealth(self.main_page)
-                logger.info("✓ Stealth measures applied to main page")
+                # Apply stealth JavaScript injections to every page in the context
+                await self.stealth.apply_stealth_context(self.context)
+                logger.info("✓ Stealth measures applied to browser context")
 
             self.main_page.set_default_timeout(settings.BROWSER_TIMEOUT)
             logger.info("Async browser initialized successfully")
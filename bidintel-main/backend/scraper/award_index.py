@@ -0,0 +1,111 @@
+"""Award index helpers shared by the award scraping scripts."""
+
+from typing import Dict, List, Union
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page, Route, TimeoutError as PlaywrightTimeoutError
+from lxml import etree, html as lxml_html
+from scraper.browser import BLOCKED_RESOURCE_TYPES
+from scraper.parser import AwardRecord, PhilGEPSParser
+from utils.logger import logger
+
+# Third-party trackers aborted alongside BLOCKED_RESOURCE_TYPES
+BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'facebook.net')
+
+# Index and detail pages are server-rendered and end with a <footer>: once it
+# is in the DOM, every row and field above it has been parsed
+CONTENT_END_SELECTOR = 'footer'
+
+# Award index rows and the cells extract_awards reads from each
+_XP_AWARD_ROWS = etree.XPath("//tbody//tr")
+_XP_ROW_AWARD_LINK = etree.XPath("./td[1]//a[1]")
+_XP_ROW_TITLE_CELL = etree.XPath("./td[2]")
+
+
+def stripped_text(element) -> str:
+    """Join an element's stripped text pieces (BeautifulSoup's get_text(strip=True))."""
+    # Award links and title cells rarely have child tags; then .text is all of it
+    if not len(element):
+        return (element.text or '').strip()
+    return ''.join(piece.strip() for piece in element.itertext())
+
+
+def parse_award_page(html: str) -> AwardRecord:
+    """Parse an award detail page (run via asyncio.to_thread, off the event loop)."""
+    return PhilGEPSParser(html).parse_awarded_contract()
+
+
+async def route_handler(route: Route):
+    """Abort asset and tracker requests; let everything else through."""
+    request = route.request
+    host = urlsplit(request.url).hostname or ''
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or host.endswith(BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def goto(page: Page, url: str, timeout: int = 30000):
+    """
+    Navigate to a URL and return as soon as its content is parsed.
+
+    Args:
+        page: Page to navigate
+        url: URL to load
+        timeout: Navigation timeout in milliseconds
+    """
+    await page.goto(url, wait_until='commit', timeout=timeout)
+    try:
+        await page.wait_for_selector(CONTENT_END_SELECTOR, state='attached', timeout=10000)
+    except PlaywrightTimeoutError:
+        logger.debug(f"No {CONTENT_END_SELECTOR} on {url}, waiting for DOMContentLoaded")
+        await page.wait_for_load_state('domcontentloaded')
+
+
+def extract_awards(html: Union[str, bytes]) -> List[Dict]:
+    """
+    Extract the award list from an index page.
+
+    Args:
+        html: Index page HTML (str, or raw bytes from the response)
+
+    Returns:
+        List of dicts with award_notice_number, url and title
+    """
+    tree = lxml_html.fromstring(html)
+    awards = []
+
+    for row in _XP_AWARD_ROWS(tree):
+        try:
+            # Extract award notice number and URL
+            award_links = _XP_ROW_AWARD_LINK(row)
+            if not award_links:
+                continue
+            award_link = award_links[0]
+
+            award_notice_number = stripped_text(award_link)
+            href = award_link.get('href', '')
+
+            # Handle both relative and absolute URLs
+            if href.startswith('http'):
+                award_url = href
+            elif href.startswith('/'):
+                award_url = "https://philgeps.gov.ph" + href
+            else:
+                award_url = "https://philgeps.gov.ph/" + href
+
+            # Extract title
+            title_cells = _XP_ROW_TITLE_CELL(row)
+            title = stripped_text(title_cells[0]) if title_cells else None
+
+            awards.append({
+                'award_notice_number': award_notice_number,
+                'url': award_url,
+                'title': title
+            })
+
+        except Exception as e:
+            logger.error(f"Error parsing award row: {str(e)}")
+            continue
+
+    return awards
@@ -25,15 +25,22 @@ import time
 import re
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 from config.settings import settings
 from utils.logger import logger
 from models.database import Database
-from scraper.parser import PhilGEPSParser
+from scraper.parser import AwardRecord, PhilGEPSParser
 from scraper.stealth import PlaywrightStealth, HumanBehavior
 
+# Paginator text on the award index: "Page 1 of 250"
+_TOTAL_PAGES_RE = re.compile(r'Page\s+\d+\s+of\s+(\d+)')
+
+# Only build the parts of the award index page each reader looks at
+_AWARD_ROWS_STRAINER = SoupStrainer('tbody')
+_PAGINATOR_STRAINER = SoupStrainer('div', class_='paginator')
+
 
 class AwardedContractsScraper:
     """
@@ -160,11 +167,8 @@ class AwardedContractsScraper:
                     page = await self.context.new_page()
                     page.set_default_timeout(settings.BROWSER_TIMEOUT)
 
-                    # Apply stealth to worker page
-                    await self.stealth.apply_stealth(page)
-
                     worker_pages.append(page)
-                    logger.info(f"  Worker {i+1}: {len(work_chunks[i])} awards assigned, stealth applied")
+                    logger.info(f"  Worker {i+1}: {len(work_chunks[i])} awards assigned")
 
             # Step 7: Run workers concurrently
             logger.info(f"Starting awarded contracts scraping with {self.num_workers} concurrent workers...")
@@ -256,7 +260,7 @@ class AwardedContractsScraper:
 
                 if award_data:
                     # Validate that we have an award notice number before saving
-                    if not award_data.get('award_notice_number'):
+                    if not award_data.award_notice_number:
                         logger.warning(f"[Worker {worker_id+1}] ({idx}/{len(award_list)}) ⚠️  Skipping award {award_summary['award_notice_number']}: Parser returned NULL award_notice_number (likely old/incompatible HTML structure)")
                         result['errors'] += 1
                     else:
@@ -265,7 +269,7 @@ class AwardedContractsScraper:
 
                         result['new_records'] += 1
                         result['scraped'] += 1
-                        logger.info(f"[Worker {worker_id+1}] ({idx}/{len(award_list)}) ✅ Saved: Award #{award_data['award_notice_number']} - {award_data.get('awardee_name', 'N/A')}")
+                        logger.info(f"[Worker {worker_id+1}] ({idx}/{len(award_list)}) ✅ Saved: Award #{award_data.award_notice_number} - {award_data.awardee_name or 'N/A'}")
 
                 # Rate limiting - human-like random delay
                 delay = HumanBehavior.random_delay(
@@ -283,7 +287,7 @@ class AwardedContractsScraper:
         logger.info(f"[Worker {worker_id+1}] Completed: {result['scraped']} scraped, {result['errors']} errors")
         return result
 
-    async def _scrape_award_details(self, page: Page, url: str) -> Optional[Dict]:
+    async def _scrape_award_details(self, page: Page, url: str) -> Optional[AwardRecord]:
         """
         Scrape full details from an awarded contract page.
 
@@ -292,7 +296,7 @@ class AwardedContractsScraper:
             url: Full URL of the awarded contract detail page
 
         Returns:
-            dict: Awarded contract data or None if failed
+            AwardRecord: Awarded contract data or None if failed
         """
         try:
             # Navigate to award detail page
@@ -309,10 +313,10 @@ class AwardedContractsScraper:
             award_data = parser.parse_awarded_contract()
 
             # Add source URL
-            award_data['url'] = url
+            award_data.url = url
 
             # Note: Document scraping not implemented yet for awarded contracts
-            award_data['documents'] = []
+            award_data.documents = []
 
             return award_data
 
@@ -358,8 +362,8 @@ class AwardedContractsScraper:
                     self.main_page = await self.context.new_page()
 
                 # Apply stealth JavaScript injections
-                await self.stealth.apply_stealth(self.main_page)
-                logger.info("✓ Stealth measures applied to main page")
+                await self.stealth.apply_stealth_context(self.context)
+                logger.info("✓ Stealth measures applied to browser context")
             else:
                 logger.info("Using temporary browser profile with stealth")
 
@@ -374,8 +378,8 @@ class AwardedContractsScraper:
                 self.main_page = await self.context.new_page()
 
                 # Apply stealth JavaScript injections
-                await self.stealth.apply_stealth(self.main_page)
-                logger.info("✓ Stealth measures applied to main page")
+                await self.stealth.apply_stealth_context(self.context)
+                logger.info("✓ Stealth measures applied to browser context")
 
             self.main_page.set_default_timeout(settings.BROWSER_TIMEOUT)
             logger.info("Async browser initialized successfully")
@@ -426,7 +430,7 @@ class AwardedContractsScraper:
         """Extract awarded contracts list from current page."""
         try:
             html = await self.main_page.content()
-            soup = BeautifulSoup(html, 'lxml')
+            soup = BeautifulSoup(html, 'lxml', parse_only=_AWARD_ROWS_STRAINER)
 
             awards = []
             rows = soup.select('tbody tr')
@@ -490,14 +494,14 @@ class AwardedContractsScraper:
         """Extract total number of pages from pagination info."""
         try:
             html = await self.main_page.content()
-            soup = BeautifulSoup(html, 'lxml')
+            soup = BeautifulSoup(html, 'lxml', parse_only=_PAGINATOR_STRAINER)
 
             paginator = soup.find('div', class_='paginator')
             if paginator:
                 page_info = paginator.find('p')
                 if page_info:
                     text = page_info.get_text(strip=True)
-                    match = re.search(r'Page\s+\d+\s+of\s+(\d+)', text)
+                    match = _TOTAL_PAGES_RE.search(text)
                     if match:
                         return int(match.group(1))
 
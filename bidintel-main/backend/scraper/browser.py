@@ -5,6 +5,10 @@ from config.settings import settings
 from utils.logger import logger
 from typing import Optional
 
+# Resource types aborted when settings.BLOCK_SUBRESOURCES is on. Scripts are
+# kept: the document preview modal is opened by JavaScript
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
 
 class BrowserHandler:
     """Manages browser automation with Playwright."""
@@ -127,6 +131,26 @@ class BrowserHandler:
         logger.info("Browser initialized successfully with temporary profile")
         return self.page
 
+    def block_subresources(self) -> None:
+        """
+        Abort image, font, media and stylesheet requests in this context.
+
+        Call after login: the reCAPTCHA widget needs its images and styles.
+        """
+        if not self.context:
+            raise RuntimeError("Browser not initialized. Call init_browser() first.")
+
+        self.context.route("**/*", self._route_handler)
+        logger.debug(f"Blocking subresources: {sorted(BLOCKED_RESOURCE_TYPES)}")
+
+    @staticmethod
+    def _route_handler(route):
+        """Abort requests for resources the scraper never reads."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
     def navigate(self, url: str, wait_until: str = "networkidle") -> Page:
         """
         Navigate to a URL.
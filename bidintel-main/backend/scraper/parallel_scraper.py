@@ -308,7 +308,7 @@ class ParallelPhilGEPSScraper:
 
                     # Parse document links from modal
                     html = page.content()
-                    parser = PhilGEPSParser(html)
+                    parser = PhilGEPSParser.for_documents(html)
                     return parser.parse_document_links()
 
             except Exception as e:
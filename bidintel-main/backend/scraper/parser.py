@@ -3,38 +3,744 @@
 Updated to match ACTUAL PhilGEPS HTML structure based on real pages.
 """
 
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from functools import lru_cache, partial
+from io import BytesIO
+from lxml import etree
+from lxml import html as lxml_html
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+from threading import Lock
+from urllib.parse import urljoin
 from utils.logger import logger
+import hashlib
+import os
 import re
 
 
+PHILGEPS_BASE_URL = 'https://philgeps.gov.ph/'
+
+_UTC = timezone.utc
+_now = datetime.now
+
+# Page kinds a parser can be created for (see the for_* factories)
+PARSE_MODES = ('detail', 'list', 'documents')
+
+
+def _xp_icontains(expr: str, needle: str) -> str:
+    """
+    XPath 1.0 test for an ASCII case-insensitive substring.
+
+    Uses translate() so the whole test runs inside libxml2; EXSLT re:test
+    calls back into Python for every node it checks.
+    """
+    return (
+        f"contains(translate({expr}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        f"'abcdefghijklmnopqrstuvwxyz'), '{needle.lower()}')"
+    )
+
+
+# Compiled XPath queries for the hot detail-page extractors (run on self.tree)
+# First <center> carrying the class token $cls (bs4's class_= semantics)
+_XP_CENTER_BY_CLASS = etree.XPath(
+    "(//center[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $cls, ' '))])[1]"
+)
+# Next <label> with class token $cls, in document order (bs4's find_next)
+_XP_NEXT_LABEL_BY_CLASS = etree.XPath(
+    "(descendant::label[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $cls, ' '))]"
+    " | following::label[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $cls, ' '))])[1]"
+)
+# Whether a label sits in the awardee block; string() concatenates the
+# parent's text inside libxml2 rather than building it in Python
+_XP_IN_AWARDEE_SECTION = etree.XPath(
+    "contains(string(..), 'Awardee') or contains(string(..), 'Corporate Title')"
+)
+_XP_LIST_ROWS = etree.XPath('//tbody//tr')
+_XP_LIST_CELLS = etree.XPath('.//td[@data-label]')
+_XP_LIST_REF_LINK = etree.XPath("(.//td[@data-label='Bid Notice Reference Number'])[1]//a")
+# Description body: the wrapped div inside the cell holding the first
+# "Description:" text
+_XP_DESCRIPTION_DIV = etree.XPath(
+    "((//text()[contains(., 'Description:')])[1]/ancestor::td[1]"
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' wrapped-long-string1 ')])[1]"
+)
+# Links whose href mentions '.pdf' in any case - every document-link
+# strategy picks from these
+_XP_PDF_LINKS = etree.XPath(
+    "//a[contains(translate(@href, 'PDF', 'pdf'), '.pdf')]"
+)
+_XP_HREF_LINKS = etree.XPath('//a[@href]')
+# Text nodes that can hold a contact address (bs4's get_text skips these containers)
+_XP_EMAIL_TEXT = etree.XPath(
+    "//text()[contains(., '@')][not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+# The first "Downloaded:" text node and the few text nodes after it (the
+# count may sit in a following <b>/<span> or after a <br>)
+_XP_DOWNLOAD_TEXT = etree.XPath(
+    f"(//text()[{_xp_icontains('.', 'Downloaded:')}])[1]"
+    f" | (//text()[{_xp_icontains('.', 'Downloaded:')}])[1]/following::text()[position() <= 3]"
+)
+_XP_LINE_ITEM_ROWS = etree.XPath(
+    f"(//text()[{_xp_icontains('.', 'Line Item Details')}])[1]/following::table[1]//tr"
+)
+# Item No., UNSPSC, Lot Name, Lot Description, Quantity, UOM
+_LINE_ITEM_COLUMNS = 6
+_XP_LINE_ITEM_CELLS = etree.XPath(f'(.//td)[position() <= {_LINE_ITEM_COLUMNS}]')
+
+# Detail-page label patterns, keyed by field. Every <label> on the page is
+# lowercased once and classified against all of them in one regex pass (see
+# label_index), so the patterns are lowercase and need no IGNORECASE.
+_LABEL_PATTERNS = (
+    ('reference_number', r'notice reference number'),
+    ('client_agency', r'client agency:'),
+    ('classification', r'classification:'),
+    ('category', r'business category:'),
+    ('budget', r'approved budget'),
+    ('status', r'status\s*:'),
+    ('publish_date', r'published date:'),
+    ('closing_date', r'closing date:'),
+    ('contact_person', r'contact person:'),
+    ('delivery_period', r'delivery period:'),
+    ('control_number', r'control number:'),
+    ('bid_form_fee', r'bid.*form.*fee:'),
+    ('procurement_mode', r'mode\s*of\s*procurement'),
+    ('procurement_mode_alt', r'procurement\s*mode'),
+    ('procurement_rules', r'applicable.*procurement.*rules'),
+    ('lot_type', r'lot type:'),
+    ('date_last_updated', r'date last updated:'),
+    ('bid_validity_period', r'bid.*validity.*period:'),
+    ('date_created', r'date created:'),
+    ('delivery_location', r'delivery.*location:|project.*location:'),
+    ('address', r'address:'),
+    ('created_by', r'created by:'),
+    ('funding_source', r'funding source:'),
+)
+_LABEL_DISPATCH = re.compile(
+    '|'.join(f'(?P<{field}>{pattern})' for field, pattern in _LABEL_PATTERNS)
+)
+
+_WS_RE = re.compile(r'\s+')
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Longest local part (before the @) an address can have, per RFC 5321
+_EMAIL_LOCAL_MAX = 64
+_PDF_HREF_RE = re.compile(r'\.pdf$', re.IGNORECASE)
+_PORTAL_PDF_HREF_RE = re.compile(r'portal_documents.*\.pdf', re.IGNORECASE)
+_PDF_MARKER_RE = re.compile(rb'\.pdf', re.IGNORECASE)
+_REFERENCE_NUMBER_RE = re.compile(r':(\d+)')
+_DIGITS_RE = re.compile(r'(\d+)')
+_DOWNLOAD_COUNT_RE = re.compile(r'Downloaded:\s*(\d+)', re.IGNORECASE)
+# Raw-HTML fast paths (run on the UTF-8 page bytes), tried before touching
+# the tree. They only cover the plain-text forms; anything else falls
+# through to the DOM extractors.
+_REFERENCE_LABEL_RAW_RE = re.compile(rb'<label\b[^>]*>([^<]*notice reference number[^<]*)<', re.IGNORECASE)
+_DOWNLOAD_MARKER_RE = re.compile(rb'downloaded', re.IGNORECASE)
+_DOWNLOAD_COUNT_RAW_RE = re.compile(rb'Downloaded:\s*(\d+)', re.IGNORECASE)
+
+# Award notice page labels: field -> pattern searched for in the label's
+# lowercased sole string. A label may name several fields.
+_AWARD_LABEL_PATTERNS = (
+    ('award_notice_number', r'award notice number'),
+    ('reference_number', r'notice reference number'),
+    ('award_type', r'award type'),
+    ('award_date', r'award date'),
+    ('awardee', r'awardee\s*:'),
+    ('address', r'address\s*:'),
+    ('awardee_contact', r'awardee contact person'),
+    ('corporate_title', r'corporate title'),
+    ('contract_amount', r'contract amount'),
+    ('contract_number', r'contract no'),
+    ('contract_effectivity_date', r'contract effectivity date'),
+    ('contract_end_date', r'contract end date'),
+    ('period_of_contract', r'period of contract'),
+    ('proceed_date', r'proceed date'),
+)
+# No two patterns can start at the same offset, so a zero-width scan of one
+# alternation reports every field a label names
+_AWARD_LABEL_DISPATCH = re.compile(
+    '(?=' + '|'.join(f'(?P<{field}>{pattern})' for field, pattern in _AWARD_LABEL_PATTERNS) + ')'
+)
+_VIEW_DOCUMENT_RE = re.compile(r'View Document', re.I)
+_DOCUMENT_HREF_RE = re.compile(r'\.pdf|document|download', re.I)
+
+# Document type keywords, highest priority first
+_DOCUMENT_TYPES = (
+    ('Bid Notice', ('bid_notice', 'notice')),
+    ('Technical Specifications', ('technical', 'specs')),
+    ('Terms of Reference', ('terms', 'tor')),
+    ('Bill of Quantities', ('bill', 'boq')),
+    ('Drawings/Plans', ('drawing', 'plan')),
+    ('Supplement/Amendment', ('supplement', 'amendment')),
+)
+_DOCUMENT_TYPE_BY_KEYWORD = {
+    keyword: (priority, doc_type)
+    for priority, (doc_type, keywords) in enumerate(_DOCUMENT_TYPES)
+    for keyword in keywords
+}
+# Zero-width lookahead so overlapping keywords are all reported in one scan
+_DOCUMENT_TYPE_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in _DOCUMENT_TYPE_BY_KEYWORD) + '))'
+)
+# Siblings a label-value walk steps over, reading only their tail text:
+# <br> plus the non-element nodes (comments etc.), whose .tag is a factory
+_VALUE_SEPARATOR_TAGS = frozenset({'br', etree.Comment, etree.ProcessingInstruction, etree.Entity})
+# Currency formatting PhilGEPS puts around amounts ("PHP 1,375,000.00")
+_AMOUNT_DELETE = str.maketrans('', '', 'PHph\u20b1$, \t\n\r\xa0')
+
+
+# One HTML parser shared by every tree build. Pages are held as UTF-8 bytes
+# (see PhilGEPSParser.__init__), so the encoding is fixed rather than sniffed.
+# Nothing here looks elements up by id, so skip building libxml2's id table.
+# Comments are kept: dropping them would merge the text around them and change
+# what get_text-style joins return.
+_HTML_PARSER = lxml_html.HTMLParser(recover=True, collect_ids=False, encoding='utf-8')
+
+
+def _to_utf8(html: Union[str, bytes]) -> bytes:
+    """Return the page as UTF-8 bytes (bytes are assumed to be UTF-8 already)."""
+    if isinstance(html, bytes):
+        return html
+    return html.encode('utf-8', 'replace')
+
+
+def _build_tree(html: bytes):
+    """Build an lxml tree for the page, falling back to an empty document."""
+    try:
+        return lxml_html.fromstring(html, parser=_HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return lxml_html.fromstring(b'<html></html>', parser=_HTML_PARSER)
+
+
+def _iter_list_rows(html: bytes) -> Iterator:
+    """
+    Stream the <tr> rows under <tbody> without keeping the whole page in memory.
+
+    Each row is yielded once its end tag has been parsed, then cleared along
+    with the rows before it, so only the row being read stays resident.
+    """
+    events = etree.iterparse(
+        BytesIO(html), events=('end',), tag='tr',
+        html=True, encoding='utf-8', collect_ids=False
+    )
+    for _, row in events:
+        ancestors = [ancestor.tag for ancestor in row.iterancestors()]
+        if 'tbody' not in ancestors:
+            continue
+        yield row
+        # Rows nested in another row are freed together with their outer row
+        if 'tr' not in ancestors:
+            row.clear(keep_tail=True)
+            while row.getprevious() is not None:
+                del row.getparent()[0]
+
+
+def _iter_labels(html: bytes) -> Iterator:
+    """
+    Stream the page's <label> elements in document order.
+
+    Parsing only runs as far as the caller reads, and each label is cleared
+    along with the nodes before it once the caller moves on, so stopping at
+    an early label never builds the rest of the page.
+    """
+    events = etree.iterparse(
+        BytesIO(html), events=('end',), tag='label',
+        html=True, encoding='utf-8', collect_ids=False
+    )
+    try:
+        for _, label in events:
+            yield label
+            # Labels nested in another label are freed together with their outer label
+            if next(label.iterancestors('label'), None) is None:
+                label.clear(keep_tail=True)
+                while label.getprevious() is not None:
+                    del label.getparent()[0]
+    except etree.XMLSyntaxError:
+        # Nothing parseable (e.g. an empty page): there are no labels
+        return
+
+
+def _absolute_url(href: str) -> str:
+    """Resolve a (possibly relative) PhilGEPS link against the portal root."""
+    return urljoin(PHILGEPS_BASE_URL, href)
+
+
+def _clean_amount(text: str) -> str:
+    """
+    Keep only the digits and decimal point of an amount string.
+
+    A single str.translate pass handles the usual currency formatting; other
+    stray characters fall back to the regex.
+    """
+    cleaned = text.translate(_AMOUNT_DELETE)
+    if cleaned.replace('.', '').isdigit():
+        return cleaned
+    return _NON_NUMERIC_RE.sub('', text)
+
+
+def _parse_amount(text: str) -> Optional[float]:
+    """Amount string (e.g. 'PHP 750,000.00') as a float, or None if it holds no number."""
+    try:
+        return float(_clean_amount(text))
+    except ValueError:
+        return None
+
+
+def _node_text(node) -> str:
+    """lxml equivalent of BeautifulSoup's ``get_text(strip=True)``."""
+    return ''.join(text.strip() for text in node.itertext())
+
+
+def _sole_string(node) -> Optional[str]:
+    """
+    lxml equivalent of BeautifulSoup's ``Tag.string``.
+
+    Returns the text of a node whose only child is a single string, looking
+    through single-child wrappers (<label><b>X</b></label> -> 'X'), else None.
+    """
+    while True:
+        if len(node) == 0:
+            return node.text
+        if len(node) > 1 or node.text or node[0].tail:
+            return None
+        node = node[0]
+        if not isinstance(node.tag, str):
+            # A lone comment counts as the string in bs4
+            return node.text
+
+
+def _next_sibling_string(node) -> Optional[str]:
+    """lxml equivalent of BeautifulSoup's ``find_next_sibling(string=True)``."""
+    if node.tail:
+        return node.tail
+    for sibling in node.itersiblings():
+        if not isinstance(sibling.tag, str):
+            # Comments are strings to bs4
+            return sibling.text
+        if sibling.tail:
+            return sibling.tail
+    return None
+
+
+def _next_sibling_text(node) -> Optional[str]:
+    """
+    Stripped text of the string after node (see _next_sibling_string).
+
+    Returns None when node is None or the string is missing or blank
+    (str.strip() also drops the &nbsp; padding PhilGEPS puts around values).
+    """
+    if node is None:
+        return None
+    text = _next_sibling_string(node)
+    if text:
+        text = text.strip()
+    return text or None
+
+
+# PhilGEPS date formats, most common first
+_DATE_FORMATS = (
+    '%d-%b-%Y %I:%M %p',  # 13-Nov-2025 12:00 AM
+    '%d-%b-%Y',            # 13-Nov-2025
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+)
+# Cheap shape checks that pick the one format worth handing to strptime
+_DATE_SHAPES = (
+    (re.compile(r'\d{1,2}-[A-Za-z]{3}-\d{4}\s+\d'), '%d-%b-%Y %I:%M %p'),
+    (re.compile(r'\d{1,2}-[A-Za-z]{3}-\d{4}$'), '%d-%b-%Y'),
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}\s+\d'), '%Y-%m-%d %H:%M:%S'),
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}$'), '%Y-%m-%d'),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}$'), '%m/%d/%Y'),
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_string: str) -> Optional[datetime]:
+    """Parse a stripped date string in the known formats; results are memoized."""
+    for shape, fmt in _DATE_SHAPES:
+        if shape.match(date_string):
+            try:
+                return datetime.strptime(date_string, fmt)
+            except ValueError:
+                # Right shape, impossible value (e.g. 31-Feb) - no other
+                # format can accept this string either
+                break
+    else:
+        # Unrecognized shape: fall back to trying every format
+        return _parse_date_any_format(date_string)
+
+    logger.warning(f"Could not parse date: {date_string}")
+    return None
+
+
+def _parse_date_any_format(date_string: str) -> Optional[datetime]:
+    """Try each known format in turn (slow path for unusual date strings)."""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_string, fmt)
+        except ValueError:
+            continue
+
+    logger.warning(f"Could not parse date: {date_string}")
+    return None
+
+
+# Parse results keyed by (parse method, HTML digest), so retries and
+# re-fetches of an unchanged page skip extraction entirely
+PARSE_CACHE_SIZE = 1024
+_parse_cache = OrderedDict()
+_parse_cache_lock = Lock()
+
+
+def _html_digest(html: bytes) -> bytes:
+    """Short content hash used as the parse cache key."""
+    return hashlib.blake2b(html, digest_size=16).digest()
+
+
+# Award fields read straight from the string after their label:
+# (AwardRecord field, award label index field, converter or None)
+_AWARD_VALUE_FIELDS = (
+    # <label>Notice Reference Number:</label><br>6793 <br><br>
+    ('bid_reference_number', 'reference_number', None),
+    # <label>Award Date:</label><br>12-Nov-2025<br><br>
+    ('award_date', 'award_date', _parse_date_cached),
+    # <label>Awardee Contact Person:</label><br>AXELL JAY  CATAPANG<br> <br>
+    ('awardee_contact_person', 'awardee_contact', None),
+    # <label>Corporate Title:</label><br>Proprietor<br> <br>
+    ('awardee_corporate_title', 'corporate_title', None),
+    # <label>Contract Amount:</label><br>PHP 750,000.00<br><br>
+    # (the awarded price, as opposed to the ABC)
+    ('contract_amount', 'contract_amount', _parse_amount),
+    # The contract fields below are often empty: <label>Contract No.:</label><br><br><br>
+    ('contract_number', 'contract_number', None),
+    ('contract_effectivity_date', 'contract_effectivity_date', _parse_date_cached),
+    ('contract_end_date', 'contract_end_date', _parse_date_cached),
+    # <label>Period of Contract :</label><br>30-Day(s)<br><br>
+    ('period_of_contract', 'period_of_contract', None),
+    ('proceed_date', 'proceed_date', _parse_date_cached),
+)
+
+
+class AwardRecord:
+    """
+    One parsed award notice (see PhilGEPSParser.parse_awarded_contract).
+
+    Slots instead of a per-record dict keep large batches of records small
+    in memory. Database.save_awarded_contract(s) take records as they are;
+    use as_dict() where a plain dict is needed. The __init__ parameters
+    follow __slots__ order, so AwardRecord(*values) lines up with it.
+    """
+
+    __slots__ = (
+        # PRIMARY IDENTIFIERS
+        'award_notice_number',
+        'bid_reference_number',
+        'control_number',
+
+        # AWARD INFORMATION
+        'award_title',
+        'award_type',
+        'award_date',
+
+        # AWARDEE (WINNER) INFORMATION
+        'awardee_name',
+        'awardee_address',
+        'awardee_contact_person',
+        'awardee_corporate_title',
+
+        # FINANCIAL INFORMATION
+        'approved_budget',
+        'contract_amount',
+
+        # CONTRACT DETAILS
+        'contract_number',
+        'contract_effectivity_date',
+        'contract_end_date',
+        'period_of_contract',
+        'proceed_date',
+
+        # PROCUREMENT DETAILS
+        'procurement_mode',
+        'classification',
+        'category',
+        'procurement_rules',
+        'funding_source',
+
+        # PROCURING ENTITY
+        'procuring_entity',
+        'agency_address',
+        'delivery_location',
+
+        # TIMELINE
+        'publish_date',
+        'date_created',
+        'date_last_updated',
+
+        # DESCRIPTION / ADDITIONAL
+        'description',
+        'created_by',
+
+        # LINE ITEMS AND DOCUMENTS
+        'line_items',
+        'documents',
+
+        # META
+        'scraped_at',
+        'url',  # Source page, set by the caller
+    )
+
+    def __init__(
+        self,
+        award_notice_number: Optional[str] = None,
+        bid_reference_number: Optional[str] = None,
+        control_number: Optional[str] = None,
+        award_title: Optional[str] = None,
+        award_type: Optional[str] = None,
+        award_date: Optional[datetime] = None,
+        awardee_name: Optional[str] = None,
+        awardee_address: Optional[str] = None,
+        awardee_contact_person: Optional[str] = None,
+        awardee_corporate_title: Optional[str] = None,
+        approved_budget: Optional[float] = None,
+        contract_amount: Optional[float] = None,
+        contract_number: Optional[str] = None,
+        contract_effectivity_date: Optional[datetime] = None,
+        contract_end_date: Optional[datetime] = None,
+        period_of_contract: Optional[str] = None,
+        proceed_date: Optional[datetime] = None,
+        procurement_mode: Optional[str] = None,
+        classification: Optional[str] = None,
+        category: Optional[str] = None,
+        procurement_rules: Optional[str] = None,
+        funding_source: Optional[str] = None,
+        procuring_entity: Optional[str] = None,
+        agency_address: Optional[str] = None,
+        delivery_location: Optional[str] = None,
+        publish_date: Optional[datetime] = None,
+        date_created: Optional[datetime] = None,
+        date_last_updated: Optional[datetime] = None,
+        description: Optional[str] = None,
+        created_by: Optional[str] = None,
+        line_items: Optional[List[Dict]] = None,
+        documents: Optional[List[Dict]] = None,
+        scraped_at: Optional[datetime] = None,
+        url: Optional[str] = None,
+    ):
+        self.award_notice_number = award_notice_number
+        self.bid_reference_number = bid_reference_number
+        self.control_number = control_number
+        self.award_title = award_title
+        self.award_type = award_type
+        self.award_date = award_date
+        self.awardee_name = awardee_name
+        self.awardee_address = awardee_address
+        self.awardee_contact_person = awardee_contact_person
+        self.awardee_corporate_title = awardee_corporate_title
+        self.approved_budget = approved_budget
+        self.contract_amount = contract_amount
+        self.contract_number = contract_number
+        self.contract_effectivity_date = contract_effectivity_date
+        self.contract_end_date = contract_end_date
+        self.period_of_contract = period_of_contract
+        self.proceed_date = proceed_date
+        self.procurement_mode = procurement_mode
+        self.classification = classification
+        self.category = category
+        self.procurement_rules = procurement_rules
+        self.funding_source = funding_source
+        self.procuring_entity = procuring_entity
+        self.agency_address = agency_address
+        self.delivery_location = delivery_location
+        self.publish_date = publish_date
+        self.date_created = date_created
+        self.date_last_updated = date_last_updated
+        self.description = description
+        self.created_by = created_by
+        self.line_items = [] if line_items is None else line_items
+        self.documents = [] if documents is None else documents
+        self.scraped_at = scraped_at
+        self.url = url
+
+    def as_dict(self) -> Dict:
+        """Field name -> value as a plain dict (values are not copied)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _copy_result(value):
+    """
+    Copy a parse result's dicts, lists and records; leaves are immutable.
+
+    Parse results only hold str, numbers, datetimes and None inside nested
+    dicts/lists, so this is a full copy without deepcopy's memo bookkeeping.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    if isinstance(value, AwardRecord):
+        return AwardRecord(*[_copy_result(getattr(value, name)) for name in AwardRecord.__slots__])
+    return value
+
+
+def _parse_cache_get(key):
+    """Return a private copy of a cached parse result, or None."""
+    with _parse_cache_lock:
+        result = _parse_cache.get(key)
+        if result is None:
+            return None
+        _parse_cache.move_to_end(key)
+    return _copy_result(result)
+
+
+def _parse_cache_put(key, result) -> None:
+    """Store a copy of a parse result, evicting the least recently used."""
+    result = _copy_result(result)
+    with _parse_cache_lock:
+        _parse_cache[key] = result
+        _parse_cache.move_to_end(key)
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+
 class PhilGEPSParser:
     """Parses PhilGEPS HTML pages to extract structured data."""
 
-    def __init__(self, html: str):
+    def __init__(self, html: Union[str, bytes], parse_mode: str = 'detail'):
         """
         Initialize parser with HTML content.
 
+        Nothing is parsed here: the lxml tree is built on first access, so a
+        parse answered from the cache (or a raw-HTML fast path) never builds it.
+
+        Args:
+            html: HTML content to parse; bytes (e.g. an HTTP response body)
+                must be UTF-8 and are used without re-encoding
+            parse_mode: 'detail', 'list' or 'documents' - the kind of page
+                being parsed
+        """
+        if parse_mode not in PARSE_MODES:
+            raise ValueError(f"Unknown parse mode: {parse_mode}")
+
+        self.parse_mode = parse_mode
+        self._html = _to_utf8(html)
+        self._html_hash = _html_digest(self._html)
+        self._tree = None
+        self._label_index = None
+        self._label_values = {}
+        self._award_label_index = None
+        self._memo = {}
+
+    @property
+    def tree(self):
+        """lxml tree every extractor reads from, built on first access."""
+        if self._tree is None:
+            self._tree = _build_tree(self._html)
+        return self._tree
+
+    @property
+    def label_index(self) -> Dict:
+        """
+        Map of field -> first <label> element for that field (see _LABEL_PATTERNS).
+
+        Built on first access with a single walk over the page's labels and
+        one regex match per label, instead of one full-tree search per field.
+        """
+        if self._label_index is None:
+            self._label_index = self._build_label_index()
+        return self._label_index
+
+    def _build_label_index(self) -> Dict:
+        """
+        Walk the page's <label> elements once and key each by the field it names.
+
+        Returns:
+            dict: field name -> first matching <label> element
+        """
+        index = {}
+        for label in self.tree.iter('label'):
+            # Labels are almost always a single text node: read it directly
+            # rather than through text_content()'s XPath string() call
+            text = label.text_content() if len(label) else label.text
+            if not text:
+                continue
+            match = _LABEL_DISPATCH.search(text.lower())
+            if match and match.lastgroup not in index:
+                index[match.lastgroup] = label
+        logger.debug(f"Indexed {len(index)} detail-page labels")
+        return index
+
+    @classmethod
+    def for_list(cls, html: Union[str, bytes]) -> 'PhilGEPSParser':
+        """Create a parser for a bid listing page (rows are streamed, no tree is kept)."""
+        return cls(html, parse_mode='list')
+
+    @classmethod
+    def for_detail(cls, html: Union[str, bytes]) -> 'PhilGEPSParser':
+        """Create a parser for a bid notice or award notice detail page."""
+        return cls(html, parse_mode='detail')
+
+    @classmethod
+    def for_documents(cls, html: Union[str, bytes]) -> 'PhilGEPSParser':
+        """Create a parser for a document preview page."""
+        return cls(html, parse_mode='documents')
+
+    @classmethod
+    def parse_many_bid_notices(cls, html_pages: Iterable[str], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Parse many bid notice detail pages across worker processes.
+
+        Args:
+            html_pages: Detail page HTML strings
+            max_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            list: Parsed bid notices, in input order
+        """
+        return parse_detail_pages(html_pages, max_workers=max_workers)
+
+    @classmethod
+    def parse_many_awarded_contracts(cls, html_pages: Iterable[str],
+                                     max_workers: Optional[int] = None) -> List[AwardRecord]:
+        """
+        Parse many award notice detail pages across worker processes.
+
         Args:
-            html: HTML content to parse
+            html_pages: Award detail page HTML strings
+            max_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            list: Parsed awarded contracts, in input order
         """
-        self.soup = BeautifulSoup(html, 'lxml')
+        return parse_award_pages(html_pages, max_workers=max_workers)
 
-    def parse_bid_notice(self) -> Dict:
+    def parse_bid_notice(self, scraped_at: Optional[datetime] = None) -> Dict:
         """
         Parse a bid notice detail page.
 
         Returns all 35+ fields from BID_DATA_FIELDS.md
         Based on actual PhilGEPS structure from /tenders/viewBidNotice/{id}
 
+        Args:
+            scraped_at: Timestamp to record (lets a batch share one value);
+                defaults to now in UTC
+
         Returns:
             dict: Extracted bid notice data
         """
+        cache_key = ('bid_notice', self._html_hash)
+        cached = _parse_cache_get(cache_key)
+        if cached is not None:
+            cached['scraped_at'] = scraped_at or _now(_UTC)
+            logger.debug(f"Parsed bid notice: {cached.get('reference_number')} (cached)")
+            return cached
+
         try:
             logger.debug("Parsing bid notice (using BID_DATA_FIELDS.md)")
 
+            # One pass over the labels serves every label-based extractor below
+            self.label_index
+
             data = {
                 # CRITICAL FIELDS
                 'reference_number': self._extract_reference_number(),  # Field #1
@@ -77,9 +783,10 @@ class PhilGEPSParser:
                 'download_count': self._extract_download_count(),  # Field #35
 
                 # META
-                'scraped_at': datetime.now(timezone.utc)
+                'scraped_at': scraped_at or _now(_UTC)
             }
 
+            _parse_cache_put(cache_key, data)
             logger.debug(f"Parsed bid notice: {data.get('reference_number')} (ALL FIELDS)")
             return data
 
@@ -96,64 +803,65 @@ class PhilGEPSParser:
         Returns:
             list: List of bid notice summaries with URLs
         """
+        cache_key = ('bid_list', self._html_hash)
+        cached = _parse_cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Parsed {len(cached)} bid notices from list (cached)")
+            return cached
+
         try:
             logger.debug("Parsing bid list page...")
 
             bids = []
 
-            # Find all table rows - PhilGEPS uses td with data-label attributes
-            rows = self.soup.select('tbody tr')
+            # Find all table rows - PhilGEPS uses td with data-label attributes.
+            # Stream them straight from the HTML unless a tree already exists.
+            if self._tree is not None:
+                rows = _XP_LIST_ROWS(self._tree)
+            else:
+                rows = _iter_list_rows(self._html)
 
+            # Row fields are read defensively (missing cells become None and
+            # _parse_date never raises), so rows need no try/except of their own
             for row in rows:
-                try:
-                    # Extract reference number and URL
-                    ref_cell = row.find('td', {'data-label': 'Bid Notice Reference Number'})
-                    if not ref_cell:
-                        continue
-
-                    ref_link = ref_cell.find('a')
-                    if not ref_link:
-                        continue
-
-                    reference_number = ref_link.get_text(strip=True)
-                    url = ref_link.get('href', '')
-
-                    # Extract other fields using data-label
-                    title_cell = row.find('td', {'data-label': 'Notice Title'})
-                    title = title_cell.get_text(strip=True) if title_cell else None
-
-                    class_cell = row.find('td', {'data-label': 'Classification'})
-                    classification = class_cell.get_text(strip=True) if class_cell else None
-
-                    agency_cell = row.find('td', {'data-label': 'Agency Name'})
-                    procuring_entity = agency_cell.get_text(strip=True) if agency_cell else None
-
-                    pub_date_cell = row.find('td', {'data-label': 'Publish Date'})
-                    publish_date_str = pub_date_cell.get_text(strip=True) if pub_date_cell else None
-
-                    # PhilGEPS uses "Due Date" for closing date in listing
-                    closing_cell = row.find('td', {'data-label': 'Due Date'})
-                    closing_date_str = closing_cell.get_text(strip=True) if closing_cell else None
-
-                    status_cell = row.find('td', {'data-label': 'Status'})
-                    status = status_cell.get_text(strip=True) if status_cell else None
-
-                    bid = {
-                        'reference_number': reference_number,
-                        'title': title,
-                        'classification': classification,
-                        'procuring_entity': procuring_entity,
-                        'publish_date': self._parse_date(publish_date_str),
-                        'closing_date': self._parse_date(closing_date_str),
-                        'status': status,
-                        'url': url
-                    }
-                    bids.append(bid)
-
-                except Exception as e:
-                    logger.warning(f"Error parsing bid row: {str(e)}")
+                # Rows without a reference link are headers/spacers
+                ref_links = _XP_LIST_REF_LINK(row)
+                if not ref_links:
                     continue
+                ref_link = ref_links[0]
+
+                # Index the row's cells by data-label once instead of
+                # scanning the row again for every field
+                cells = {}
+                for td in _XP_LIST_CELLS(row):
+                    cells.setdefault(td.get('data-label'), td)
+
+                reference_number = _node_text(ref_link)
+                url = ref_link.get('href', '')
+
+                # Extract other fields using data-label
+                title = self._cell_text(cells, 'Notice Title')
+                classification = self._cell_text(cells, 'Classification')
+                procuring_entity = self._cell_text(cells, 'Agency Name')
+                publish_date_str = self._cell_text(cells, 'Publish Date')
+
+                # PhilGEPS uses "Due Date" for closing date in listing
+                closing_date_str = self._cell_text(cells, 'Due Date')
+                status = self._cell_text(cells, 'Status')
+
+                bid = {
+                    'reference_number': reference_number,
+                    'title': title,
+                    'classification': classification,
+                    'procuring_entity': procuring_entity,
+                    'publish_date': self._parse_date(publish_date_str),
+                    'closing_date': self._parse_date(closing_date_str),
+                    'status': status,
+                    'url': url
+                }
+                bids.append(bid)
 
+            _parse_cache_put(cache_key, bids)
             logger.info(f"Parsed {len(bids)} bid notices from list")
             return bids
 
@@ -161,145 +869,171 @@ class PhilGEPSParser:
             logger.error(f"Error parsing bid list: {str(e)}")
             return []
 
+    @staticmethod
+    def _cell_text(cells: Dict, data_label: str) -> Optional[str]:
+        """Return the stripped text of a list-page cell, or None if the row lacks it."""
+        cell = cells.get(data_label)
+        return _node_text(cell) if cell is not None else None
+
     # Helper methods for extracting specific fields from detail page
 
     def _extract_reference_number(self) -> Optional[str]:
         """Extract bid reference number from detail page."""
         # Pattern: <label>Notice Reference Number :7297</label>
-        label = self.soup.find('label', string=re.compile(r'Notice Reference Number'))
-        if label:
-            text = label.get_text(strip=True)
+        if self._label_index is None:
+            # Standalone lookup: read the label straight from the HTML
+            # instead of building the tree and label index for one field
+            raw = _REFERENCE_LABEL_RAW_RE.search(self._html)
+            label_text = raw.group(1).decode('utf-8', 'replace').strip() if raw else ''
+            match = _REFERENCE_NUMBER_RE.search(label_text)
+            if match:
+                return match.group(1)
+
+        label = self.label_index.get('reference_number')
+        if label is not None:
+            text = _node_text(label)
             # Extract number after colon
-            match = re.search(r':(\d+)', text)
+            match = _REFERENCE_NUMBER_RE.search(text)
             if match:
                 return match.group(1)
         return None
 
+    def _memoized(self, key, compute: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Return compute()'s result, computing it at most once per parser.
+
+        For tree reads shared by parse_bid_notice and parse_awarded_contract,
+        so a parser used for both walks the tree for them only once. Only
+        immutable results belong here, as callers receive the same object.
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
     def _extract_title(self) -> Optional[str]:
         """Extract bid title from detail page."""
+        return self._memoized('title', self._read_title)
+
+    def _read_title(self) -> Optional[str]:
+        """Read the title from the tree (see _extract_title)."""
         # PhilGEPS puts title in a bold center tag
         # Pattern: <b>Purchase of Meals...</b> inside a center tag with class verdhana_fourteenpx
-        center = self.soup.find('center', class_='verdhana_fourteenpx')
-        if center:
-            bold_tag = center.find('b')
-            if bold_tag:
-                return bold_tag.get_text(strip=True)
+        centers = _XP_CENTER_BY_CLASS(self.tree, cls='verdhana_fourteenpx')
+        if centers:
+            bold_tag = centers[0].find('.//b')
+            if bold_tag is not None:
+                return _node_text(bold_tag)
         return None
 
+    def _center_text(self, css_class: str) -> Optional[str]:
+        """Stripped text of the first <center> with the given class, or None."""
+        def read() -> Optional[str]:
+            centers = _XP_CENTER_BY_CLASS(self.tree, cls=css_class)
+            return _node_text(centers[0]) if centers else None
+
+        return self._memoized(('center', css_class), read)
+
     def _extract_procuring_entity(self) -> Optional[str]:
         """Extract procuring entity name from detail page."""
         # Try Method 1: <center class="verdhana_bold_twelvepx">DUTY FREE PHILIPPINES CORPORATION</center>
-        center = self.soup.find('center', class_='verdhana_bold_twelvepx')
-        if center:
-            text = center.get_text(strip=True)
-            if text:
-                return text
+        text = self._center_text('verdhana_bold_twelvepx')
+        if text:
+            return text
 
         # Try Method 2: <label>Client Agency: </label><br>CITY GOVERNMENT OF BACOOR
-        label = self.soup.find('label', string=re.compile(r'Client Agency:'))
-        if label:
-            # Get next sibling text after <br>
-            next_text = self._get_text_after_label(label)
-            if next_text:
-                return next_text.strip()
+        # Get next sibling text after <br>
+        next_text = self._label_value('client_agency')
+        if next_text:
+            return next_text.strip()
 
         return None
 
     def _extract_classification(self) -> Optional[str]:
         """Extract classification (Goods/Services/Infrastructure) from detail page."""
         # Pattern: <label>Classification: </label><br>Goods<br><br>
-        label = self.soup.find('label', string=re.compile(r'Classification:'))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('classification')
 
     def _extract_category(self) -> Optional[str]:
         """Extract business category from detail page."""
         # Pattern: <label>Business Category: </label><br>Restaurants and catering
-        label = self.soup.find('label', string=re.compile(r'Business Category:'))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('category')
 
     def _extract_budget(self) -> Optional[float]:
         """Extract approved budget from detail page."""
         # Pattern: <label>Approved Budget of the Contract: </label><br>70,000.00
-        label = self.soup.find('label', string=re.compile(r'Approved Budget'))
-        if label:
-            budget_text = self._get_text_after_label(label)
-            if budget_text:
-                # Remove commas and convert to float
-                numbers = re.sub(r'[^\d.]', '', budget_text)
-                try:
-                    return float(numbers)
-                except ValueError:
-                    return None
+        budget_text = self._label_value('budget')
+        if budget_text:
+            # Remove commas and convert to float
+            numbers = _clean_amount(budget_text)
+            try:
+                return float(numbers)
+            except ValueError:
+                return None
         return None
 
     def _extract_status(self) -> Optional[str]:
         """Extract bid status from detail page."""
         # Pattern: <label>Status :</label>&nbsp; [status text]
-        label = self.soup.find('label', string=re.compile(r'Status\s*:'))
-        if label:
-            # Status might be in next text node or sibling
-            status = self._get_text_after_label(label)
-            if status:
-                return status.strip()
+        # Status might be in next text node or sibling
+        status = self._label_value('status')
+        if status:
+            return status.strip()
         return "Published"  # Default status from listing page
 
     def _extract_publish_date(self) -> Optional[datetime]:
         """Extract publish date from detail page."""
         # Pattern: <label>Published Date: </label><br>13-Nov-2025 12:00 AM
-        label = self.soup.find('label', string=re.compile(r'Published Date:'))
-        if label:
-            date_text = self._get_text_after_label(label)
-            return self._parse_date(date_text)
-        return None
+        return self._parse_date(self._label_value('publish_date'))
 
     def _extract_closing_date(self) -> Optional[datetime]:
         """Extract closing date from detail page."""
         # Pattern: <label>Closing Date:</label><br>  20-Nov-2025 12:00 PM
-        label = self.soup.find('label', string=re.compile(r'Closing Date:'))
-        if label:
-            date_text = self._get_text_after_label(label)
-            return self._parse_date(date_text)
-        return None
+        return self._parse_date(self._label_value('closing_date'))
 
     def _extract_description(self) -> Optional[str]:
         """Extract description from detail page."""
-        # Description is in the "Description:" row in the project details table
-        # Look for <b>Description:</b> in a table cell
-        desc_cell = None
-        for td in self.soup.find_all('td'):
-            if 'Description:' in td.get_text():
-                desc_cell = td
-                break
+        return self._memoized('description', self._read_description)
 
-        if desc_cell:
-            # Get the content, might be in nested div
-            desc_div = desc_cell.find('div', class_='wrapped-long-string1')
-            if desc_div:
-                # Clean up the text, removing excessive whitespace
-                text = desc_div.get_text(separator=' ', strip=True)
-                return ' '.join(text.split())
+    def _read_description(self) -> Optional[str]:
+        """Read the description from the tree (see _extract_description)."""
+        # Description is in the "Description:" row in the project details table
+        # Look for <b>Description:</b> in a table cell; the content might be
+        # in a nested div
+        desc_divs = _XP_DESCRIPTION_DIV(self.tree)
+        if desc_divs:
+            # Clean up the text, removing excessive whitespace
+            text = ' '.join(part for part in map(str.strip, desc_divs[0].itertext()) if part)
+            return _WS_RE.sub(' ', text).strip()
         return None
 
     def _extract_contact_person(self) -> Optional[str]:
         """Extract contact person from detail page."""
         # Pattern: <label>Contact Person: </label><br>Fatima San Diego
-        label = self.soup.find('label', string=re.compile(r'Contact Person:'))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('contact_person')
 
-    def _extract_contact_email(self) -> Optional[str]:
-        """Extract contact email from detail page."""
+    def _extract_contact_email(self, text: Optional[str] = None) -> Optional[str]:
+        """Extract contact email from detail page (or from text, if given)."""
         # Look for email patterns in the page
         # PhilGEPS may not always have explicit email labels
-        text = self.soup.get_text()
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else None
+        if text is None:
+            # Only text nodes containing an '@' can hold an address, so scan
+            # those instead of materializing the whole page text
+            for node in _XP_EMAIL_TEXT(self.tree):
+                match = _EMAIL_RE.search(node)
+                if match:
+                    return match.group(0)
+            return None
+
+        # Every address contains an '@', so start the regex just before the
+        # first one instead of scanning the whole text from the top
+        at = text.find('@')
+        if at < 0:
+            return None
+
+        match = _EMAIL_RE.search(text, max(0, at - _EMAIL_LOCAL_MAX))
+        return match.group(0) if match else None
 
     def _extract_contact_phone(self) -> Optional[str]:
         """Extract contact phone from detail page."""
@@ -310,10 +1044,7 @@ class PhilGEPSParser:
     def _extract_delivery_period(self) -> Optional[str]:
         """Extract delivery period from detail page."""
         # Pattern: <label>Delivery Period: </label><br>30 Day(s)
-        label = self.soup.find('label', string=re.compile(r'Delivery Period:'))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('delivery_period')
 
     # NEWLY ADDED EXTRACTION METHODS (from BID_DATA_FIELDS.md)
 
@@ -324,10 +1055,7 @@ class PhilGEPSParser:
         Reference: BID_DATA_FIELDS.md Field #3
         Pattern: <label>Control Number: </label><br>25011520108<br>
         """
-        label = self.soup.find('label', string=re.compile(r'Control Number:', re.IGNORECASE))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('control_number')
 
     def _extract_bid_form_fee(self) -> Optional[float]:
         """
@@ -335,15 +1063,13 @@ class PhilGEPSParser:
 
         Reference: BID_DATA_FIELDS.md Field #6
         """
-        label = self.soup.find('label', string=re.compile(r'Bid.*Form.*Fee:', re.IGNORECASE))
-        if label:
-            fee_text = self._get_text_after_label(label)
-            if fee_text:
-                numbers = re.sub(r'[^\d.]', '', fee_text)
-                try:
-                    return float(numbers) if numbers else 0.0
-                except ValueError:
-                    return 0.0
+        fee_text = self._label_value('bid_form_fee')
+        if fee_text:
+            numbers = _clean_amount(fee_text)
+            try:
+                return float(numbers) if numbers else 0.0
+            except ValueError:
+                return 0.0
         return 0.0
 
     def _extract_procurement_mode(self) -> Optional[str]:
@@ -358,13 +1084,9 @@ class PhilGEPSParser:
         Negotiated Procurement - Small Value Procurement (Sec. 53.9)
         """
         # Try different label variations
-        label = self.soup.find('label', string=re.compile(r'Mode\s*Of\s*Procurement', re.IGNORECASE))
-        if not label:
-            label = self.soup.find('label', string=re.compile(r'Procurement\s*Mode', re.IGNORECASE))
-
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        if 'procurement_mode' in self.label_index:
+            return self._label_value('procurement_mode')
+        return self._label_value('procurement_mode_alt')
 
     def _extract_procurement_rules(self) -> Optional[str]:
         """
@@ -373,10 +1095,7 @@ class PhilGEPSParser:
         Reference: BID_DATA_FIELDS.md Field #12
         Example: "Implementing Rules and Regulations"
         """
-        label = self.soup.find('label', string=re.compile(r'Applicable.*Procurement.*Rules', re.IGNORECASE))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('procurement_rules')
 
     def _extract_lot_type(self) -> Optional[str]:
         """
@@ -385,10 +1104,7 @@ class PhilGEPSParser:
         Reference: BID_DATA_FIELDS.md Field #13
         Example: "Single Lot", "Multiple Lots"
         """
-        label = self.soup.find('label', string=re.compile(r'Lot Type:', re.IGNORECASE))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('lot_type')
 
     def _extract_date_last_updated(self) -> Optional[datetime]:
         """
@@ -396,11 +1112,7 @@ class PhilGEPSParser:
 
         Reference: BID_DATA_FIELDS.md Field #16
         """
-        label = self.soup.find('label', string=re.compile(r'Date Last Updated:', re.IGNORECASE))
-        if label:
-            date_text = self._get_text_after_label(label)
-            return self._parse_date(date_text)
-        return None
+        return self._parse_date(self._label_value('date_last_updated'))
 
     def _extract_bid_validity_period(self) -> Optional[int]:
         """
@@ -409,17 +1121,15 @@ class PhilGEPSParser:
         Reference: BID_DATA_FIELDS.md Field #17
         Example: "120 Day(s)" -> 120
         """
-        label = self.soup.find('label', string=re.compile(r'Bid.*Validity.*Period:', re.IGNORECASE))
-        if label:
-            text = self._get_text_after_label(label)
-            if text:
-                # Extract number from text like "120 Day(s)"
-                match = re.search(r'(\d+)', text)
-                if match:
-                    try:
-                        return int(match.group(1))
-                    except ValueError:
-                        return None
+        text = self._label_value('bid_validity_period')
+        if text:
+            # Extract number from text like "120 Day(s)"
+            match = _DIGITS_RE.search(text)
+            if match:
+                try:
+                    return int(match.group(1))
+                except ValueError:
+                    return None
         return None
 
     def _extract_date_created(self) -> Optional[datetime]:
@@ -428,11 +1138,7 @@ class PhilGEPSParser:
 
         Reference: BID_DATA_FIELDS.md Field #18
         """
-        label = self.soup.find('label', string=re.compile(r'Date Created:', re.IGNORECASE))
-        if label:
-            date_text = self._get_text_after_label(label)
-            return self._parse_date(date_text)
-        return None
+        return self._parse_date(self._label_value('date_created'))
 
     def _extract_delivery_location(self) -> Optional[str]:
         """
@@ -442,10 +1148,7 @@ class PhilGEPSParser:
         Example: "Cavite"
         NOTE: This is DIFFERENT from delivery_period!
         """
-        label = self.soup.find('label', string=re.compile(r'Delivery.*Location:|Project.*Location:', re.IGNORECASE))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('delivery_location')
 
     def _extract_agency_address(self) -> Optional[str]:
         """
@@ -455,25 +1158,25 @@ class PhilGEPSParser:
         Example: "Bacoor Government Center Bayanan, Bacoor, Cavite, Region IV-A"
         """
         # Try Method 1: <center class="verdhana_twelvepx">Columbia Complex, Ninoy Aquino Avenue...</center>
-        center = self.soup.find('center', class_='verdhana_twelvepx')
-        if center:
-            text = center.get_text(strip=True)
-            if text:
-                return text
+        text = self._center_text('verdhana_twelvepx')
+        if text:
+            return text
 
         # Try Method 2: <label>Address: </label><br>...
-        label = self.soup.find('label', string=re.compile(r'Address:', re.IGNORECASE))
-        if label:
-            # May need to concatenate multiple text nodes for full address
+        label = self.label_index.get('address')
+        if label is not None:
+            # May need to concatenate multiple text nodes for full address:
+            # the label's tail plus the tail of each following <br>
             address_parts = []
-            for sibling in label.next_siblings:
-                if sibling.name == 'br':
-                    continue
-                if isinstance(sibling, str):
-                    text = sibling.strip()
-                    if text and text not in ['', '\n']:
+            text = (label.tail or '').strip()
+            if text:
+                address_parts.append(text)
+            for sibling in label.itersiblings():
+                if sibling.tag in _VALUE_SEPARATOR_TAGS:
+                    text = (sibling.tail or '').strip()
+                    if text:
                         address_parts.append(text)
-                elif sibling.name:
+                else:
                     break
             return ' '.join(address_parts) if address_parts else None
 
@@ -485,10 +1188,7 @@ class PhilGEPSParser:
 
         Reference: BID_DATA_FIELDS.md Field #24
         """
-        label = self.soup.find('label', string=re.compile(r'Created By:', re.IGNORECASE))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('created_by')
 
     def _extract_funding_source(self) -> Optional[str]:
         """
@@ -497,10 +1197,7 @@ class PhilGEPSParser:
         Reference: BID_DATA_FIELDS.md Field #25
         Example: "Regular Agency Fund (01000000)"
         """
-        label = self.soup.find('label', string=re.compile(r'Funding Source:', re.IGNORECASE))
-        if label:
-            return self._get_text_after_label(label)
-        return None
+        return self._label_value('funding_source')
 
     def _extract_line_items(self) -> List[Dict]:
         """
@@ -520,39 +1217,39 @@ class PhilGEPSParser:
         line_items = []
 
         try:
-            # Find the line items table
-            # Look for text "Line Item Details" followed by table
-            line_item_header = self.soup.find(string=re.compile(r'Line Item Details', re.IGNORECASE))
-
-            if line_item_header:
-                # Find the next table after this header
-                table = line_item_header.find_next('table')
-
-                if table:
-                    # Find all rows except header
-                    rows = table.find_all('tr')[1:]  # Skip header row
-
-                    for row in rows:
-                        cols = row.find_all('td')
-                        if len(cols) >= 6:
-                            # Extract quantity as float
-                            quantity_text = cols[4].get_text(strip=True)
-                            quantity = None
-                            if quantity_text:
-                                try:
-                                    quantity = float(re.sub(r'[^\d.]', '', quantity_text))
-                                except ValueError:
-                                    quantity = None
-
-                            line_item = {
-                                'item_number': int(cols[0].get_text(strip=True)) if cols[0].get_text(strip=True).isdigit() else None,
-                                'unspsc_code': cols[1].get_text(strip=True),
-                                'lot_name': cols[2].get_text(strip=True),
-                                'lot_description': cols[3].get_text(strip=True),
-                                'quantity': quantity,
-                                'unit_of_measure': cols[5].get_text(strip=True),
-                            }
-                            line_items.append(line_item)
+            # Rows of the first table after the "Line Item Details" header
+            rows = _XP_LINE_ITEM_ROWS(self.tree)[1:]  # Skip header row
+
+            for row in rows:
+                # Item No., UNSPSC, Lot Name, Lot Description, Quantity, UOM
+                cols = _XP_LINE_ITEM_CELLS(row)
+                if len(cols) < _LINE_ITEM_COLUMNS:
+                    continue
+
+                texts = [_node_text(td) for td in cols]
+
+                try:
+                    item_number = int(texts[0])
+                except ValueError:
+                    item_number = None
+
+                # Extract quantity as float
+                quantity = None
+                cleaned = _clean_amount(texts[4])
+                if cleaned:
+                    try:
+                        quantity = float(cleaned)
+                    except ValueError:
+                        quantity = None
+
+                line_items.append({
+                    'item_number': item_number,
+                    'unspsc_code': texts[1],
+                    'lot_name': texts[2],
+                    'lot_description': texts[3],
+                    'quantity': quantity,
+                    'unit_of_measure': texts[5],
+                })
 
             logger.debug(f"Extracted {len(line_items)} line items")
             return line_items
@@ -561,16 +1258,28 @@ class PhilGEPSParser:
             logger.error(f"Error extracting line items: {e}")
             return []
 
-    def _extract_download_count(self) -> int:
+    def _extract_download_count(self, text: Optional[str] = None) -> int:
         """
         Extract number of downloads (Field #35, line 706-707).
 
         Reference: BID_DATA_FIELDS.md Field #35
+
+        Args:
+            text: Text to scan (defaults to the text around the page's
+                "Downloaded:" marker)
         """
         try:
             # Look for download count pattern
-            text = self.soup.get_text()
-            match = re.search(r'Downloaded:\s*(\d+)', text, re.IGNORECASE)
+            if text is None:
+                # Pages without the marker have no count; plain-text counts
+                # are read straight from the HTML
+                if not _DOWNLOAD_MARKER_RE.search(self._html):
+                    return 0
+                match = _DOWNLOAD_COUNT_RAW_RE.search(self._html)
+                if match:
+                    return int(match.group(1))
+                text = ''.join(_XP_DOWNLOAD_TEXT(self.tree))
+            match = _DOWNLOAD_COUNT_RE.search(text)
             if match:
                 return int(match.group(1))
         except Exception as e:
@@ -579,34 +1288,56 @@ class PhilGEPSParser:
 
     # Utility methods
 
-    def _get_text_after_label(self, label) -> Optional[str]:
+    def _label_value(self, field: str) -> Optional[str]:
+        """
+        Text after the indexed label for field, read once per parser.
+
+        Args:
+            field: Key from _LABEL_PATTERNS
+
+        Returns:
+            str: Text after the label, or None if the page lacks the label
+        """
+        try:
+            return self._label_values[field]
+        except KeyError:
+            value = self._get_text_after_label(self.label_index.get(field))
+            self._label_values[field] = value
+            return value
+
+    @staticmethod
+    def _get_text_after_label(label) -> Optional[str]:
         """
         Get text content after a label tag.
 
         PhilGEPS pattern: <label>Field: </label><br>VALUE<br><br>
 
+        In lxml the value is the tail text of the label or of one of the
+        following <br> tags, so the walk reads tails instead of visiting
+        separate text nodes.
+
         Args:
-            label: BeautifulSoup label tag
+            label: lxml label element
 
         Returns:
             str: Text content after the label, or None
         """
-        if not label:
+        if label is None:
             return None
 
-        # Navigate through siblings to find text
-        for sibling in label.next_siblings:
-            if sibling.name == 'br':
-                continue
-            if isinstance(sibling, str):
-                text = sibling.strip()
-                if text:
-                    return text
-            elif sibling.name:
+        text = (label.tail or '').strip()
+        if text:
+            return text
+
+        for sibling in label.itersiblings():
+            if sibling.tag not in _VALUE_SEPARATOR_TAGS:
                 # If we hit another tag, get its text
-                text = sibling.get_text(strip=True)
+                text = _node_text(sibling)
                 if text:
                     return text
+            text = (sibling.tail or '').strip()
+            if text:
+                return text
         return None
 
     @staticmethod
@@ -628,25 +1359,7 @@ class PhilGEPSParser:
         if not date_string:
             return None
 
-        date_string = date_string.strip()
-
-        # PhilGEPS date formats
-        formats = [
-            '%d-%b-%Y %I:%M %p',  # 13-Nov-2025 12:00 AM
-            '%d-%b-%Y',            # 13-Nov-2025
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_string, fmt)
-            except ValueError:
-                continue
-
-        logger.warning(f"Could not parse date: {date_string}")
-        return None
+        return _parse_date_cached(date_string.strip())
 
     def parse_document_links(self) -> List[Dict]:
         """
@@ -658,33 +1371,43 @@ class PhilGEPSParser:
         try:
             documents = []
 
-            # Strategy 1: Find all PDF links by href ending with .pdf
+            # Every strategy needs '.pdf' in an href; if the page has none
+            # anywhere, skip building the tree
+            if not _PDF_MARKER_RE.search(self._html):
+                logger.warning("No PDF links found (page has no '.pdf' references)")
+                return documents
+
+            # One compiled XPath finds every link with '.pdf' in its href;
+            # the narrower strategies filter that set
+            # Strategy 1: href ending with .pdf
             # Pattern: <a target="_blank" href="https://philgeps.gov.ph/portal_documents/bid_notice_documents/bid_notice_7244/bid_notice_document/1762836649_25750220105pr.pdf">
-            pdf_links = self.soup.find_all('a', href=re.compile(r'\.pdf$', re.IGNORECASE))
+            # Strategy 2 (backup): 'portal_documents' ... '.pdf' anywhere in href
+            # Strategy 3: any '.pdf' in the URL
+            has_pdf = _XP_PDF_LINKS(self.tree)
+            ends_with_pdf = [link for link in has_pdf if _PDF_HREF_RE.search(link.get('href'))]
+            portal_doc_links = [link for link in has_pdf if _PORTAL_PDF_HREF_RE.search(link.get('href'))]
+
+            pdf_links = ends_with_pdf
             logger.debug(f"Strategy 1: Found {len(pdf_links)} PDF links by href pattern")
 
-            # Strategy 2: Also find links containing 'portal_documents' in href (backup)
             if len(pdf_links) == 0:
-                portal_doc_links = self.soup.find_all('a', href=re.compile(r'portal_documents.*\.pdf', re.IGNORECASE))
-                logger.debug(f"Strategy 2: Found {len(portal_doc_links)} PDF links by portal_documents pattern")
-                pdf_links.extend(portal_doc_links)
+                pdf_links = portal_doc_links
+                logger.debug(f"Strategy 2: Found {len(pdf_links)} PDF links by portal_documents pattern")
 
-            # Strategy 3: Find any links with .pdf extension in the URL
             if len(pdf_links) == 0:
-                all_links = self.soup.find_all('a', href=True)
-                for link in all_links:
-                    href = link.get('href', '')
-                    if '.pdf' in href.lower():
-                        pdf_links.append(link)
+                pdf_links = has_pdf
                 logger.debug(f"Strategy 3: Found {len(pdf_links)} total PDF links")
 
             # Log a sample of the HTML if no documents found for debugging
             if len(pdf_links) == 0:
                 # Get a sample of links on the page for debugging
-                all_links = self.soup.find_all('a', href=True)
+                all_links = _XP_HREF_LINKS(self.tree)
                 logger.warning(f"No PDF links found. Total links on page: {len(all_links)}")
                 if all_links:
-                    sample_links = [str(link)[:100] for link in all_links[:5]]
+                    sample_links = [
+                        etree.tostring(link, encoding='unicode', with_tail=False)[:100]
+                        for link in all_links[:5]
+                    ]
                     logger.debug(f"Sample links: {sample_links}")
 
             for link in pdf_links:
@@ -693,13 +1416,10 @@ class PhilGEPSParser:
                     continue
 
                 # Extract filename from URL or link text
-                filename = link.get_text(strip=True) or href.split('/')[-1]
+                filename = _node_text(link) or href.split('/')[-1]
 
                 # Handle relative URLs
-                if href.startswith('/'):
-                    href = f"https://philgeps.gov.ph{href}"
-                elif not href.startswith('http'):
-                    href = f"https://philgeps.gov.ph/{href}"
+                href = _absolute_url(href)
 
                 document = {
                     'filename': filename,
@@ -732,29 +1452,57 @@ class PhilGEPSParser:
         if not filename:
             return None
 
-        filename_lower = filename.lower()
-
-        # Common document type patterns
-        if 'bid_notice' in filename_lower or 'notice' in filename_lower:
-            return 'Bid Notice'
-        elif 'technical' in filename_lower or 'specs' in filename_lower:
-            return 'Technical Specifications'
-        elif 'terms' in filename_lower or 'tor' in filename_lower:
-            return 'Terms of Reference'
-        elif 'bill' in filename_lower or 'boq' in filename_lower:
-            return 'Bill of Quantities'
-        elif 'drawing' in filename_lower or 'plan' in filename_lower:
-            return 'Drawings/Plans'
-        elif 'supplement' in filename_lower or 'amendment' in filename_lower:
-            return 'Supplement/Amendment'
-        else:
-            return 'Document'
+        # One scan for every keyword; the highest-priority type wins, so stop
+        # as soon as a top-priority keyword turns up
+        best = None
+        for match in _DOCUMENT_TYPE_RE.finditer(filename.lower()):
+            candidate = _DOCUMENT_TYPE_BY_KEYWORD[match.group(1)]
+            if best is None or candidate < best:
+                best = candidate
+                if best[0] == 0:
+                    break
+        return best[1] if best else 'Document'
 
     # =========================================================================
     # AWARDED CONTRACTS PARSING METHODS
     # =========================================================================
 
-    def parse_awarded_contract(self) -> Dict:
+    @property
+    def award_label_index(self) -> Dict:
+        """
+        Map of field -> <label> elements for that field on an award notice
+        page (see _AWARD_LABEL_PATTERNS), built on first access.
+        """
+        if self._award_label_index is None:
+            self._award_label_index = self._build_award_label_index()
+        return self._award_label_index
+
+    def _build_award_label_index(self) -> Dict:
+        """
+        Walk the page's <label> elements once and file each under every award
+        field its sole string names (bs4's find('label', string=pattern)).
+
+        Returns:
+            dict: field name -> matching <label> elements in document order
+        """
+        index = {}
+        for label in self.tree.iter('label'):
+            text = _sole_string(label)
+            if text is None:
+                continue
+            for match in _AWARD_LABEL_DISPATCH.finditer(text.lower()):
+                labels = index.setdefault(match.lastgroup, [])
+                if not labels or labels[-1] is not label:
+                    labels.append(label)
+        logger.debug(f"Indexed {len(index)} award-page labels")
+        return index
+
+    def _award_label(self, field: str):
+        """First award-page <label> for field, or None."""
+        labels = self.award_label_index.get(field)
+        return labels[0] if labels else None
+
+    def parse_awarded_contract(self, scraped_at: Optional[datetime] = None) -> AwardRecord:
         """
         Parse an awarded contract detail page.
 
@@ -769,74 +1517,81 @@ class PhilGEPSParser:
         - ABC and Contract Amount (awarded price)
         - Contract details and dates
 
+        Args:
+            scraped_at: Timestamp to record (lets a batch share one value);
+                defaults to now in UTC
+
         Returns:
-            dict: Extracted awarded contract data
+            AwardRecord: Extracted awarded contract data
         """
+        cache_key = ('awarded_contract', self._html_hash)
+        cached = _parse_cache_get(cache_key)
+        if cached is not None:
+            cached.scraped_at = scraped_at or _now(_UTC)
+            logger.debug(f"Parsed awarded contract: {cached.award_notice_number} (cached)")
+            return cached
+
         try:
             logger.debug("Parsing awarded contract detail page")
 
-            data = {
+            # One pass over the labels serves every award-field extractor below
+            self.award_label_index
+
+            data = AwardRecord(
                 # PRIMARY IDENTIFIERS
-                'award_notice_number': self._extract_award_notice_number(),
-                'bid_reference_number': self._extract_bid_reference_number(),
-                'control_number': self._extract_control_number(),
+                award_notice_number=self._extract_award_notice_number(),
+                control_number=self._extract_control_number(),
 
                 # AWARD INFORMATION
-                'award_title': self._extract_title(),  # Reuse existing method
-                'award_type': self._extract_award_type(),
-                'award_date': self._extract_award_date(),
+                award_title=self._extract_title(),  # Reuse existing method
+                award_type=self._extract_award_type(),
 
                 # AWARDEE (WINNER) INFORMATION
-                'awardee_name': self._extract_awardee_name(),
-                'awardee_address': self._extract_awardee_address(),
-                'awardee_contact_person': self._extract_awardee_contact_person(),
-                'awardee_corporate_title': self._extract_awardee_corporate_title(),
+                awardee_name=self._extract_awardee_name(),
+                awardee_address=self._extract_awardee_address(),
 
                 # FINANCIAL INFORMATION (CRITICAL)
-                'approved_budget': self._extract_budget(),  # Reuse existing (ABC)
-                'contract_amount': self._extract_contract_amount(),  # NEW - Awarded price
-
-                # CONTRACT DETAILS
-                'contract_number': self._extract_contract_number(),
-                'contract_effectivity_date': self._extract_contract_effectivity_date(),
-                'contract_end_date': self._extract_contract_end_date(),
-                'period_of_contract': self._extract_period_of_contract(),
-                'proceed_date': self._extract_proceed_date(),
+                approved_budget=self._extract_budget(),  # Reuse existing (ABC)
 
                 # PROCUREMENT DETAILS (reuse existing methods)
-                'procurement_mode': self._extract_procurement_mode(),
-                'classification': self._extract_classification(),
-                'category': self._extract_category(),
-                'procurement_rules': self._extract_procurement_rules(),
-                'funding_source': self._extract_funding_source(),
+                procurement_mode=self._extract_procurement_mode(),
+                classification=self._extract_classification(),
+                category=self._extract_category(),
+                procurement_rules=self._extract_procurement_rules(),
+                funding_source=self._extract_funding_source(),
 
                 # PROCURING ENTITY
-                'procuring_entity': self._extract_procuring_entity(),
-                'agency_address': self._extract_agency_address(),
-                'delivery_location': self._extract_delivery_location(),
+                procuring_entity=self._extract_procuring_entity(),
+                agency_address=self._extract_agency_address(),
+                delivery_location=self._extract_delivery_location(),
 
                 # TIMELINE
-                'publish_date': self._extract_publish_date(),
-                'date_created': self._extract_date_created(),
-                'date_last_updated': self._extract_date_last_updated(),
+                publish_date=self._extract_publish_date(),
+                date_created=self._extract_date_created(),
+                date_last_updated=self._extract_date_last_updated(),
 
                 # DESCRIPTION
-                'description': self._extract_description(),
+                description=self._extract_description(),
 
                 # ADDITIONAL
-                'created_by': self._extract_created_by(),
+                created_by=self._extract_created_by(),
 
                 # LINE ITEMS (reuse existing)
-                'line_items': self._extract_line_items(),
+                line_items=self._extract_line_items(),
 
                 # DOCUMENTS (View Document links)
-                'documents': self._extract_award_documents(),
+                documents=self._extract_award_documents(),
+
+                # LABEL-VALUE FIELDS (bid reference, award and contract dates,
+                # awardee contact, contract amount/number/period)
+                **self._extract_award_values(),
 
                 # META
-                'scraped_at': datetime.now(timezone.utc)
-            }
+                scraped_at=scraped_at or _now(_UTC)
+            )
 
-            logger.debug(f"Parsed awarded contract: {data.get('award_notice_number')}")
+            _parse_cache_put(cache_key, data)
+            logger.debug(f"Parsed awarded contract: {data.award_notice_number}")
             return data
 
         except Exception as e:
@@ -853,47 +1608,56 @@ class PhilGEPSParser:
         Returns:
             str: Award notice number (e.g., "1998")
         """
-        try:
-            # Method 1: Look for "Award Notice Number" label
-            label = self.soup.find('label', string=re.compile(r'Award Notice Number', re.I))
-            if label:
-                text = label.get_text(strip=True)
-                match = re.search(r'(\d+)', text)
-                if match:
-                    return match.group(1).strip()
+        if self._award_label_index is None:
+            # Standalone lookup: stream labels up to the award number instead
+            # of building the tree and award label index for one field
+            for label in _iter_labels(self._html):
+                text = _sole_string(label)
+                if text is not None and any(
+                    match.lastgroup == 'award_notice_number'
+                    for match in _AWARD_LABEL_DISPATCH.finditer(text.lower())
+                ):
+                    return self._award_number_from_label(label)
+
+        # Method 1: Look for "Award Notice Number" label
+        label = self._award_label('award_notice_number')
+        if label is not None:
+            return self._award_number_from_label(label)
 
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting award notice number: {e}")
-            return None
+        return None
 
-    def _extract_bid_reference_number(self) -> Optional[str]:
+    def _extract_award_values(self) -> Dict:
         """
-        Extract Bid Notice Reference Number (links to original bid).
+        Read the plain label-value award fields listed in _AWARD_VALUE_FIELDS.
 
-        HTML Example:
-        <label>Notice Reference Number:</label><br>6793 <br><br>
+        Each value is the stripped string after the field's label, passed
+        through the field's converter; missing or blank values are None.
 
         Returns:
-            str: Bid reference number (e.g., "6793")
+            dict: AwardRecord field name -> value
         """
-        try:
-            # Look for "Notice Reference Number" label
-            label = self.soup.find('label', string=re.compile(r'Notice Reference Number', re.I))
-            if label and label.next_sibling:
-                # Get text after <br> tag
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    ref_num = sibling.strip()
-                    if ref_num:
-                        return ref_num
+        values = {}
+        for key, label_field, convert in _AWARD_VALUE_FIELDS:
+            value = _next_sibling_text(self._award_label(label_field))
+            if value is not None and convert is not None:
+                value = convert(value)
+            values[key] = value
+        return values
 
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting bid reference number: {e}")
-            return None
+    @staticmethod
+    def _award_number_from_label(label) -> Optional[str]:
+        """Digits of an "Award Notice Number :1998" label, or None."""
+        text = _node_text(label)
+        # Usual form "Award Notice Number :1998": a letters-only head
+        # holds no digits, so the number after the colon is the first run
+        head, _, number = text.rpartition(':')
+        number = number.strip()
+        if number.isdecimal() and head.replace(' ', '').isalpha():
+            return number
+        match = _DIGITS_RE.search(text)
+        if match:
+            return match.group(1).strip()
+        return None
 
     def _extract_award_type(self) -> Optional[str]:
         """
@@ -905,42 +1669,13 @@ class PhilGEPSParser:
         Returns:
             str: Award type (e.g., "Award Notice")
         """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Award Type', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    return sibling.strip()
-
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting award type: {e}")
-            return None
-
-    def _extract_award_date(self) -> Optional[datetime]:
-        """
-        Extract Award Date.
+        label = self._award_label('award_type')
+        if label is not None:
+            sibling = _next_sibling_string(label)
+            if sibling:
+                return sibling.strip()
 
-        HTML Example:
-        <label>Award Date:</label><br>12-Nov-2025<br><br>
-
-        Returns:
-            datetime: Award date
-        """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Award Date', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    date_str = sibling.strip()
-                    return self._parse_date(date_str)
-
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting award date: {e}")
-            return None
+        return None
 
     def _extract_awardee_name(self) -> Optional[str]:
         """
@@ -953,27 +1688,20 @@ class PhilGEPSParser:
         Returns:
             str: Awardee company name
         """
-        try:
-            # Look for "Awardee:" label
-            label = self.soup.find('label', string=re.compile(r'Awardee\s*:', re.I))
-            if label:
-                # Try to find next label with class tamoha_twelvepx
-                next_label = label.find_next('label', class_='tamoha_twelvepx')
-                if next_label:
-                    return next_label.get_text(strip=True)
-
-                # Fallback: get text after <br>
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    awardee = sibling.strip()
-                    if awardee:
-                        return awardee
+        # Look for "Awardee:" label
+        label = self._award_label('awardee')
+        if label is not None:
+            # Try to find next label with class tamoha_twelvepx
+            next_labels = _XP_NEXT_LABEL_BY_CLASS(label, cls='tamoha_twelvepx')
+            if next_labels:
+                return _node_text(next_labels[0])
 
-            return None
+            # Fallback: get text after <br>
+            awardee = _next_sibling_text(label)
+            if awardee:
+                return awardee
 
-        except Exception as e:
-            logger.debug(f"Error extracting awardee name: {e}")
-            return None
+        return None
 
     def _extract_awardee_address(self) -> Optional[str]:
         """
@@ -986,298 +1714,141 @@ class PhilGEPSParser:
         Returns:
             str: Awardee address
         """
-        try:
-            # Find "Address:" label within awardee section
-            labels = self.soup.find_all('label', string=re.compile(r'Address\s*:', re.I))
-
-            # There might be multiple "Address" labels, we want the one near "Awardee"
-            for label in labels:
-                # Check if this is in the awardee section by looking for nearby "Awardee" text
-                parent_text = label.parent.get_text() if label.parent else ''
-                if 'Awardee' in parent_text or 'Corporate Title' in parent_text:
-                    sibling = label.find_next_sibling(string=True)
-                    if sibling:
-                        address = sibling.strip()
-                        if address and len(address) > 5:  # Avoid empty or very short strings
-                            return address
-
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting awardee address: {e}")
-            return None
-
-    def _extract_awardee_contact_person(self) -> Optional[str]:
-        """
-        Extract Awardee Contact Person.
-
-        HTML Example:
-        <label>Awardee Contact Person:</label><br>
-        AXELL JAY  CATAPANG<br> <br>
-
-        Returns:
-            str: Contact person name
-        """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Awardee Contact Person', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    contact = sibling.strip()
-                    if contact:
-                        return contact
-
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting awardee contact person: {e}")
-            return None
-
-    def _extract_awardee_corporate_title(self) -> Optional[str]:
-        """
-        Extract Awardee Corporate Title.
-
-        HTML Example:
-        <label>Corporate Title:</label><br>
-        Proprietor<br> <br>
-
-        Returns:
-            str: Corporate title
-        """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Corporate Title', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    title = sibling.strip()
-                    if title:
-                        return title
-
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting corporate title: {e}")
-            return None
-
-    def _extract_contract_amount(self) -> Optional[float]:
-        """
-        Extract Contract Amount (AWARDED PRICE - the actual winning bid amount).
-
-        This is different from ABC (Approved Budget).
-        This is the actual price the contract was awarded for.
-
-        HTML Example:
-        <label>Contract Amount:</label><br>PHP 750,000.00<br><br>
-
-        Returns:
-            float: Contract amount in PHP
-        """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Contract Amount', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    amount_str = sibling.strip()
-                    # Remove "PHP", commas, and convert to float
-                    amount_str = re.sub(r'[^\d.]', '', amount_str)
-                    if amount_str:
-                        return float(amount_str)
+        # Find "Address:" label within awardee section
+        labels = self.award_label_index.get('address', ())
 
-            return None
+        # There might be multiple "Address" labels, we want the one near "Awardee"
+        for label in labels:
+            # Check if this is in the awardee section by looking for nearby "Awardee" text
+            if _XP_IN_AWARDEE_SECTION(label):
+                address = _next_sibling_text(label)
+                if address and len(address) > 5:  # Avoid empty or very short strings
+                    return address
 
-        except Exception as e:
-            logger.debug(f"Error extracting contract amount: {e}")
-            return None
-
-    def _extract_contract_number(self) -> Optional[str]:
-        """
-        Extract Contract Number.
-
-        HTML Example:
-        <label>Contract No.:</label><br><br><br>
-        (might be empty)
+        return None
 
-        Returns:
-            str: Contract number or None
+    def _extract_award_documents(self) -> List[Dict]:
         """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Contract No', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    contract_no = sibling.strip()
-                    if contract_no and contract_no != '':
-                        return contract_no
-
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting contract number: {e}")
-            return None
+        Extract document links from awarded contract page.
 
-    def _extract_contract_effectivity_date(self) -> Optional[datetime]:
-        """
-        Extract Contract Effectivity Date.
+        Looks for "View Document" links and other document downloads.
 
         HTML Example:
-        <label>Contract Effectivity Date:</label><br><br><br>
-        (might be empty)
+        <b>View Document</b> with href to document URL
 
         Returns:
-            datetime: Contract start date or None
-        """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Contract Effectivity Date', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    date_str = sibling.strip()
-                    if date_str:
-                        return self._parse_date(date_str)
-
-            return None
-
-        except Exception as e:
-            logger.debug(f"Error extracting contract effectivity date: {e}")
-            return None
-
-    def _extract_contract_end_date(self) -> Optional[datetime]:
+            List[Dict]: List of document dictionaries with filename, url, type
         """
-        Extract Contract End Date.
-
-        HTML Example:
-        <label>Contract End Date:</label><br><br><br>
-        (might be empty)
+        view_documents = []
+        other_links = []
+        seen = set()
 
-        Returns:
-            datetime: Contract end date or None
-        """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Contract End Date', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    date_str = sibling.strip()
-                    if date_str:
-                        return self._parse_date(date_str)
+        # One pass over the links: anchors wrapping <b>View Document</b>
+        # (method 1) and anchors whose href looks like a document (method 2)
+        for link in self.tree.iter('a'):
+            raw_href = link.get('href')
+            if raw_href is None:
+                continue
+            href = raw_href.strip()
+            if not href:
+                continue
 
-            return None
+            # Handle relative URLs
+            href = _absolute_url(href)
+
+            is_view = any(
+                (text := _sole_string(tag)) is not None and _VIEW_DOCUMENT_RE.search(text)
+                for tag in link.iter('b')
+            )
+            if is_view:
+                if href not in seen:
+                    seen.add(href)
+                    view_documents.append({
+                        'filename': 'Award Document',
+                        'document_url': href,
+                        'document_type': 'Award Document'
+                    })
+            elif _DOCUMENT_HREF_RE.search(raw_href):
+                other_links.append((link, href))
+
+        # View Document links come first and win over a duplicate plain link
+        documents = view_documents
+        for link, href in other_links:
+            if href in seen:
+                continue
+            seen.add(href)
 
-        except Exception as e:
-            logger.debug(f"Error extracting contract end date: {e}")
-            return None
+            filename = _node_text(link) or href.split('/')[-1]
 
-    def _extract_period_of_contract(self) -> Optional[str]:
-        """
-        Extract Period of Contract.
+            documents.append({
+                'filename': filename,
+                'document_url': href,
+                'document_type': self._guess_document_type(filename)
+            })
 
-        HTML Example:
-        <label>Period of Contract :</label><br>
-        30-Day(s)<br><br>
+        logger.debug(f"Extracted {len(documents)} award documents")
+        return documents
 
-        Returns:
-            str: Period description (e.g., "30-Day(s)")
-        """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Period of Contract', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    period = sibling.strip()
-                    if period:
-                        return period
 
-            return None
+# Below this many pages, worker start-up and pickling cost more than they save
+PARALLEL_PARSE_MIN_PAGES = 32
 
-        except Exception as e:
-            logger.debug(f"Error extracting period of contract: {e}")
-            return None
 
-    def _extract_award_documents(self) -> List[Dict]:
-        """
-        Extract document links from awarded contract page.
+def parse_detail_html(html: Union[str, bytes], scraped_at: Optional[datetime] = None) -> Dict:
+    """Parse one bid notice detail page (module-level so process pools can pickle it)."""
+    return PhilGEPSParser.for_detail(html).parse_bid_notice(scraped_at)
 
-        Looks for "View Document" links and other document downloads.
 
-        HTML Example:
-        <b>View Document</b> with href to document URL
+def parse_award_html(html: Union[str, bytes], scraped_at: Optional[datetime] = None) -> AwardRecord:
+    """Parse one award notice detail page (module-level so process pools can pickle it)."""
+    return PhilGEPSParser.for_detail(html).parse_awarded_contract(scraped_at)
 
-        Returns:
-            List[Dict]: List of document dictionaries with filename, url, type
-        """
-        documents = []
 
-        try:
-            # Method 1: Look for <b>View Document</b> links
-            view_doc_tags = self.soup.find_all('b', string=re.compile(r'View Document', re.I))
-            for tag in view_doc_tags:
-                # Find parent <a> tag
-                link = tag.find_parent('a')
-                if link:
-                    href = link.get('href', '').strip()
-                    if href:
-                        # Handle relative URLs
-                        if href.startswith('/'):
-                            href = f"https://philgeps.gov.ph{href}"
-                        elif not href.startswith('http'):
-                            href = f"https://philgeps.gov.ph/{href}"
-
-                        documents.append({
-                            'filename': 'Award Document',
-                            'document_url': href,
-                            'document_type': 'Award Document'
-                        })
-
-            # Method 2: Look for PDF links (alternative pattern)
-            pdf_links = self.soup.find_all('a', href=re.compile(r'\.pdf|document|download', re.I))
-            for link in pdf_links:
-                href = link.get('href', '').strip()
-                if not href or any(d['document_url'] == href for d in documents):
-                    continue
+def _parse_pages(parse_page, html_pages: Iterable[Union[str, bytes]], max_workers: Optional[int],
+                 chunksize: int) -> List:
+    """
+    Run parse_page over html_pages, in worker processes for large batches.
 
-                # Handle relative URLs
-                if href.startswith('/'):
-                    href = f"https://philgeps.gov.ph{href}"
-                elif not href.startswith('http'):
-                    href = f"https://philgeps.gov.ph/{href}"
+    Parsing is CPU-bound and holds the GIL, so bulk parsing scales with
+    processes rather than threads. Batches smaller than
+    PARALLEL_PARSE_MIN_PAGES are parsed inline.
+    """
+    parse = partial(parse_page, scraped_at=_now(_UTC))
+    html_pages = list(html_pages)
+    if len(html_pages) < PARALLEL_PARSE_MIN_PAGES:
+        return [parse(html) for html in html_pages]
 
-                filename = link.get_text(strip=True) or href.split('/')[-1]
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(parse, html_pages, chunksize=chunksize))
 
-                documents.append({
-                    'filename': filename,
-                    'document_url': href,
-                    'document_type': self._guess_document_type(filename)
-                })
 
-            logger.debug(f"Extracted {len(documents)} award documents")
-            return documents
+def parse_detail_pages(html_pages: Iterable[Union[str, bytes]], max_workers: Optional[int] = None,
+                       chunksize: int = 16) -> List[Dict]:
+    """
+    Parse many bid notice detail pages in parallel worker processes.
 
-        except Exception as e:
-            logger.error(f"Error extracting award documents: {str(e)}")
-            return []
+    Args:
+        html_pages: Detail page HTML strings
+        max_workers: Number of worker processes (defaults to CPU count)
+        chunksize: Pages sent to a worker per round trip
 
-    def _extract_proceed_date(self) -> Optional[datetime]:
-        """
-        Extract Proceed Date.
+    Returns:
+        list: Parsed bid notices, in input order (sharing one scraped_at)
+    """
+    return _parse_pages(parse_detail_html, html_pages, max_workers, chunksize)
 
-        HTML Example:
-        <label>Proceed Date:</label><br><br><br>
-        (might be empty)
 
-        Returns:
-            datetime: Proceed date or None
-        """
-        try:
-            label = self.soup.find('label', string=re.compile(r'Proceed Date', re.I))
-            if label:
-                sibling = label.find_next_sibling(string=True)
-                if sibling:
-                    date_str = sibling.strip()
-                    if date_str:
-                        return self._parse_date(date_str)
+def parse_award_pages(html_pages: Iterable[Union[str, bytes]], max_workers: Optional[int] = None,
+                      chunksize: int = 16) -> List[AwardRecord]:
+    """
+    Parse many award notice detail pages in parallel worker processes.
 
-            return None
+    Args:
+        html_pages: Award detail page HTML strings
+        max_workers: Number of worker processes (defaults to CPU count)
+        chunksize: Pages sent to a worker per round trip
 
-        except Exception as e:
-            logger.debug(f"Error extracting proceed date: {e}")
-            return None
+    Returns:
+        list: Parsed awarded contracts, in input order (sharing one scraped_at)
+    """
+    return _parse_pages(parse_award_html, html_pages, max_workers, chunksize)
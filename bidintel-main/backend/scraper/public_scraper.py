@@ -20,16 +20,80 @@ import asyncio
 import time
 import re
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin
+from lxml import etree, html as lxml_html
+import httpx
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 from config.settings import settings
 from utils.logger import logger
+from utils.rate_limit import HostRateLimiter
 from models.database import Database
+from scraper.award_index import stripped_text
+from scraper.browser import BLOCKED_RESOURCE_TYPES
 from scraper.parser import PhilGEPSParser
 from scraper.stealth import PlaywrightStealth, HumanBehavior
 
+# Put on the write queue after the last worker finishes; tells _writer to stop
+_WRITE_DONE = object()
+
+# Preview modal link on a detail page; the facebox fallback mirrors
+# _scrape_document_links
+_XP_PREVIEW_HREF = etree.XPath("//a[@rel='facebox'][contains(., 'Preview')]/@href")
+_XP_DOC_VIEW_HREF = etree.XPath("//a[@rel='facebox'][contains(@href, 'tender_doc_view')]/@href")
+
+# Listing table rows and the cells _get_bid_list reads from each
+_XP_LISTING_ROWS = etree.XPath("//tbody//tr")
+_XP_ROW_REF_LINK = etree.XPath("./td[1]//a[1]")
+_XP_ROW_TITLE_CELL = etree.XPath("./td[2]")
+
+# "Page 1 of 20" line of the listing's paginator
+_XP_PAGINATOR_TEXT = etree.XPath(
+    "string((//div[contains(concat(' ', normalize-space(@class), ' '), ' paginator ')])[1]//p[1])"
+)
+_TOTAL_PAGES_RE = re.compile(r'Page\s+\d+\s+of\s+(\d+)')
+
+# Same row extraction run inside the browser, returning
+# [reference_number, href, title] per row instead of the whole page HTML.
+# Text is joined from trimmed text nodes to match stripped_text
+_LISTING_ROWS_JS = """() => {
+    const text = (el) => {
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        let out = '';
+        while (walker.nextNode()) out += walker.currentNode.nodeValue.trim();
+        return out;
+    };
+    const rows = [];
+    for (const row of document.querySelectorAll('tbody tr')) {
+        const link = row.querySelector(':scope > td:first-of-type a');
+        if (!link) continue;
+        const titleCell = row.querySelector(':scope > td:nth-of-type(2)');
+        rows.push([text(link), link.getAttribute('href') || '', titleCell ? text(titleCell) : '']);
+    }
+    return rows;
+}"""
+
+
+def _parse_bid_page(html: str) -> Tuple[Dict, List[str]]:
+    """
+    Parse a bid notice detail page (run in a thread, off the event loop).
+
+    Args:
+        html: Detail page HTML
+
+    Returns:
+        tuple: (bid notice data, hrefs of the document preview link)
+    """
+    parser = PhilGEPSParser(html)
+    bid_data = parser.parse_bid_notice()
+    return bid_data, _XP_PREVIEW_HREF(parser.tree) or _XP_DOC_VIEW_HREF(parser.tree)
+
+
+def _parse_document_page(html: str) -> List[Dict]:
+    """Parse document links from a preview page (run in a thread, off the event loop)."""
+    return PhilGEPSParser.for_documents(html).parse_document_links()
+
 
 class PublicPhilGEPSScraper:
     """
@@ -52,28 +116,49 @@ class PublicPhilGEPSScraper:
     PUBLIC_INDEX_URL = "https://philgeps.gov.ph/Indexes/viewMoreOpenTenders"
     PUBLIC_DETAIL_URL_TEMPLATE = "https://philgeps.gov.ph/tenders/viewBidNotice/{bid_id}"
 
-    def __init__(self, num_workers: int = 2):
+    def __init__(self, num_workers: int = 2, keep_browser_open: bool = False):
         """
         Initialize public scraper.
 
         Args:
             num_workers: Number of concurrent workers (tabs). Default is 2.
+            keep_browser_open: Keep the browser and worker tabs open after run()
+                so the next run skips the launch; call close() (or use the
+                scraper as an async context manager) to shut it down.
         """
         self.num_workers = num_workers
+        self.keep_browser_open = keep_browser_open
         self.db = Database()
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.main_page: Optional[Page] = None
+        self.http: Optional[httpx.AsyncClient] = None
+        self.http_limiter = HostRateLimiter(settings.HTTP_MAX_PER_HOST, settings.MAX_RETRIES)
+        self.worker_pages: List[Page] = []  # Extra worker tabs, kept warm between runs
+        self._browser_headless: Optional[bool] = None  # HEADLESS_MODE the browser was launched with
         self.stealth = PlaywrightStealth()  # Initialize stealth config
 
-    async def run(self) -> Dict:
+    async def __aenter__(self) -> 'PublicPhilGEPSScraper':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def run(self, num_workers: Optional[int] = None) -> Dict:
         """
         Run the complete public scraping workflow.
 
+        Args:
+            num_workers: Concurrent workers (tabs) for this and later runs;
+                None keeps the current number
+
         Returns:
             dict: Scraping results summary
         """
+        if num_workers is not None:
+            self.num_workers = num_workers
+
         start_time = datetime.now(timezone.utc)
         results = {
             'success': False,
@@ -91,9 +176,8 @@ class PublicPhilGEPSScraper:
             logger.info("No authentication required - using public URLs")
             logger.info("=" * 60)
 
-            # Step 1: Initialize browser
-            logger.info("Initializing async browser...")
-            await self._init_browser()
+            # Step 1: Initialize browser (reused if still open from a previous run)
+            await self.ensure_browser()
 
             # Step 2: Navigate to public index page
             logger.info("Navigating to public bid opportunities page...")
@@ -106,6 +190,9 @@ class PublicPhilGEPSScraper:
             # Human-like wait for page to load
             await HumanBehavior.simulate_reading(self.main_page, duration_seconds=2.0)
 
+            if settings.HTTP_DETAIL_FETCH or settings.HTTP_LISTING_CONCURRENCY > 0:
+                await self._init_http_client()
+
             # Step 3: Get all bids with pagination
             bid_list = await self._get_all_bids_with_pagination()
             logger.info(f"Found {len(bid_list)} total bid notices across all pages")
@@ -119,10 +206,13 @@ class PublicPhilGEPSScraper:
                 results['success'] = True  # Not an error, just no work to do
                 return results
 
-            # Step 4: Filter out already-scraped bids
+            # Step 4: Filter out already-scraped bids (one lookup for the whole list)
+            already_scraped = self.db.get_existing_reference_numbers(
+                [bid_summary['reference_number'] for bid_summary in bid_list]
+            )
             bids_to_scrape = []
             for bid_summary in bid_list:
-                if self._is_already_scraped(bid_summary['reference_number']):
+                if bid_summary['reference_number'] in already_scraped:
                     logger.info(f"⏭️  Skipping already scraped bid: {bid_summary['reference_number']}")
                     results['skipped'] += 1
                 else:
@@ -135,71 +225,52 @@ class PublicPhilGEPSScraper:
                 results['success'] = True
                 return results
 
-            # Step 5: Split work among workers
-            work_chunks = self._split_work(bids_to_scrape, self.num_workers)
+            # Step 5: Queue the work; idle workers pull the next bid so a slow
+            # page never leaves other tabs waiting on a fixed share
+            bid_queue: asyncio.Queue = asyncio.Queue()
+            for bid_summary in bids_to_scrape:
+                bid_queue.put_nowait(bid_summary)
+            total_bids = len(bids_to_scrape)
 
-            # Step 6: Create worker pages with stealth
+            # Step 6: Get worker pages with stealth
             # Reuse main_page for first worker to reduce tab count
-            if self.num_workers == 1:
-                logger.info(f"Using main page as single worker (no new tabs)...")
-                worker_pages = [self.main_page]
-                logger.info(f"  Worker 1: {len(work_chunks[0])} bids assigned (reusing main page)")
-            else:
-                logger.info(f"Creating {self.num_workers} browser tabs with stealth...")
-                worker_pages = []
-
-                # First worker reuses main_page
-                worker_pages.append(self.main_page)
-                logger.info(f"  Worker 1: {len(work_chunks[0])} bids assigned (reusing main page)")
-
-                # Create additional workers
-                for i in range(1, self.num_workers):
-                    page = await self.context.new_page()
-                    page.set_default_timeout(settings.BROWSER_TIMEOUT)
-
-                    # Apply stealth to worker page
-                    await self.stealth.apply_stealth(page)
-
-                    worker_pages.append(page)
-                    logger.info(f"  Worker {i+1}: {len(work_chunks[i])} bids assigned, stealth applied")
+            worker_pages = await self._get_worker_pages()
 
             # Step 7: Run workers concurrently
-            logger.info(f"Starting public scraping with {self.num_workers} concurrent workers...")
+            logger.info(f"Starting public scraping of {total_bids} bids with {self.num_workers} concurrent workers...")
+
+            # One writer saves what the workers scrape, so database commits
+            # never hold up a worker
+            write_queue: asyncio.Queue = asyncio.Queue()
+            writer_task = asyncio.create_task(self._writer(write_queue))
 
             # Create worker tasks
             worker_tasks = [
-                self._worker(worker_id, worker_pages[worker_id], work_chunks[worker_id])
+                self._worker(worker_id, worker_pages[worker_id], bid_queue, total_bids, write_queue)
                 for worker_id in range(self.num_workers)
             ]
 
-            # Run all workers concurrently and wait for completion
-            worker_results = await asyncio.gather(*worker_tasks, return_exceptions=True)
-
-            # Step 8: Close worker pages (but not main_page)
-            logger.debug("Closing worker pages...")
-            for page in worker_pages:
-                if page != self.main_page:
-                    try:
-                        await page.close()
-                    except Exception as e:
-                        logger.debug(f"Error closing worker page: {e}")
+            # Run all workers concurrently and wait for completion, then let
+            # the writer save the last batch
+            try:
+                worker_results = await asyncio.gather(*worker_tasks, return_exceptions=True)
+            finally:
+                write_queue.put_nowait(_WRITE_DONE)
+                results['new_records'] += await writer_task
 
-            # Step 9: Aggregate results
+            # Step 8: Aggregate results
             for worker_result in worker_results:
                 if isinstance(worker_result, Exception):
                     logger.error(f"Worker failed with exception: {worker_result}")
                     results['errors'] += 1
                 elif isinstance(worker_result, dict):
                     results['total_scraped'] += worker_result.get('scraped', 0)
-                    results['new_records'] += worker_result.get('new_records', 0)
                     results['errors'] += worker_result.get('errors', 0)
 
             results['success'] = True
 
         except Exception as e:
-            logger.error(f"Public scraping session failed: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Public scraping session failed: {str(e)}")
             results['success'] = False
 
         finally:
@@ -221,27 +292,37 @@ class PublicPhilGEPSScraper:
 
         return results
 
-    async def _worker(self, worker_id: int, page: Page, bid_list: List[Dict]) -> Dict:
+    async def _worker(self, worker_id: int, page: Page, bid_queue: asyncio.Queue, total_bids: int,
+                      write_queue: asyncio.Queue) -> Dict:
         """
-        Worker coroutine that processes assigned bids concurrently.
+        Worker coroutine that pulls bids from the shared queue until it is empty.
+
+        Scraped bids are handed to the writer through write_queue.
 
         Args:
             worker_id: Worker identifier (0-based)
             page: Playwright Page instance (tab) for this worker
-            bid_list: List of bids to scrape
+            bid_queue: Queue of bid summaries shared by all workers
+            total_bids: Number of bids queued at start (for progress logs)
+            write_queue: Queue consumed by _writer
 
         Returns:
             dict: Worker results
         """
         result = {
             'scraped': 0,
-            'new_records': 0,
             'errors': 0
         }
 
-        logger.info(f"[Worker {worker_id+1}] Started with {len(bid_list)} bids")
+        logger.info(f"[Worker {worker_id+1}] Started")
 
-        for idx, bid_summary in enumerate(bid_list, 1):
+        # Per-bid delay bounds; settings don't change during a run
+        min_delay = settings.REQUEST_DELAY_SECONDS * 0.8
+        max_delay = settings.REQUEST_DELAY_SECONDS * 1.5
+
+        while not bid_queue.empty():
+            bid_summary = bid_queue.get_nowait()
+            idx = total_bids - bid_queue.qsize()
             try:
                 # Use actual URL from listing page (handles both viewBidNotice and viewLiveTenderDetails formats)
                 detail_url = bid_summary.get('url') or self.PUBLIC_DETAIL_URL_TEMPLATE.format(
@@ -254,21 +335,17 @@ class PublicPhilGEPSScraper:
                 if bid_data:
                     # Validate that we have a reference number before saving
                     if not bid_data.get('reference_number'):
-                        logger.warning(f"[Worker {worker_id+1}] ({idx}/{len(bid_list)}) ⚠️  Skipping bid {bid_summary['reference_number']}: Parser returned NULL reference_number (likely old/incompatible HTML structure)")
+                        logger.warning(f"[Worker {worker_id+1}] ({idx}/{total_bids}) ⚠️  Skipping bid {bid_summary['reference_number']}: Parser returned NULL reference_number (likely old/incompatible HTML structure)")
                         result['errors'] += 1
                     else:
-                        # Save to database
-                        self.db.save_bid_notice(bid_data)
+                        # Hand off to the writer
+                        write_queue.put_nowait(bid_data)
 
-                        result['new_records'] += 1
                         result['scraped'] += 1
-                        logger.info(f"[Worker {worker_id+1}] ({idx}/{len(bid_list)}) ✅ Saved: {bid_data['reference_number']}")
+                        logger.info(f"[Worker {worker_id+1}] ({idx}/{total_bids}) ✅ Scraped: {bid_data['reference_number']}")
 
                 # Rate limiting - human-like random delay
-                delay = HumanBehavior.random_delay(
-                    min_seconds=settings.REQUEST_DELAY_SECONDS * 0.8,
-                    max_seconds=settings.REQUEST_DELAY_SECONDS * 1.5
-                )
+                delay = HumanBehavior.random_delay(min_seconds=min_delay, max_seconds=max_delay)
                 logger.debug(f"[Worker {worker_id+1}] Waiting {delay:.2f}s before next request")
                 await asyncio.sleep(delay)
 
@@ -280,6 +357,41 @@ class PublicPhilGEPSScraper:
         logger.info(f"[Worker {worker_id+1}] Completed: {result['scraped']} scraped, {result['errors']} errors")
         return result
 
+    async def _writer(self, write_queue: asyncio.Queue) -> int:
+        """
+        Save scraped bids from write_queue until _WRITE_DONE arrives.
+
+        Bids are saved in batches of settings.SAVE_BATCH_SIZE on a worker
+        thread, so scraping continues while a batch commits; the last
+        partial batch is saved when _WRITE_DONE arrives.
+
+        Args:
+            write_queue: Queue the workers put scraped bid dictionaries on
+
+        Returns:
+            int: Number of bid notices saved
+        """
+        saved = 0
+        batch = []
+
+        while True:
+            item = await write_queue.get()
+            done = item is _WRITE_DONE
+            if not done:
+                batch.append(item)
+
+            if batch and (done or len(batch) >= settings.SAVE_BATCH_SIZE):
+                try:
+                    count = await asyncio.to_thread(self.db.save_bid_notices, batch)
+                    saved += count
+                    logger.info(f"💾 Saved {count}/{len(batch)} bids")
+                except Exception as e:
+                    logger.error(f"Error saving batch of {len(batch)} bids: {str(e)}")
+                batch = []
+
+            if done:
+                return saved
+
     async def _scrape_bid_details(self, page: Page, url: str) -> Optional[Dict]:
         """
         Scrape full details from a public bid notice page.
@@ -291,6 +403,11 @@ class PublicPhilGEPSScraper:
         Returns:
             dict: Bid notice data or None if failed
         """
+        if self.http is not None and settings.HTTP_DETAIL_FETCH:
+            bid_data = await self._fetch_bid_details(url)
+            if bid_data is not None:
+                return bid_data
+
         try:
             # Navigate to bid detail page
             await page.goto(url, wait_until='domcontentloaded')
@@ -301,9 +418,8 @@ class PublicPhilGEPSScraper:
             # Get page HTML
             html = await page.content()
 
-            # Parse bid details (reuse existing parser)
-            parser = PhilGEPSParser(html)
-            bid_data = parser.parse_bid_notice()
+            # Parse bid details (reuse existing parser) without blocking other workers
+            bid_data, _ = await asyncio.to_thread(_parse_bid_page, html)
 
             # Add source URL
             bid_data['url'] = url
@@ -317,6 +433,44 @@ class PublicPhilGEPSScraper:
             logger.error(f"Error scraping bid details from {url}: {str(e)}")
             return None
 
+    async def _fetch_bid_details(self, url: str) -> Optional[Dict]:
+        """
+        Fetch and parse a bid notice page over plain HTTP (no rendering).
+
+        Args:
+            url: Full URL of the public bid notice detail page
+
+        Returns:
+            dict: Bid notice data, or None if the page should be rendered
+            in the browser instead
+        """
+        try:
+            response = await self.http_limiter.get(self.http, url)
+            response.raise_for_status()
+
+            bid_data, preview_hrefs = await asyncio.to_thread(_parse_bid_page, response.text)
+
+            # No reference number usually means a challenge or JS-only page
+            if not bid_data.get('reference_number'):
+                logger.debug(f"HTTP fetch of {url} did not parse, rendering in browser")
+                return None
+
+            bid_data['url'] = url
+
+            # The preview modal is a plain page too; fetch it directly
+            if preview_hrefs:
+                preview = await self.http_limiter.get(self.http, urljoin(url, preview_hrefs[0]))
+                preview.raise_for_status()
+                bid_data['documents'] = await asyncio.to_thread(_parse_document_page, preview.text)
+            else:
+                bid_data['documents'] = []
+
+            return bid_data
+
+        except Exception as e:
+            logger.debug(f"HTTP fetch failed for {url}, rendering in browser: {str(e)}")
+            return None
+
     async def _scrape_document_links(self, page: Page, reference_number: str) -> List[Dict]:
         """
         Scrape PDF document links from the preview modal.
@@ -338,17 +492,16 @@ class PublicPhilGEPSScraper:
                 link_count = await preview_link.count()
 
                 if link_count == 0:
-                    # Fallback: look for any facebox link
-                    all_facebox = page.locator('a[rel="facebox"]')
-                    facebox_count = await all_facebox.count()
-
-                    for i in range(facebox_count):
-                        href = await all_facebox.nth(i).get_attribute('href')
-                        if href and 'tender_doc_view' in href:
-                            preview_link = all_facebox.nth(i)
-                            break
-
-                if await preview_link.count() > 0:
+                    # Fallback: look for any facebox link (all hrefs in one round trip)
+                    hrefs = await page.eval_on_selector_all(
+                        'a[rel="facebox"]', "links => links.map(a => a.getAttribute('href') || '')"
+                    )
+                    target_idx = next((i for i, href in enumerate(hrefs) if 'tender_doc_view' in href), None)
+                    if target_idx is not None:
+                        preview_link = page.locator('a[rel="facebox"]').nth(target_idx)
+                        link_count = 1
+
+                if link_count > 0:
                     await preview_link.first.click()
 
                     # Human-like delay for modal to load
@@ -357,8 +510,7 @@ class PublicPhilGEPSScraper:
 
                     # Parse document links from modal
                     html = await page.content()
-                    parser = PhilGEPSParser(html)
-                    return parser.parse_document_links()
+                    return await asyncio.to_thread(_parse_document_page, html)
 
             except Exception as e:
                 logger.debug(f"Could not open preview modal for {reference_number}: {str(e)}")
@@ -369,6 +521,44 @@ class PublicPhilGEPSScraper:
             logger.error(f"Error scraping documents for {reference_number}: {str(e)}")
             return []
 
+    async def ensure_browser(self):
+        """Launch the browser unless one from a previous run is still usable."""
+        if self.main_page is not None and not self.main_page.is_closed():
+            if self._browser_headless == settings.HEADLESS_MODE:
+                logger.info("Reusing open browser from previous run")
+                return
+            logger.info("HEADLESS_MODE changed, relaunching browser")
+
+        await self.close_browser()
+        logger.info("Initializing async browser...")
+        await self._init_browser()
+        self._browser_headless = settings.HEADLESS_MODE
+
+    async def _get_worker_pages(self) -> List[Page]:
+        """
+        Get one page per worker, opening new stealth tabs only as needed.
+
+        Returns:
+            list: main_page followed by num_workers - 1 extra tabs
+        """
+        # Drop tabs that were closed since the last run
+        self.worker_pages = [page for page in self.worker_pages if not page.is_closed()]
+
+        if self.num_workers == 1:
+            logger.info(f"Using main page as single worker (no new tabs)...")
+        else:
+            logger.info(f"Preparing {self.num_workers} browser tabs with stealth...")
+        logger.info(f"  Worker 1: reusing main page")
+
+        for i in range(len(self.worker_pages) + 1, self.num_workers):
+            page = await self.context.new_page()
+            page.set_default_timeout(settings.BROWSER_TIMEOUT)
+
+            self.worker_pages.append(page)
+            logger.info(f"  Worker {i+1}: ready")
+
+        return [self.main_page] + self.worker_pages[:self.num_workers - 1]
+
     async def _init_browser(self):
         """Initialize async browser with stealth."""
         try:
@@ -407,8 +597,8 @@ class PublicPhilGEPSScraper:
                     self.main_page = await self.context.new_page()
 
                 # Apply stealth JavaScript injections
-                await self.stealth.apply_stealth(self.main_page)
-                logger.info("✓ Stealth measures applied to main page")
+                await self.stealth.apply_stealth_context(self.context)
+                logger.info("✓ Stealth measures applied to browser context")
             else:
                 logger.info("Using temporary browser profile with stealth")
 
@@ -423,8 +613,12 @@ class PublicPhilGEPSScraper:
                 self.main_page = await self.context.new_page()
 
                 # Apply stealth JavaScript injections
-                await self.stealth.apply_stealth(self.main_page)
-                logger.info("✓ Stealth measures applied to main page")
+                await self.stealth.apply_stealth_context(self.context)
+                logger.info("✓ Stealth measures applied to browser context")
+
+            if settings.BLOCK_SUBRESOURCES:
+                await self.context.route("**/*", self._route_handler)
+                logger.debug(f"Blocking subresources: {sorted(BLOCKED_RESOURCE_TYPES)}")
 
             self.main_page.set_default_timeout(settings.BROWSER_TIMEOUT)
             logger.info("Async browser initialized successfully")
@@ -433,6 +627,43 @@ class PublicPhilGEPSScraper:
             logger.error(f"Failed to initialize async browser: {str(e)}")
             raise
 
+    async def _init_http_client(self):
+        """Create the HTTP client for listing and detail pages, sharing the browser's cookies and user agent."""
+        try:
+            user_agent = await self.main_page.evaluate("navigator.userAgent")
+            context_options = self.stealth.get_context_options()
+            # One pooled client for every fetch: connections (and TLS sessions)
+            # are reused, with enough keep-alive slots for HTTP_MAX_PER_HOST
+            self.http = httpx.AsyncClient(
+                headers={'User-Agent': user_agent, **context_options['extra_http_headers']},
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_PER_HOST,
+                    max_keepalive_connections=settings.HTTP_MAX_PER_HOST,
+                    keepalive_expiry=60
+                ),
+                verify=not context_options['ignore_https_errors'],
+                timeout=settings.BROWSER_TIMEOUT / 1000,
+                follow_redirects=True
+            )
+            for cookie in await self.context.cookies():
+                self.http.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+                )
+            logger.info("HTTP client initialized")
+
+        except Exception as e:
+            logger.warning(f"Could not initialize HTTP client, using browser only: {str(e)}")
+            self.http = None
+
+    @staticmethod
+    async def _route_handler(route):
+        """Abort requests for resources the scraper never reads."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _get_all_bids_with_pagination(self) -> List[Dict]:
         """Get all bids from public index with pagination."""
         all_bids = []
@@ -449,15 +680,20 @@ class PublicPhilGEPSScraper:
             if total_pages and total_pages > 1:
                 logger.info(f"Found {total_pages} total pages, scraping all pages...")
 
-                for page_num in range(2, total_pages + 1):
+                remaining_pages = list(range(2, total_pages + 1))
+                if self.http is not None and settings.HTTP_LISTING_CONCURRENCY > 0:
+                    remaining_pages = await self._fetch_listing_pages(remaining_pages, all_bids)
+
+                for page_num in remaining_pages:
                     try:
                         logger.info(f"Getting bids from page {page_num} of {total_pages}...")
                         next_page_url = self._build_pagination_url(page_num)
                         await self.main_page.goto(next_page_url, wait_until='domcontentloaded')
 
                         # Human-like delay between pagination
-                        delay = HumanBehavior.random_delay(1.5, 3.5)
-                        await asyncio.sleep(delay)
+                        delay = HumanBehavior.random_delay(1.5, 3.5) * settings.HUMAN_DELAY_MULT
+                        if delay > 0:
+                            await asyncio.sleep(delay)
 
                         page_bids = await self._get_bid_list()
                         all_bids.extend(page_bids)
@@ -465,50 +701,115 @@ class PublicPhilGEPSScraper:
                         logger.error(f"Error scraping page {page_num}: {str(e)}")
                         continue
 
-            return all_bids
+            return self._dedupe_bids(all_bids)
 
         except Exception as e:
             logger.error(f"Error in pagination: {str(e)}")
-            return all_bids
+            return self._dedupe_bids(all_bids)
+
+    @staticmethod
+    def _dedupe_bids(bids: List[Dict]) -> List[Dict]:
+        """
+        Drop repeated reference numbers, keeping the first listing of each.
+
+        Bids posted mid-scrape shift rows across page boundaries, so the
+        same bid can appear on two listing pages.
+
+        Args:
+            bids: Bid summaries in listing order
+
+        Returns:
+            list: Bid summaries with unique reference numbers
+        """
+        unique = {}
+        for bid in bids:
+            unique.setdefault(bid['reference_number'], bid)
+
+        if len(unique) < len(bids):
+            logger.info(f"Dropped {len(bids) - len(unique)} bids listed on more than one page")
+        return list(unique.values())
+
+    async def _fetch_listing_pages(self, page_nums: List[int], all_bids: List[Dict]) -> List[int]:
+        """
+        Fetch listing pages concurrently over HTTP.
+
+        Args:
+            page_nums: Page numbers to fetch
+            all_bids: Bid list to extend, in page order
+
+        Returns:
+            list: Page numbers that failed and still need the browser
+        """
+        semaphore = asyncio.Semaphore(settings.HTTP_LISTING_CONCURRENCY)
+
+        async def fetch_page(page_num: int) -> Optional[List[Dict]]:
+            async with semaphore:
+                try:
+                    response = await self.http_limiter.get(self.http, self._build_pagination_url(page_num))
+                    response.raise_for_status()
+                    return await asyncio.to_thread(self._parse_bid_list_html, response.text)
+                except Exception as e:
+                    logger.debug(f"HTTP fetch of listing page {page_num} failed: {str(e)}")
+                    return None
+
+        logger.info(f"Fetching {len(page_nums)} listing pages over HTTP ({settings.HTTP_LISTING_CONCURRENCY} at a time)...")
+        page_results = await asyncio.gather(*(fetch_page(page_num) for page_num in page_nums))
+
+        failed = []
+        for page_num, page_bids in zip(page_nums, page_results):
+            # An empty table is treated as a failed fetch (challenge page or JS-only response)
+            if page_bids:
+                all_bids.extend(page_bids)
+            else:
+                failed.append(page_num)
+
+        if failed:
+            logger.warning(f"{len(failed)} listing pages need the browser: {failed}")
+        return failed
 
     async def _get_bid_list(self) -> List[Dict]:
         """Extract bid list from current page."""
         try:
-            html = await self.main_page.content()
-            soup = BeautifulSoup(html, 'lxml')
+            rows = await self.main_page.evaluate(_LISTING_ROWS_JS)
+            return [
+                self._bid_summary(reference_number, href, title)
+                for reference_number, href, title in rows
+            ]
+
+        except Exception as e:
+            logger.error(f"Error getting bid list: {str(e)}")
+            return []
+
+    def _parse_bid_list_html(self, html) -> List[Dict]:
+        """
+        Extract bid list from listing page HTML.
+
+        Args:
+            html: Listing page HTML (str or bytes)
+
+        Returns:
+            list: Bid summaries with reference_number, title and url
+        """
+        try:
+            tree = lxml_html.fromstring(html)
 
             bids = []
-            rows = soup.select('tbody tr')
 
-            for row in rows:
+            for row in _XP_LISTING_ROWS(tree):
                 try:
                     # Extract reference number and URL
-                    ref_link = row.select_one('td:nth-of-type(1) a')
-                    if not ref_link:
+                    ref_links = _XP_ROW_REF_LINK(row)
+                    if not ref_links:
                         continue
-
-                    reference_number = ref_link.get_text(strip=True)
-
-                    # Extract actual href - use the real URL from the page
-                    href = ref_link.get('href', '')
-                    # Build full URL if href is relative
-                    if href.startswith('/'):
-                        detail_url = f"https://philgeps.gov.ph{href}"
-                    elif href.startswith('http'):
-                        detail_url = href
-                    else:
-                        # Fallback to template if href is invalid
-                        detail_url = self.PUBLIC_DETAIL_URL_TEMPLATE.format(bid_id=reference_number)
+                    ref_link = ref_links[0]
 
                     # Extract title
-                    title_cell = row.select_one('td:nth-of-type(2)')
-                    title = title_cell.get_text(strip=True) if title_cell else ''
+                    title_cells = _XP_ROW_TITLE_CELL(row)
+                    title = stripped_text(title_cells[0]) if title_cells else ''
 
-                    bids.append({
-                        'reference_number': reference_number,
-                        'title': title,
-                        'url': detail_url
-                    })
+                    bids.append(self._bid_summary(
+                        stripped_text(ref_link), ref_link.get('href', ''), title
+                    ))
 
                 except Exception as e:
                     logger.debug(f"Error parsing row: {str(e)}")
@@ -517,25 +818,42 @@ class PublicPhilGEPSScraper:
             return bids
 
         except Exception as e:
-            logger.error(f"Error getting bid list: {str(e)}")
+            logger.error(f"Error parsing bid list: {str(e)}")
             return []
 
+    def _bid_summary(self, reference_number: str, href: str, title: str) -> Dict:
+        """
+        Build a bid summary from one listing row.
+
+        Args:
+            reference_number: Reference number (the row's link text)
+            href: The link's href, used as the detail URL
+            title: Bid title
+
+        Returns:
+            dict: Bid summary with reference_number, title and url
+        """
+        # Build full URL if href is relative
+        if href.startswith('/'):
+            detail_url = f"https://philgeps.gov.ph{href}"
+        elif href.startswith('http'):
+            detail_url = href
+        else:
+            # Fallback to template if href is invalid
+            detail_url = self.PUBLIC_DETAIL_URL_TEMPLATE.format(bid_id=reference_number)
+
+        return {
+            'reference_number': reference_number,
+            'title': title,
+            'url': detail_url
+        }
+
     async def _get_total_pages(self) -> Optional[int]:
         """Extract total number of pages from pagination info."""
         try:
             html = await self.main_page.content()
-            soup = BeautifulSoup(html, 'lxml')
-
-            paginator = soup.find('div', class_='paginator')
-            if paginator:
-                page_info = paginator.find('p')
-                if page_info:
-                    text = page_info.get_text(strip=True)
-                    match = re.search(r'Page\s+\d+\s+of\s+(\d+)', text)
-                    if match:
-                        return int(match.group(1))
-
-            return None
+            match = _TOTAL_PAGES_RE.search(_XP_PAGINATOR_TEXT(lxml_html.fromstring(html)))
+            return int(match.group(1)) if match else None
 
         except Exception as e:
             logger.error(f"Error getting total pages: {str(e)}")
@@ -562,18 +880,6 @@ class PublicPhilGEPSScraper:
 
         return f"{self.PUBLIC_INDEX_URL}?{urlencode(params)}"
 
-    def _split_work(self, items: List, num_chunks: int) -> List[List]:
-        """Split work evenly among workers using round-robin."""
-        chunks = [[] for _ in range(num_chunks)]
-        for idx, item in enumerate(items):
-            worker_id = idx % num_chunks
-            chunks[worker_id].append(item)
-        return chunks
-
-    def _is_already_scraped(self, reference_number: str) -> bool:
-        """Check if bid already exists in database."""
-        return self.db.bid_exists(reference_number)
-
     def _log_session(self, results: Dict):
         """Log scraping session to database."""
         try:
@@ -594,8 +900,34 @@ class PublicPhilGEPSScraper:
             logger.error(f"Error logging session: {str(e)}")
 
     async def _cleanup(self):
+        """Cleanup per-run resources, and the browser unless it is kept open."""
+        try:
+            # Cookies can change between runs, so the HTTP client is per run
+            if self.http:
+                await self.http.aclose()
+                self.http = None
+
+        except Exception as e:
+            logger.error(f"Error closing HTTP client: {str(e)}")
+
+        if not self.keep_browser_open:
+            await self.close_browser()
+
+    async def close(self):
+        """Close everything, including a browser kept open between runs."""
+        await self._cleanup()
+        await self.close_browser()
+
+    async def close_browser(self):
         """Cleanup browser resources."""
+        if not (self.playwright or self.browser or self.context):
+            return
+
         try:
+            for page in self.worker_pages:
+                if not page.is_closed():
+                    await page.close()
+
             if self.main_page:
                 await self.main_page.close()
 
@@ -613,6 +945,14 @@ class PublicPhilGEPSScraper:
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
 
+        finally:
+            self.worker_pages = []
+            self.main_page = None
+            self.context = None
+            self.browser = None
+            self.playwright = None
+            self._browser_headless = None
+
 
 async def main():
     """Main entry point for public scraper."""
@@ -4,15 +4,83 @@ from scraper.browser import BrowserHandler
 from scraper.auth import PhilGEPSAuth
 from scraper.parser import PhilGEPSParser
 from models.database import Database
-from models.schemas import BidNotice, ScrapingLog
+from models.schemas import BidNotice
 from config.settings import settings
 from utils.logger import logger
 from utils.retry import retry_on_failure
-import time
+from utils.rate_limit import TokenBucket
+import gzip
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from urllib.parse import urlencode, urljoin
+from lxml import etree
+import httpx
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# Preview modal link on a detail page (the document viewer URL is in href_path,
+# or in href on some pages)
+_XP_PREVIEW_HREF_PATH = etree.XPath("//a[@rel='facebox'][contains(@href_path, 'tender_doc_view')]/@href_path")
+_XP_PREVIEW_HREF = etree.XPath("//a[@rel='facebox'][contains(@href, 'tender_doc_view')]/@href")
+
+# Finds the Preview link among the facebox links in one round trip: the link
+# labelled "Preview" first, else the one whose href_path is the document viewer.
+# Returns its index in document.querySelectorAll('a[rel="facebox"]') or null.
+_PREVIEW_LINK_JS = """() => {
+    const links = Array.from(document.querySelectorAll('a[rel="facebox"]'));
+    let index = links.findIndex((a) => (a.textContent || '').toLowerCase().includes('preview'));
+    if (index < 0) {
+        index = links.findIndex((a) => (a.getAttribute('href_path') || '').includes('tender_doc_view'));
+    }
+    if (index < 0) return null;
+    const link = links[index];
+    return {index, hrefPath: link.getAttribute('href_path'), text: (link.textContent || '').trim()};
+}"""
+
+# Common search button selectors on the bid list filter form
+_SEARCH_BUTTON_SELECTORS = (
+    'button[type="submit"]',
+    'input[type="submit"]',
+    'button:has-text("Search")',
+    'button:has-text("Filter")',
+    '.btn-search',
+    '#searchButton',
+)
+
+# Elements that show the facebox modal (or its loading indicator) is open
+_MODAL_SELECTORS = (
+    '#facebox',
+    '#facebox_overlay',
+    '.facebox',
+    'div[id*="facebox"]',
+    'div[class*="facebox"]',
+    '#loading',  # Facebox loading indicator
+    '.popup',
+    '.modal',
+)
+
+# Paginator text like "Page 1 of 13, showing 20 record(s) out of 252 total"
+_TOTAL_PAGES_RE = re.compile(r'Page\s+\d+\s+of\s+(\d+)')
+
+
+def _save_debug_html(name: str, html: str) -> None:
+    """
+    Save a page the parser could not use, if DEBUG_SAVE_HTML is enabled.
+
+    Args:
+        name: File name stem, e.g. 'bid_list_page'
+        html: Page HTML
+    """
+    if not settings.DEBUG_SAVE_HTML:
+        logger.debug(f"Page HTML not saved ({len(html)} chars): {html[:200]!r}")
+        return
+
+    settings.DEBUG_HTML_DIR.mkdir(parents=True, exist_ok=True)
+    debug_file = settings.DEBUG_HTML_DIR / f"{name}.html.gz"
+    with gzip.open(debug_file, 'wt', encoding='utf-8', compresslevel=1) as f:
+        f.write(html)
+    logger.info(f"Saved page HTML to {debug_file}")
 
 
 class PhilGEPSScraper:
@@ -24,6 +92,20 @@ class PhilGEPSScraper:
         self.db = Database()
         self.page = None
         self.auth = None
+        self.http: Optional[httpx.Client] = None
+        # Paces every request to PhilGEPS, browser or HTTP: each fetch worker
+        # gets one request per REQUEST_DELAY_SECONDS on average
+        delay = settings.REQUEST_DELAY_SECONDS
+        self.limiter = TokenBucket(settings.HTTP_FETCH_WORKERS / delay if delay > 0 else 0)
+        # Filter query parameters are fixed for the run; build them once
+        self._filter_params = {
+            name: value for name, value in (
+                ('searchPublishDateFrom', settings.FILTER_PUBLISH_DATE_FROM),
+                ('searchPublishDateTo', settings.FILTER_PUBLISH_DATE_TO),
+                ('searchClassification', settings.FILTER_CLASSIFICATION),
+                ('searchBussinessCategory', settings.FILTER_BUSINESS_CATEGORY),
+            ) if value
+        }
 
     def run(self) -> Dict:
         """
@@ -55,6 +137,9 @@ class PhilGEPSScraper:
             if not self.auth.login():
                 raise Exception("Authentication failed")
 
+            if settings.BLOCK_SUBRESOURCES:
+                self.browser_handler.block_subresources()
+
             # Step 3: Navigate to bid notices list page
             # Using proper URL from BID_WORKFLOW.md
             self.browser_handler.navigate(settings.PHILGEPS_BID_LIST)
@@ -62,36 +147,64 @@ class PhilGEPSScraper:
             # Step 3.5: Apply filters if configured
             self._apply_filters()
 
+            # HTTP client for listing and detail pages, sharing the logged-in session
+            self._init_http_client()
+
             # Step 4: Get list of bid notices from all pages
             bid_list = self._get_all_bids_with_pagination()
             logger.info(f"Found {len(bid_list)} total bid notices across all pages")
 
-            # Step 5: Process each bid notice
+            # Step 5: Skip bids that are already in the database (one lookup for the whole list)
+            already_scraped = self.db.get_existing_reference_numbers(
+                [bid_summary['reference_number'] for bid_summary in bid_list]
+            )
+            bids_to_scrape = []
             for bid_summary in bid_list:
-                try:
-                    # Check if already scraped
-                    if self._is_already_scraped(bid_summary['reference_number']):
-                        logger.info(f"⏭️  Skipping already scraped bid: {bid_summary['reference_number']} - {bid_summary.get('title', 'N/A')[:60]}")
-                        results['skipped'] += 1
-                        continue
+                if bid_summary['reference_number'] in already_scraped:
+                    logger.info(f"⏭️  Skipping already scraped bid: {bid_summary['reference_number']} - {bid_summary.get('title', 'N/A')[:60]}")
+                    results['skipped'] += 1
+                else:
+                    bids_to_scrape.append(bid_summary)
+
+            # Scraped bids waiting to be saved in one transaction
+            pending = []
+
+            # Step 6: Fetch bid details over HTTP on a thread pool, sharing the
+            # logged-in session's cookies. Playwright's sync API is tied to this
+            # thread, so bids the HTTP fetch can't handle go through the
+            # browser here, one at a time, as before
+            with ThreadPoolExecutor(max_workers=settings.HTTP_FETCH_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._fetch_bid_details, bid_summary['url']): bid_summary
+                    for bid_summary in bids_to_scrape
+                }
+
+                for future in as_completed(futures):
+                    bid_summary = futures[future]
+                    try:
+                        bid_data = future.result()
 
-                    # Scrape full bid details
-                    bid_data = self._scrape_bid_details(bid_summary['url'])
+                        if bid_data is None:
+                            # Scrape full bid details in the browser
+                            self.limiter.acquire()
+                            bid_data = self._scrape_bid_details(bid_summary['url'])
 
-                    if bid_data:
-                        # Save to database
-                        self.db.save_bid_notice(bid_data)
-                        results['new_records'] += 1
-                        results['total_scraped'] += 1
-                        logger.info(f"✅ Saved bid: {bid_data['reference_number']}")
+                        if bid_data:
+                            # Queue for the next batch save
+                            pending.append(bid_data)
+                            results['total_scraped'] += 1
+                            logger.info(f"✅ Scraped bid: {bid_data['reference_number']}")
 
-                    # Rate limiting - wait between requests
-                    time.sleep(settings.REQUEST_DELAY_SECONDS)
+                            if len(pending) >= settings.SAVE_BATCH_SIZE:
+                                self._save_pending(pending, results)
 
-                except Exception as e:
-                    logger.error(f"❌ Error processing bid {bid_summary.get('reference_number')}: {str(e)}")
-                    results['errors'] += 1
-                    continue
+                    except Exception as e:
+                        logger.error(f"❌ Error processing bid {bid_summary.get('reference_number')}: {str(e)}")
+                        results['errors'] += 1
+                        continue
+
+            # Save the last partial batch
+            self._save_pending(pending, results)
 
             results['success'] = True
 
@@ -143,18 +256,22 @@ class PhilGEPSScraper:
             if total_pages and total_pages > 1:
                 logger.info(f"Found {total_pages} total pages, scraping all pages...")
 
+                # Fetch the remaining pages over HTTP; any that fail are
+                # walked in the browser below
+                remaining_pages = list(range(2, total_pages + 1))
+                if self.http is not None:
+                    remaining_pages = self._fetch_listing_pages(remaining_pages, all_bids)
+
                 # Loop through remaining pages
-                for page_num in range(2, total_pages + 1):
+                for page_num in remaining_pages:
                     try:
                         logger.info(f"Getting bids from page {page_num} of {total_pages}...")
 
                         # Build pagination URL with filter parameters
                         next_page_url = self._build_pagination_url(page_num)
+                        self.limiter.acquire()
                         self.browser_handler.navigate(next_page_url)
 
-                        # Wait for page to load
-                        time.sleep(2)
-
                         # Get bids from this page
                         page_bids = self._get_bid_list()
                         all_bids.extend(page_bids)
@@ -177,6 +294,47 @@ class PhilGEPSScraper:
             # Return what we have so far
             return all_bids
 
+    def _fetch_listing_pages(self, page_nums: List[int], all_bids: List[Dict]) -> List[int]:
+        """
+        Fetch listing pages over HTTP on a thread pool.
+
+        Args:
+            page_nums: Page numbers to fetch
+            all_bids: Bid list to extend, in page order
+
+        Returns:
+            list: Page numbers that failed and still need the browser
+        """
+        def fetch_page(page_num: int) -> List[Dict]:
+            try:
+                self.limiter.acquire()
+                response = self.http.get(self._build_pagination_url(page_num))
+                response.raise_for_status()
+                return self._parse_bid_list(response.text)
+            except Exception as e:
+                logger.debug(f"HTTP fetch of listing page {page_num} failed: {str(e)}")
+                return []
+
+        workers = settings.HTTP_FETCH_WORKERS
+        logger.info(f"Fetching {len(page_nums)} listing pages over HTTP ({workers} workers)...")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fetch_page, page_num) for page_num in page_nums]
+
+            failed = []
+            for page_num, future in zip(page_nums, futures):
+                page_bids = future.result()
+                # An empty table is treated as a failed fetch (e.g. session not carried over)
+                if page_bids:
+                    all_bids.extend(page_bids)
+                    logger.debug(f"Page {page_num}: Found {len(page_bids)} bids, total so far: {len(all_bids)}")
+                else:
+                    failed.append(page_num)
+
+        if failed:
+            logger.warning(f"{len(failed)} listing pages need the browser: {failed}")
+        return failed
+
     def _build_pagination_url(self, page_num: int) -> str:
         """
         Build pagination URL with filter parameters preserved.
@@ -187,28 +345,11 @@ class PhilGEPSScraper:
         Returns:
             str: Complete URL with page number and filter parameters
         """
-        from urllib.parse import urlencode
-
-        # Base parameters
         params = {
             'page': page_num,
-            'direction': 'Tenders.tender_start_datetime+desc'
+            'direction': 'Tenders.tender_start_datetime+desc',
+            **self._filter_params
         }
-
-        # Add filter parameters if configured
-        if settings.FILTER_PUBLISH_DATE_FROM:
-            params['searchPublishDateFrom'] = settings.FILTER_PUBLISH_DATE_FROM
-
-        if settings.FILTER_PUBLISH_DATE_TO:
-            params['searchPublishDateTo'] = settings.FILTER_PUBLISH_DATE_TO
-
-        if settings.FILTER_CLASSIFICATION:
-            params['searchClassification'] = settings.FILTER_CLASSIFICATION
-
-        if settings.FILTER_BUSINESS_CATEGORY:
-            params['searchBussinessCategory'] = settings.FILTER_BUSINESS_CATEGORY
-
-        # Build URL
         url = f"{settings.PHILGEPS_BID_LIST}?{urlencode(params)}"
         logger.debug(f"Built pagination URL: {url}")
 
@@ -225,24 +366,14 @@ class PhilGEPSScraper:
         """
         try:
             html = self.browser_handler.get_html()
-            soup = BeautifulSoup(html, 'lxml')
-
-            # Find pagination text
-            paginator = soup.find('div', class_='paginator')
-            if paginator:
-                # Look for the <p> tag with page info
-                page_info = paginator.find('p')
-                if page_info:
-                    # Extract from text like "Page 1 of 13, showing 20 record(s) out of 252 total"
-                    text = page_info.get_text(strip=True)
-                    logger.debug(f"Pagination info: {text}")
-
-                    # Extract total pages using regex
-                    match = re.search(r'Page\s+\d+\s+of\s+(\d+)', text)
-                    if match:
-                        total_pages = int(match.group(1))
-                        logger.info(f"Total pages: {total_pages}")
-                        return total_pages
+
+            # The paginator is the only place this text appears, so search the
+            # raw HTML instead of building a tree
+            match = _TOTAL_PAGES_RE.search(html)
+            if match:
+                total_pages = int(match.group(1))
+                logger.info(f"Total pages: {total_pages}")
+                return total_pages
 
             logger.debug("No pagination found, assuming single page")
             return None
@@ -277,7 +408,12 @@ class PhilGEPSScraper:
                 logger.info(f"  Business Category: {business_category}")
 
             # Wait for the filter inputs to be available
-            time.sleep(2)
+            try:
+                self.browser_handler.page.locator('#searchPublishDateFrom').wait_for(
+                    state='attached', timeout=5000
+                )
+            except PlaywrightTimeoutError:
+                logger.warning("Filter inputs did not appear, filters may not be applied")
 
             # Fill in "Publish Date From" if configured
             if date_from:
@@ -335,18 +471,8 @@ class PhilGEPSScraper:
 
             # Find and click the search/filter button
             try:
-                # Look for common search button selectors
-                search_button_selectors = [
-                    'button[type="submit"]',
-                    'input[type="submit"]',
-                    'button:has-text("Search")',
-                    'button:has-text("Filter")',
-                    '.btn-search',
-                    '#searchButton'
-                ]
-
                 button_clicked = False
-                for selector in search_button_selectors:
+                for selector in _SEARCH_BUTTON_SELECTORS:
                     try:
                         button = self.browser_handler.page.locator(selector).first
                         if button.count() > 0:
@@ -367,7 +493,7 @@ class PhilGEPSScraper:
                         pass
 
                 # Wait for results to load after applying filters
-                time.sleep(3)
+                self.browser_handler.page.wait_for_load_state('networkidle')
                 logger.info("Filters applied successfully")
 
             except Exception as e:
@@ -402,28 +528,19 @@ class PhilGEPSScraper:
                     logger.info("Found table element")
                 except Exception as e2:
                     logger.error(f"No table found on page: {e2}")
-                    # Save page HTML for debugging
-                    html = self.browser_handler.get_html()
-                    debug_file = 'debug_bid_list_page.html'
-                    with open(debug_file, 'w', encoding='utf-8') as f:
-                        f.write(html)
-                    logger.error(f"Saved page HTML to {debug_file} for debugging")
+                    _save_debug_html('bid_list_page', self.browser_handler.get_html())
                     return []
 
             # Get page HTML
             html = self.browser_handler.get_html()
 
             # Parse bid list
-            parser = PhilGEPSParser(html)
-            bids = parser.parse_bid_list_page()
+            bids = self._parse_bid_list(html)
 
-            # If no bids found, save HTML for debugging
+            # If no bids found, keep the HTML for debugging
             if len(bids) == 0:
-                logger.warning("Parser returned 0 bids, saving page HTML for debugging")
-                debug_file = 'debug_bid_list_page_no_results.html'
-                with open(debug_file, 'w', encoding='utf-8') as f:
-                    f.write(html)
-                logger.warning(f"Saved page HTML to {debug_file}")
+                logger.warning("Parser returned 0 bids")
+                _save_debug_html('bid_list_page_no_results', html)
 
             return bids
 
@@ -431,6 +548,19 @@ class PhilGEPSScraper:
             logger.error(f"Error getting bid list: {str(e)}")
             return []
 
+    @staticmethod
+    def _parse_bid_list(html: str) -> List[Dict]:
+        """
+        Parse bid notice summaries from listing page HTML.
+
+        Args:
+            html: Listing page HTML
+
+        Returns:
+            list: List of bid notice summaries
+        """
+        return PhilGEPSParser.for_list(html).parse_bid_list_page()
+
     @retry_on_failure(max_retries=3)
     def _scrape_bid_details(self, url: str) -> Dict:
         """
@@ -445,11 +575,9 @@ class PhilGEPSScraper:
         try:
             # Navigate to bid detail page
             full_url = url if url.startswith('http') else f"{settings.PHILGEPS_BASE_URL}{url}"
+            # navigate() waits for networkidle, so the page is already rendered
             self.browser_handler.navigate(full_url)
 
-            # Wait for content to load
-            time.sleep(2)
-
             # Get page HTML
             html = self.browser_handler.get_html()
 
@@ -469,12 +597,115 @@ class PhilGEPSScraper:
             logger.error(f"Error scraping bid details from {url}: {str(e)}")
             return None
 
+    def _save_pending(self, pending: List[Dict], results: Dict) -> None:
+        """
+        Save queued bids in one batch and empty the queue.
+
+        Args:
+            pending: Queued bid notice dictionaries (cleared in place)
+            results: Session results; new_records is incremented by the number saved
+        """
+        if not pending:
+            return
+
+        saved = self.db.save_bid_notices(pending)
+        results['new_records'] += saved
+        logger.info(f"💾 Saved {saved}/{len(pending)} bids")
+        pending.clear()
+
+    def _init_http_client(self) -> None:
+        """Create the HTTP client for listing and detail pages, sharing the browser's cookies and user agent."""
+        try:
+            user_agent = self.browser_handler.page.evaluate("navigator.userAgent")
+            self.http = httpx.Client(
+                headers={'User-Agent': user_agent},
+                verify=False,  # Browser context ignores HTTPS errors too
+                timeout=settings.BROWSER_TIMEOUT / 1000,
+                follow_redirects=True
+            )
+            for cookie in self.browser_handler.context.cookies():
+                self.http.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+                )
+            logger.info(f"HTTP client initialized ({settings.HTTP_FETCH_WORKERS} fetch workers)")
+
+        except Exception as e:
+            logger.warning(f"Could not initialize HTTP client, using browser only: {str(e)}")
+            self.http = None
+
+    def _fetch_bid_details(self, url: str) -> Optional[Dict]:
+        """
+        Fetch and parse a bid notice page over HTTP (runs on a worker thread).
+
+        Args:
+            url: URL of the bid notice detail page
+
+        Returns:
+            dict: Bid notice data, or None if the page should be scraped in
+            the browser instead
+        """
+        if self.http is None:
+            return None
+
+        full_url = url if url.startswith('http') else f"{settings.PHILGEPS_BASE_URL}{url}"
+        try:
+            self.limiter.acquire()
+            response = self.http.get(full_url)
+            response.raise_for_status()
+
+            parser = PhilGEPSParser(response.text)
+            bid_data = parser.parse_bid_notice()
+
+            # No reference number usually means the session or page needs the browser
+            if not bid_data.get('reference_number'):
+                return None
+
+            # No Preview link means the bid has no documents to list
+            preview_hrefs = _XP_PREVIEW_HREF_PATH(parser.tree) or _XP_PREVIEW_HREF(parser.tree)
+            if preview_hrefs:
+                documents = self._fetch_document_links(urljoin(full_url, preview_hrefs[0]))
+                if documents is None:
+                    return None
+            else:
+                documents = []
+
+            bid_data['url'] = full_url
+            bid_data['documents'] = documents
+            logger.info(f"Found {len(bid_data['documents'])} document(s) for bid {bid_data['reference_number']}")
+            return bid_data
+
+        except Exception as e:
+            logger.debug(f"HTTP fetch failed for {full_url}, using browser: {str(e)}")
+            return None
+
+    def _fetch_document_links(self, url: str) -> Optional[List[Dict]]:
+        """
+        GET the document viewer the Preview modal loads and parse its links.
+
+        Args:
+            url: Absolute tender_doc_view URL
+
+        Returns:
+            list: Document dictionaries, or None if the request failed
+        """
+        try:
+            self.limiter.acquire()
+            response = self.http.get(url, headers={'X-Requested-With': 'XMLHttpRequest'})
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug(f"Document viewer fetch failed for {url}: {str(e)}")
+            return None
+
+        return PhilGEPSParser.for_documents(response.text).parse_document_links()
+
     def _scrape_document_links(self, reference_number: str) -> List[Dict]:
         """
         Scrape PDF document links from the preview modal.
 
         The Preview link opens a facebox modal/popup that contains the PDF links.
-        We need to click the Preview link and wait for the modal to load.
+        The modal's URL (href_path) is fetched over HTTP when possible; otherwise
+        we click the Preview link and wait for the modal to load.
 
         Args:
             reference_number: Bid reference number
@@ -497,80 +728,39 @@ class PhilGEPSScraper:
                 # 1. rel="facebox"
                 # 2. Text content "Preview"
                 # 3. href_path attribute pointing to tender_doc_view
-
-                # Strategy 1: Look for link with text "Preview" and rel="facebox"
-                preview_link = self.browser_handler.page.locator('a[rel="facebox"]:has-text("Preview")')
-
-                link_count = preview_link.count()
-                logger.debug(f"Found {link_count} Preview link(s) with text 'Preview'")
-
-                # Strategy 2: If not found, look for any facebox link with tender_doc_view in href_path
-                if link_count == 0:
-                    all_facebox = self.browser_handler.page.locator('a[rel="facebox"]')
-                    facebox_count = all_facebox.count()
-                    logger.debug(f"Found {facebox_count} total facebox links, checking for tender_doc_view...")
-
-                    # Find the one with tender_doc_view in href_path
-                    for i in range(facebox_count):
-                        try:
-                            href_path = all_facebox.nth(i).get_attribute('href_path')
-                            link_text = all_facebox.nth(i).text_content()
-                            logger.debug(f"Facebox link {i}: text='{link_text}', href_path='{href_path}'")
-
-                            if href_path and 'tender_doc_view' in href_path:
-                                preview_link = all_facebox.nth(i)
-                                link_count = 1
-                                logger.debug(f"Found tender_doc_view link at index {i}")
-                                break
-                        except:
-                            continue
-
-                if link_count == 0:
+                page = self.browser_handler.page
+                match = page.evaluate(_PREVIEW_LINK_JS)
+                if match is None:
                     logger.warning("No Preview link found on the page")
                     return []
 
-                # Get link details for debugging
-                try:
-                    link_href = preview_link.get_attribute('href_path')
-                    link_text = preview_link.text_content()
-                    logger.debug(f"Clicking Preview link: text='{link_text}', href_path='{link_href}'")
-                except Exception as e:
-                    logger.debug(f"Could not get link details: {e}")
+                # Load the modal's content directly rather than opening it
+                if self.http is not None and match['hrefPath']:
+                    documents = self._fetch_document_links(urljoin(page.url, match['hrefPath']))
+                    if documents is not None:
+                        logger.debug(f"Fetched document viewer for bid {reference_number} over HTTP")
+                        return documents
+
+                preview_link = page.locator('a[rel="facebox"]').nth(match['index'])
+                logger.debug(f"Clicking Preview link: text='{match['text']}', href_path='{match['hrefPath']}'")
 
-                # Click the Preview link
+                # Click the Preview link and wait for the facebox request it fires
                 try:
-                    preview_link.click(timeout=5000)
-                    logger.debug("Preview link clicked successfully")
-                except Exception as e:
-                    logger.warning(f"Standard click failed: {e}, trying JavaScript click...")
-                    # Fallback to JavaScript click on the specific element with tender_doc_view
-                    self.browser_handler.page.evaluate(
-                        '() => { const links = document.querySelectorAll(\'a[rel="facebox"]\'); '
-                        'for (let link of links) { '
-                        '  if (link.getAttribute("href_path") && link.getAttribute("href_path").includes("tender_doc_view")) { '
-                        '    link.click(); break; '
-                        '  }'
-                        '}}'
-                    )
-                    logger.debug("JavaScript click executed on tender_doc_view link")
-
-                # Wait a moment for facebox to initialize
-                time.sleep(2)
+                    with page.expect_response(lambda r: 'tender_doc_view' in r.url, timeout=10000):
+                        try:
+                            preview_link.click(timeout=5000)
+                            logger.debug("Preview link clicked successfully")
+                        except Exception as e:
+                            logger.warning(f"Standard click failed: {e}, trying JavaScript click...")
+                            # Fallback to a JavaScript click on the same element
+                            preview_link.evaluate('link => link.click()')
+                            logger.debug("JavaScript click executed on Preview link")
+                except PlaywrightTimeoutError:
+                    logger.warning("No tender_doc_view response after clicking Preview")
 
                 # Try multiple selectors for the modal
-                modal_selectors = [
-                    '#facebox',
-                    '#facebox_overlay',
-                    '.facebox',
-                    'div[id*="facebox"]',
-                    'div[class*="facebox"]',
-                    '#loading',  # Facebox loading indicator
-                    '.popup',
-                    '.modal'
-                ]
-
                 modal_found = False
-                for selector in modal_selectors:
+                for selector in _MODAL_SELECTORS:
                     try:
                         element = self.browser_handler.page.locator(selector)
                         if element.count() > 0:
@@ -582,12 +772,12 @@ class PhilGEPSScraper:
 
                 if not modal_found:
                     logger.warning("No modal elements found after click, checking for direct content load...")
-                    # Maybe the content loaded directly without modal
-                    time.sleep(3)
-                else:
-                    # Wait for modal content to load
-                    logger.debug("Waiting for modal content to load...")
-                    time.sleep(5)  # Longer wait for AJAX
+
+                # The response is in; give facebox a moment to insert the links
+                try:
+                    page.locator('a[href*=".pdf"]').first.wait_for(state='attached', timeout=3000)
+                except PlaywrightTimeoutError:
+                    logger.debug("No PDF link appeared after the preview loaded")
 
                 # Try to find PDF links regardless of modal
                 try:
@@ -603,20 +793,17 @@ class PhilGEPSScraper:
 
                 # Save HTML for debugging if no documents found
                 if 'portal_documents' not in html and '.pdf' not in html:
-                    debug_file = f'debug_modal_bid_{reference_number}.html'
-                    with open(debug_file, 'w', encoding='utf-8') as f:
-                        f.write(html)
-                    logger.warning(f"No PDF content detected, saved HTML to {debug_file}")
+                    logger.warning("No PDF content detected")
+                    _save_debug_html(f'modal_bid_{reference_number}', html)
 
                 # Parse document links from the HTML
-                parser = PhilGEPSParser(html)
+                parser = PhilGEPSParser.for_documents(html)
                 documents = parser.parse_document_links()
 
                 # Close the modal by pressing Escape or clicking close button
                 try:
                     self.browser_handler.page.keyboard.press('Escape')
                     logger.debug("Pressed Escape to close modal")
-                    time.sleep(1)
                 except Exception as e:
                     logger.debug(f"Could not close modal with Escape: {e}")
 
@@ -633,27 +820,13 @@ class PhilGEPSScraper:
                 return documents
 
             except Exception as e:
-                logger.error(f"Error clicking Preview link or loading modal: {str(e)}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
+                logger.exception(f"Error clicking Preview link or loading modal: {str(e)}")
                 return []
 
         except Exception as e:
             logger.error(f"Error scraping document links for bid {reference_number}: {str(e)}")
             return []
 
-    def _is_already_scraped(self, reference_number: str) -> bool:
-        """
-        Check if bid notice has already been scraped.
-
-        Args:
-            reference_number: Bid reference number
-
-        Returns:
-            bool: True if already scraped
-        """
-        return self.db.bid_exists(reference_number)
-
     def _log_session(self, results: Dict) -> None:
         """
         Log scraping session to database.
@@ -662,16 +835,15 @@ class PhilGEPSScraper:
             results: Session results
         """
         try:
-            log_entry = ScrapingLog(
-                start_time=results['start_time'],
-                end_time=results['end_time'],
-                duration_seconds=results['duration_seconds'],
-                total_scraped=results['total_scraped'],
-                new_records=results['new_records'],
-                errors=results['errors'],
-                success=results['success']
-            )
-            self.db.save_scraping_log(log_entry)
+            self.db.save_scraping_log({
+                'start_time': results['start_time'],
+                'end_time': results['end_time'],
+                'duration_seconds': results['duration_seconds'],
+                'total_scraped': results['total_scraped'],
+                'new_records': results['new_records'],
+                'errors': results['errors'],
+                'success': results['success']
+            })
 
         except Exception as e:
             logger.error(f"Error logging session: {str(e)}")
@@ -679,6 +851,8 @@ class PhilGEPSScraper:
     def _cleanup(self) -> None:
         """Cleanup resources."""
         try:
+            if self.http:
+                self.http.close()
             if self.auth:
                 self.auth.logout()
             if self.browser_handler:
@@ -14,9 +14,11 @@ we implement custom techniques:
 - Chrome runtime evasion
 """
 
+import json
 import random
 from typing import Dict, List, Optional, Tuple
 from playwright.async_api import Page, BrowserContext
+from config.settings import settings
 
 
 class StealthConfig:
@@ -38,6 +40,10 @@ class StealthConfig:
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
     ]
 
+    # Relative weights for USER_AGENTS, roughly following desktop market
+    # share (Windows ~75%, macOS ~15%, Linux ~10%) so the mix looks organic
+    USER_AGENT_WEIGHTS = [0.25, 0.30, 0.20, 0.10, 0.05, 0.05, 0.05]
+
     # Realistic viewport sizes (common desktop resolutions)
     VIEWPORTS = [
         {"width": 1920, "height": 1080},
@@ -54,20 +60,84 @@ class StealthConfig:
         ["en-PH", "en", "tl"],
     ]
 
+    # navigator.platform reported by Chrome for each user agent OS token
+    PLATFORMS = {
+        "Windows": "Win32",
+        "Macintosh": "MacIntel",
+        "Linux": "Linux x86_64",
+    }
+
+    # Screen sizes that are common for each platform
+    PLATFORM_VIEWPORTS = {
+        "Win32": [
+            {"width": 1920, "height": 1080},
+            {"width": 1366, "height": 768},
+            {"width": 1536, "height": 864},
+            {"width": 1280, "height": 720},
+        ],
+        "MacIntel": [
+            {"width": 1440, "height": 900},
+            {"width": 1920, "height": 1080},
+        ],
+        "Linux x86_64": [
+            {"width": 1920, "height": 1080},
+            {"width": 1366, "height": 768},
+        ],
+    }
+
+    # Timezone matching the Philippine IP the scraper runs from
+    TIMEZONE_ID = "Asia/Manila"
+
     @classmethod
-    def get_random_user_agent(cls) -> str:
-        """Get a random realistic user agent."""
-        return random.choice(cls.USER_AGENTS)
+    def get_random_user_agent(cls, rng: Optional[random.Random] = None) -> str:
+        """Get a random realistic user agent, weighted by USER_AGENT_WEIGHTS."""
+        return (rng or random).choices(cls.USER_AGENTS, weights=cls.USER_AGENT_WEIGHTS)[0]
 
     @classmethod
-    def get_random_viewport(cls) -> Dict[str, int]:
+    def get_random_viewport(cls, rng: Optional[random.Random] = None) -> Dict[str, int]:
         """Get a random viewport size."""
-        return random.choice(cls.VIEWPORTS).copy()
+        return (rng or random).choice(cls.VIEWPORTS).copy()
 
     @classmethod
-    def get_random_languages(cls) -> List[str]:
+    def get_random_languages(cls, rng: Optional[random.Random] = None) -> List[str]:
         """Get random language preferences."""
-        return random.choice(cls.LANGUAGES).copy()
+        return (rng or random).choice(cls.LANGUAGES).copy()
+
+    @classmethod
+    def get_platform(cls, user_agent: str) -> str:
+        """Get the navigator.platform value matching a user agent."""
+        for token, platform in cls.PLATFORMS.items():
+            if token in user_agent:
+                return platform
+        return cls.PLATFORMS["Windows"]
+
+    @classmethod
+    def get_random_profile(cls, rng: Optional[random.Random] = None) -> Dict:
+        """
+        Get a random browser profile whose fingerprint fields agree.
+
+        The platform and viewport follow from the user agent, and the
+        locale is the first preferred language.
+
+        Args:
+            rng: Random generator to draw from (module random if None)
+
+        Returns:
+            Dict with user_agent, platform, viewport, languages, locale
+            and timezone_id
+        """
+        rng = rng or random
+        user_agent = cls.get_random_user_agent(rng)
+        platform = cls.get_platform(user_agent)
+        languages = cls.get_random_languages(rng)
+        return {
+            "user_agent": user_agent,
+            "platform": platform,
+            "viewport": rng.choice(cls.PLATFORM_VIEWPORTS[platform]).copy(),
+            "languages": languages,
+            "locale": languages[0],
+            "timezone_id": cls.TIMEZONE_ID,
+        }
 
 
 class PlaywrightStealth:
@@ -134,6 +204,13 @@ class PlaywrightStealth:
     }});
     """
 
+    # JavaScript to override platform (must agree with the user agent)
+    PLATFORM_OVERRIDE_TEMPLATE = """
+    Object.defineProperty(Navigator.prototype, 'platform', {{
+        get: () => {platform}
+    }});
+    """
+
     # JavaScript to fix WebGL vendor
     WEBGL_VENDOR_OVERRIDE = """
     const getParameter = WebGLRenderingContext.prototype.getParameter;
@@ -159,52 +236,86 @@ class PlaywrightStealth:
         user_agent: Optional[str] = None,
         viewport: Optional[Dict[str, int]] = None,
         languages: Optional[List[str]] = None,
+        profile: Optional[Dict] = None,
     ):
         """
         Initialize stealth configuration.
 
         Args:
-            user_agent: Custom user agent (random if None)
-            viewport: Custom viewport size (random if None)
-            languages: Custom language preferences (random if None)
+            user_agent: Custom user agent (from the profile if None)
+            viewport: Custom viewport size (from the profile if None)
+            languages: Custom language preferences (from the profile if None)
+            profile: Browser profile from StealthConfig.get_random_profile()
+                (random if None)
         """
-        self.user_agent = user_agent or StealthConfig.get_random_user_agent()
-        self.viewport = viewport or StealthConfig.get_random_viewport()
-        self.languages = languages or StealthConfig.get_random_languages()
+        # Own generator, so stealth profiles don't share the global random state
+        self._rng = random.Random()
+        profile = profile or StealthConfig.get_random_profile(self._rng)
+        self.user_agent = user_agent or profile['user_agent']
+        self.platform = StealthConfig.get_platform(self.user_agent)
+        self.viewport = viewport or profile['viewport']
+        self.languages = languages or profile['languages']
+        self.locale = self.languages[0]
+        self.timezone_id = profile.get('timezone_id', StealthConfig.TIMEZONE_ID)
+
+        # All overrides as one init script, each in its own scope so a failing
+        # override doesn't stop the rest
+        overrides = [
+            self.WEBDRIVER_OVERRIDE,
+            self.CHROME_RUNTIME_OVERRIDE,
+            self.PERMISSIONS_OVERRIDE,
+            self.PLUGINS_OVERRIDE,
+            self.WEBGL_VENDOR_OVERRIDE,
+            self.SCREEN_OVERRIDE,
+            self.LANGUAGES_OVERRIDE_TEMPLATE.format(languages=json.dumps(self.languages)),
+            self.PLATFORM_OVERRIDE_TEMPLATE.format(platform=json.dumps(self.platform)),
+        ]
+        self._init_script = "\n".join(
+            f"(() => {{ try {{{override}}} catch (e) {{}} }})();" for override in overrides
+        )
 
     async def apply_stealth(self, page: Page):
         """
         Apply stealth techniques to a Playwright page.
 
-        This injects JavaScript to mask automation markers.
+        This injects JavaScript to mask automation markers, in a single
+        add_init_script call.
 
         Args:
             page: Playwright Page instance
         """
-        # Inject all stealth scripts
-        await page.add_init_script(self.WEBDRIVER_OVERRIDE)
-        await page.add_init_script(self.CHROME_RUNTIME_OVERRIDE)
-        await page.add_init_script(self.PERMISSIONS_OVERRIDE)
-        await page.add_init_script(self.PLUGINS_OVERRIDE)
-        await page.add_init_script(self.WEBGL_VENDOR_OVERRIDE)
-        await page.add_init_script(self.SCREEN_OVERRIDE)
-
-        # Inject language override
-        languages_js = self.LANGUAGES_OVERRIDE_TEMPLATE.format(
-            languages=str(self.languages)
-        )
-        await page.add_init_script(languages_js)
+        await page.add_init_script(self._init_script)
+
+    async def apply_stealth_context(self, context: BrowserContext):
+        """
+        Apply stealth techniques to every page of a browser context.
+
+        The init script is registered once on the context and runs in each
+        page it has or opens, so pages need no apply_stealth call of their own.
+
+        Args:
+            context: Playwright BrowserContext instance
+        """
+        await context.add_init_script(self._init_script)
 
-    def get_launch_args(self) -> List[str]:
+    def get_launch_args(self, headless: Optional[bool] = None) -> List[str]:
         """
         Get browser launch arguments for stealth.
 
+        Args:
+            headless: Whether the browser runs headless (defaults to settings)
+
         Returns:
             List of Chrome/Chromium arguments
         """
-        return [
+        if headless is None:
+            headless = settings.HEADLESS_MODE
+
+        args = [
             # Disable automation flags
             '--disable-blink-features=AutomationControlled',
+            '--exclude-switches=enable-automation',
+            '--disable-infobars',
 
             # Disable dev-shm usage (helps with Docker/Linux)
             '--disable-dev-shm-usage',
@@ -217,19 +328,34 @@ class PlaywrightStealth:
             # Performance and stability
             '--no-sandbox',
             '--disable-setuid-sandbox',
-            '--disable-gpu',
-            '--disable-software-rasterizer',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--disable-background-networking',
 
-            # Avoid detection
-            '--disable-blink-features=AutomationControlled',
-            '--exclude-switches=enable-automation',
-            '--disable-infobars',
+            # Keep background tabs (the other workers) running at full speed
+            '--disable-background-timer-throttling',
+            '--disable-backgrounding-occluded-windows',
+            '--disable-renderer-backgrounding',
 
             # Realistic browsing
             '--window-size=1920,1080',
             '--start-maximized',
         ]
 
+        # Headless runs (servers, containers) have no GPU to use; a headed
+        # browser renders faster with it
+        if headless:
+            args += ['--disable-gpu', '--disable-software-rasterizer']
+
+        return args
+
+    def _accept_language(self) -> str:
+        """Build an Accept-Language header with q-values, the way Chrome sends it."""
+        parts = [self.languages[0]]
+        for i, language in enumerate(self.languages[1:], start=1):
+            parts.append(f"{language};q={1 - i / 10:.1f}")
+        return ','.join(parts)
+
     def get_context_options(self) -> Dict:
         """
         Get browser context options for stealth.
@@ -240,12 +366,12 @@ class PlaywrightStealth:
         return {
             'user_agent': self.user_agent,
             'viewport': self.viewport,
-            'locale': 'en-US',
-            'timezone_id': 'Asia/Manila',
+            'locale': self.locale,
+            'timezone_id': self.timezone_id,
             'permissions': [],
             'ignore_https_errors': True,
             'extra_http_headers': {
-                'Accept-Language': ', '.join(self.languages),
+                'Accept-Language': self._accept_language(),
             }
         }
 
@@ -279,12 +405,19 @@ class HumanBehavior:
         """
         Simulate human reading time with random scrolling.
 
+        The pause is scaled by settings.HUMAN_DELAY_MULT; 0 skips it entirely
+        (no scrolling either), for runs that don't need to look human.
+
         Args:
             page: Playwright Page instance
             duration_seconds: Base reading duration
         """
         import asyncio
 
+        if settings.HUMAN_DELAY_MULT <= 0:
+            return
+        duration_seconds *= settings.HUMAN_DELAY_MULT
+
         # Add variance to reading time
         actual_duration = HumanBehavior.random_delay(
             duration_seconds * 0.8,
@@ -297,7 +430,7 @@ class HumanBehavior:
         for _ in range(scroll_times):
             scroll_amount = random.randint(100, 300)
             await page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-            await asyncio.sleep(random.uniform(0.3, 0.8))
+            await asyncio.sleep(random.uniform(0.3, 0.8) * settings.HUMAN_DELAY_MULT)
 
         # Wait remaining time
         await asyncio.sleep(actual_duration)
@@ -350,12 +483,13 @@ async def test_stealth(page: Page):
     Returns:
         dict: Test results
     """
-    results = {
-        'webdriver': await page.evaluate("navigator.webdriver"),
-        'chrome_runtime': await page.evaluate("!!window.chrome && !!window.chrome.runtime"),
-        'plugins_length': await page.evaluate("navigator.plugins.length"),
-        'languages': await page.evaluate("navigator.languages"),
-        'user_agent': await page.evaluate("navigator.userAgent"),
-    }
+    # One evaluate round trip for all detection points
+    results = await page.evaluate("""() => ({
+        webdriver: navigator.webdriver,
+        chrome_runtime: !!window.chrome && !!window.chrome.runtime,
+        plugins_length: navigator.plugins.length,
+        languages: navigator.languages,
+        user_agent: navigator.userAgent,
+    })""")
 
     return results
@@ -26,7 +26,8 @@ def setup_logger():
         level=settings.LOG_LEVEL,
         rotation="10 MB",  # Rotate when file reaches 10MB
         retention="30 days",  # Keep logs for 30 days
-        compression="zip"  # Compress rotated logs
+        compression="zip",  # Compress rotated logs
+        enqueue=True  # Write from a background thread, not the caller's
     )
 
     return logger
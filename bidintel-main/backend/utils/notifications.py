@@ -1,6 +1,7 @@
 """Notification utilities for alerts and monitoring."""
 
 import smtplib
+from string import Template
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from config.settings import settings
@@ -8,15 +9,58 @@ from utils.logger import logger
 from typing import Optional
 
 
+# Port for SMTP over implicit TLS (no STARTTLS upgrade needed)
+_SMTPS_PORT = 465
+
+
 class EmailNotifier:
     """Send email notifications."""
 
+    # Scraping summary email; filled in by notify_scraping_complete
+    COMPLETE_TEXT = Template("""PhilGEPS Scraping Session Complete
+
+Status: $status
+Duration: $duration seconds
+Total Scraped: $total_scraped
+New Records: $new_records
+Errors: $errors
+Start Time: $start_time
+End Time: $end_time""")
+
+    COMPLETE_HTML = Template("""
+        <html>
+        <body>
+            <h2>PhilGEPS Scraping Session Complete</h2>
+            <table style="border-collapse: collapse;">
+                <tr><td style="padding: 8px;"><strong>Status:</strong></td><td style="padding: 8px;">$status</td></tr>
+                <tr><td style="padding: 8px;"><strong>Duration:</strong></td><td style="padding: 8px;">$duration seconds</td></tr>
+                <tr><td style="padding: 8px;"><strong>Total Scraped:</strong></td><td style="padding: 8px;">$total_scraped</td></tr>
+                <tr><td style="padding: 8px;"><strong>New Records:</strong></td><td style="padding: 8px;">$new_records</td></tr>
+                <tr><td style="padding: 8px;"><strong>Errors:</strong></td><td style="padding: 8px;">$errors</td></tr>
+                <tr><td style="padding: 8px;"><strong>Start Time:</strong></td><td style="padding: 8px;">$start_time</td></tr>
+                <tr><td style="padding: 8px;"><strong>End Time:</strong></td><td style="padding: 8px;">$end_time</td></tr>
+            </table>
+        </body>
+        </html>
+        """)
+
     def __init__(self):
         """Initialize email notifier."""
         self.smtp_server = settings.SMTP_SERVER
         self.smtp_port = settings.SMTP_PORT
         self.recipient = settings.NOTIFY_EMAIL
 
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP connection (TLS from the start on port 465, else STARTTLS)."""
+        if self.smtp_port == _SMTPS_PORT:
+            return smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        # Note: Add authentication if needed
+        # server.login(username, password)
+        return server
+
     def send_email(
         self,
         subject: str,
@@ -55,10 +99,7 @@ class EmailNotifier:
                 msg.attach(html_part)
 
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                # Note: Add authentication if needed
-                # server.login(username, password)
+            with self._connect() as server:
                 server.send_message(msg)
 
             logger.info(f"Email notification sent: {subject}")
@@ -80,34 +121,20 @@ class EmailNotifier:
         """
         subject = f"PhilGEPS Scraping Complete - {results['new_records']} new records"
 
-        body = f"""
-PhilGEPS Scraping Session Complete
-
-Status: {'Success' if results['success'] else 'Failed'}
-Duration: {results['duration_seconds']:.2f} seconds
-Total Scraped: {results['total_scraped']}
-New Records: {results['new_records']}
-Errors: {results['errors']}
-Start Time: {results['start_time']}
-End Time: {results['end_time']}
-        """.strip()
-
-        html_body = f"""
-        <html>
-        <body>
-            <h2>PhilGEPS Scraping Session Complete</h2>
-            <table style="border-collapse: collapse;">
-                <tr><td style="padding: 8px;"><strong>Status:</strong></td><td style="padding: 8px;">{'✓ Success' if results['success'] else '✗ Failed'}</td></tr>
-                <tr><td style="padding: 8px;"><strong>Duration:</strong></td><td style="padding: 8px;">{results['duration_seconds']:.2f} seconds</td></tr>
-                <tr><td style="padding: 8px;"><strong>Total Scraped:</strong></td><td style="padding: 8px;">{results['total_scraped']}</td></tr>
-                <tr><td style="padding: 8px;"><strong>New Records:</strong></td><td style="padding: 8px;">{results['new_records']}</td></tr>
-                <tr><td style="padding: 8px;"><strong>Errors:</strong></td><td style="padding: 8px;">{results['errors']}</td></tr>
-                <tr><td style="padding: 8px;"><strong>Start Time:</strong></td><td style="padding: 8px;">{results['start_time']}</td></tr>
-                <tr><td style="padding: 8px;"><strong>End Time:</strong></td><td style="padding: 8px;">{results['end_time']}</td></tr>
-            </table>
-        </body>
-        </html>
-        """
+        fields = {
+            'duration': f"{results['duration_seconds']:.2f}",
+            'total_scraped': results['total_scraped'],
+            'new_records': results['new_records'],
+            'errors': results['errors'],
+            'start_time': results['start_time'],
+            'end_time': results['end_time'],
+        }
+        body = self.COMPLETE_TEXT.substitute(
+            fields, status='Success' if results['success'] else 'Failed'
+        )
+        html_body = self.COMPLETE_HTML.substitute(
+            fields, status='✓ Success' if results['success'] else '✗ Failed'
+        )
 
         return self.send_email(subject, body, html_body)
 
@@ -0,0 +1,187 @@
+"""Request pacing: a thread-safe token bucket and per-host limiting for async HTTP requests."""
+
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from threading import Lock
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from utils.logger import logger
+
+# Status codes worth retrying: rate limited or a transient server error
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# X-RateLimit-Reset values above this are epoch timestamps, not delays
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _header_number(headers: httpx.Headers, name: str) -> Optional[float]:
+    """Return a numeric header value, or None if missing or malformed."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for pacing requests to one host.
+
+    acquire() only blocks for whatever is left of the interval since the
+    previous request, so time already spent fetching counts towards the
+    delay. Waiting callers reserve their slot up front, which keeps them
+    evenly spaced.
+
+    Usage:
+        bucket = TokenBucket(rate_per_sec=0.5)
+        bucket.acquire()  # before each request
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = 1.0):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate_per_sec: Requests allowed per second; 0 or less disables pacing
+            capacity: Requests allowed in a burst
+        """
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """
+    Caps concurrent requests per host and honours the host's rate limit headers.
+
+    Each host gets its own semaphore. When a response reports the budget as
+    used up (X-RateLimit-Remaining: 0), new requests to that host wait for
+    X-RateLimit-Reset (or Retry-After) before going out.
+
+    Usage:
+        limiter = HostRateLimiter(max_per_host=8)
+        response = await limiter.get(client, url)
+    """
+
+    def __init__(self, max_per_host: int = 8, max_retries: int = 3):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_per_host: Maximum concurrent requests to one host
+            max_retries: Retries after a 429/5xx response or transport error
+        """
+        self.max_per_host = max_per_host
+        self.max_retries = max_retries
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._remaining: Dict[str, Optional[float]] = {}
+        self._reset_at: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        """
+        Hold one of the host's request slots, waiting out an exhausted budget.
+
+        Args:
+            host: Host name the request goes to
+        """
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+
+        async with semaphore:
+            wait = self._reset_at.get(host, 0.0) - time.monotonic()
+            if wait > 0 and self._remaining.get(host) is not None and self._remaining[host] <= 0:
+                logger.debug(f"Rate limit reached for {host}, waiting {wait:.1f}s")
+                await asyncio.sleep(wait)
+
+            remaining = self._remaining.get(host)
+            if remaining is not None:
+                self._remaining[host] = remaining - 1
+
+            yield
+
+    def update(self, host: str, headers: httpx.Headers):
+        """
+        Record the host's budget from a response's rate limit headers.
+
+        Args:
+            host: Host name the response came from
+            headers: Response headers
+        """
+        remaining = _header_number(headers, 'X-RateLimit-Remaining')
+        if remaining is not None:
+            self._remaining[host] = remaining
+
+        reset = _header_number(headers, 'X-RateLimit-Reset')
+        if reset is None:
+            reset = _header_number(headers, 'Retry-After')
+        if reset is not None:
+            delay = reset - time.time() if reset > _EPOCH_THRESHOLD else reset
+            self._reset_at[host] = time.monotonic() + max(0.0, delay)
+
+    def _backoff(self, host: str, attempt: int) -> float:
+        """Exponential backoff with jitter, stretched to the host's reset time."""
+        delay = 2 ** attempt + random.random()
+        return max(delay, self._reset_at.get(host, 0.0) - time.monotonic())
+
+    async def get(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """
+        GET a URL through the host's slot, retrying 429/5xx with backoff.
+
+        Args:
+            client: HTTP client to send the request with
+            url: URL to fetch
+
+        Returns:
+            httpx.Response: Last response (may still be an error status)
+
+        Raises:
+            httpx.TransportError: If every attempt failed to connect
+        """
+        host = urlsplit(url).hostname or ''
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.slot(host):
+                    response = await client.get(url)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(host, attempt)
+                logger.debug(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            self.update(host, response.headers)
+
+            if response.status_code not in _RETRY_STATUSES or attempt == self.max_retries:
+                return response
+
+            delay = self._backoff(host, attempt)
+            logger.debug(f"{url} returned {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
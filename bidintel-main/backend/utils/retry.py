@@ -1,5 +1,6 @@
-"""Retry logic decorator for handling failures."""
+"""Retry logic decorators for handling failures."""
 
+import asyncio
 import time
 from functools import wraps
 from utils.logger import logger
@@ -51,3 +52,48 @@ def retry_on_failure(max_retries: int = 3, delay: float = 2.0, backoff: float =
 
         return wrapper
     return decorator
+
+
+def async_retry_on_failure(max_retries: int = 3, delay: float = 2.0, backoff: float = 2.0):
+    """
+    Async version of retry_on_failure for coroutine functions.
+
+    Waits with asyncio.sleep, so other tasks on the event loop keep running
+    between attempts.
+
+    Args:
+        max_retries: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        backoff: Multiplier for delay on each retry
+
+    Usage:
+        @async_retry_on_failure(max_retries=3, delay=2.0, backoff=2.0)
+        async def my_coroutine():
+            # Code that might fail
+            pass
+    """
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            current_delay = delay
+
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+
+                except Exception as e:
+                    if attempt == max_retries:
+                        logger.error(
+                            f"All {max_retries} retry attempts failed for {func.__name__}: {str(e)}"
+                        )
+                        raise
+
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {str(e)}. "
+                        f"Retrying in {current_delay:.1f}s..."
+                    )
+                    await asyncio.sleep(current_delay)
+                    current_delay *= backoff
+
+        return wrapper
+    return decorator
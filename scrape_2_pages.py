@@ -17,11 +17,12 @@ from datetime import datetime, timezone
 sys.path.insert(0, str(Path(__file__).parent / 'bidintel-main' / 'backend'))
 
 from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
+from config.settings import settings
 from models.database import Database
-from scraper.parser import PhilGEPSParser
+from scraper.award_index import route_handler, goto, extract_awards, parse_award_page
 from scraper.stealth import PlaywrightStealth, HumanBehavior
 from utils.logger import logger
+from utils.retry import async_retry_on_failure
 
 
 class TwoPageScraper:
@@ -29,6 +30,14 @@ class TwoPageScraper:
 
     PUBLIC_INDEX_URL = "https://philgeps.gov.ph/Indexes/viewMoreAward"
 
+    # Pages used to fetch award details concurrently
+    DETAIL_PAGES = 4
+
+    # Browser profile kept between runs so the HTTP cache, cookies and
+    # compiled scripts carry over; the disk cache is capped at 100 MB
+    USER_DATA_DIR = Path(__file__).parent / '.playwright_profile'
+    DISK_CACHE_SIZE = 100 * 1024 * 1024
+
     def __init__(self):
         self.db = Database()
         self.stealth = PlaywrightStealth()
@@ -40,105 +49,71 @@ class TwoPageScraper:
         print("="*80)
 
         start_time = datetime.now()
-        total_scraped = 0
-        new_records = 0
-        errors = 0
+        counts = {'total_scraped': 0, 'new_records': 0, 'errors': 0}
+        all_awards = []
 
         async with async_playwright() as playwright:
-            # Launch browser
+            # Launch browser with the persistent profile
             print("\n📱 Launching browser...")
-            browser = await playwright.chromium.launch(
+            context = await playwright.chromium.launch_persistent_context(
+                str(self.USER_DATA_DIR),
                 headless=False,  # Visible mode for testing
-                args=self.stealth.get_launch_args()
-            )
-
-            # Create context with stealth options
-            context = await browser.new_context(
+                args=[*self.stealth.get_launch_args(headless=False), f'--disk-cache-size={self.DISK_CACHE_SIZE}'],
                 **self.stealth.get_context_options()
             )
 
-            # Create page
-            page = await context.new_page()
-
-            # Apply stealth to page
-            await self.stealth.apply_stealth(page)
-
             try:
-                # Navigate to awards page
-                print(f"🌐 Navigating to: {self.PUBLIC_INDEX_URL}")
-                await page.goto(self.PUBLIC_INDEX_URL, wait_until='domcontentloaded', timeout=30000)
-                await asyncio.sleep(2)
+                await context.route("**/*", route_handler)
 
-                # Scrape 2 pages
-                all_awards = []
+                # Stealth once for the context covers every page, including
+                # the detail pages opened below
+                await self.stealth.apply_stealth_context(context)
 
-                for page_num in range(1, 3):  # Pages 1 and 2
-                    print(f"\n📄 Scraping Page {page_num}/2...")
-
-                    if page_num > 1:
-                        # Navigate to page 2
-                        pagination_url = f"{self.PUBLIC_INDEX_URL}?page={page_num}"
-                        await page.goto(pagination_url, wait_until='domcontentloaded')
-                        await asyncio.sleep(2)
-
-                    # Get awards from current page
-                    html = await page.content()
-                    awards = self._extract_awards_from_page(html)
-                    print(f"   Found {len(awards)} awards on page {page_num}")
-                    all_awards.extend(awards)
+                # The persistent context opens with a blank page; use it first
+                page = context.pages[0] if context.pages else await context.new_page()
 
+                all_awards = await self._fetch_listing_pages(page)
                 print(f"\n📊 Total awards found: {len(all_awards)}")
 
-                # Scrape details for each award
-                print(f"\n🔍 Scraping award details...")
-
+                # Skip awards that are already saved (one query for the whole
+                # list) or listed twice, before opening any detail pages
+                seen = self.db.get_existing_award_numbers(
+                    [award_summary['award_notice_number'] for award_summary in all_awards]
+                )
+                awards_to_scrape = []
                 for i, award_summary in enumerate(all_awards, 1):
-                    try:
-                        award_num = award_summary['award_notice_number']
-                        award_url = award_summary['url']
-
-                        # Check if already scraped
-                        if self.db.awarded_contract_exists(award_num):
-                            print(f"   [{i}/{len(all_awards)}] ⏭️  Skip: {award_num} (already exists)")
-                            continue
-
-                        print(f"   [{i}/{len(all_awards)}] 🔍 Scraping: {award_num}")
-
-                        # Navigate to detail page
-                        await page.goto(award_url, wait_until='domcontentloaded', timeout=30000)
-                        await asyncio.sleep(1.5)
-
-                        # Parse the page
-                        detail_html = await page.content()
-                        parser = PhilGEPSParser(detail_html)
-                        award_data = parser.parse_awarded_contract()
-
-                        # Save to database
-                        self.db.save_awarded_contract(award_data)
-                        new_records += 1
-                        total_scraped += 1
-
-                        # Show preview
-                        awardee = award_data.get('awardee_name', 'N/A')
-                        agency = award_data.get('procuring_entity', 'N/A')
-                        contract_amt = award_data.get('contract_amount')
-
-                        print(f"       ✅ Winner: {awardee[:50]}")
-                        print(f"       🏛️  Agency: {agency[:50]}")
-                        if contract_amt:
-                            print(f"       💰 Amount: PHP {contract_amt:,.2f}")
-
-                    except Exception as e:
-                        errors += 1
-                        print(f"       ❌ Error: {str(e)}")
-                        logger.error(f"Error scraping {award_summary.get('award_notice_number')}: {str(e)}")
-                        continue
+                    award_num = award_summary['award_notice_number']
+                    if award_num in seen:
+                        print(f"   [{i}/{len(all_awards)}] ⏭️  Skip: {award_num} (already exists)")
+                    else:
+                        seen.add(award_num)
+                        awards_to_scrape.append((i, award_summary))
+
+                # Scrape details concurrently: several pages in the context,
+                # each pulling awards from a shared queue
+                print(f"\n🔍 Scraping award details...")
+                queue = asyncio.Queue()
+                for item in awards_to_scrape:
+                    queue.put_nowait(item)
+
+                pages = [page]
+                for _ in range(1, min(self.DETAIL_PAGES, len(awards_to_scrape))):
+                    pages.append(await context.new_page())
+
+                # Parsed awards are saved in batches of SAVE_BATCH_SIZE
+                pending = []
+                await asyncio.gather(*(
+                    self._detail_worker(worker_page, queue, len(all_awards), counts, pending)
+                    for worker_page in pages
+                ))
+                self._save_pending(pending, counts)
 
             finally:
-                await browser.close()
+                await context.close()
 
         # Print summary
         duration = (datetime.now() - start_time).total_seconds()
+        new_records = counts['new_records']
 
         print("\n" + "="*80)
         print("✅ SCRAPING COMPLETE")
@@ -146,8 +121,8 @@ class TwoPageScraper:
         print(f"⏱️  Duration: {duration:.1f} seconds")
         print(f"📊 Total Awards Found: {len(all_awards)}")
         print(f"🆕 New Records Saved: {new_records}")
-        print(f"⏭️  Skipped (duplicates): {total_scraped - new_records}")
-        print(f"❌ Errors: {errors}")
+        print(f"⏭️  Skipped (duplicates): {counts['total_scraped'] - new_records}")
+        print(f"❌ Errors: {counts['errors']}")
         print("="*80)
 
         if new_records > 0:
@@ -158,51 +133,107 @@ class TwoPageScraper:
 
         return {
             'success': True,
-            'total_scraped': total_scraped,
+            'total_scraped': counts['total_scraped'],
             'new_records': new_records,
-            'errors': errors
+            'errors': counts['errors']
         }
 
-    def _extract_awards_from_page(self, html: str):
-        """Extract award list from page HTML."""
-        soup = BeautifulSoup(html, 'lxml')
-        awards = []
+    async def _fetch_listing_html(self, page, url):
+        """
+        Navigate to a listing page and return its raw response body.
+
+        The award index is server-rendered, so the document bytes already hold
+        every row; reading them skips waiting for the DOM and serializing it
+        back with page.content(). Falls back to page.content() when there is
+        no usable response.
+        """
+        response = await page.goto(url, wait_until='commit', timeout=15000)
+        if response is not None and response.ok:
+            try:
+                return await response.body()
+            except Exception as e:
+                logger.debug(f"Could not read response body for {url}: {e}")
+
+        await page.wait_for_load_state('domcontentloaded')
+        return await page.content()
+
+    async def _fetch_listing_pages(self, page):
+        """Collect award summaries from the first 2 index pages."""
+        # Navigate to awards page
+        print(f"🌐 Navigating to: {self.PUBLIC_INDEX_URL}")
+
+        all_awards = []
+
+        for page_num in range(1, 3):  # Pages 1 and 2
+            print(f"\n📄 Scraping Page {page_num}/2...")
 
-        rows = soup.select('tbody tr')
+            if page_num > 1:
+                # Navigate to page 2
+                url = f"{self.PUBLIC_INDEX_URL}?page={page_num}"
+            else:
+                url = self.PUBLIC_INDEX_URL
 
-        for row in rows:
+            # Get awards from current page
+            html = await self._fetch_listing_html(page, url)
+            awards = extract_awards(html)
+            print(f"   Found {len(awards)} awards on page {page_num}")
+            all_awards.extend(awards)
+
+        return all_awards
+
+    async def _detail_worker(self, page, queue, total, counts, pending):
+        """Scrape award details from the queue until it is empty, saving in batches."""
+        while True:
             try:
-                # Extract award notice number and URL
-                award_link = row.select_one('td:nth-of-type(1) a')
-                if not award_link:
-                    continue
-
-                award_notice_number = award_link.get_text(strip=True)
-                href = award_link.get('href', '')
-
-                # Handle both relative and absolute URLs
-                if href.startswith('http'):
-                    award_url = href
-                elif href.startswith('/'):
-                    award_url = "https://philgeps.gov.ph" + href
-                else:
-                    award_url = "https://philgeps.gov.ph/" + href
-
-                # Extract title
-                title_cell = row.select_one('td:nth-of-type(2)')
-                title = title_cell.get_text(strip=True) if title_cell else None
-
-                awards.append({
-                    'award_notice_number': award_notice_number,
-                    'url': award_url,
-                    'title': title
-                })
+                i, award_summary = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
 
-            except Exception as e:
-                logger.error(f"Error parsing award row: {str(e)}")
-                continue
+            try:
+                award_data = await self._fetch_detail(page, award_summary)
+
+                # Queue for the next batch save
+                pending.append(award_data)
+                if len(pending) >= settings.SAVE_BATCH_SIZE:
+                    self._save_pending(pending, counts)
+
+                # Show preview
+                awardee = award_data.awardee_name or 'N/A'
+                agency = award_data.procuring_entity or 'N/A'
+                contract_amt = award_data.contract_amount
+
+                lines = [
+                    f"   [{i}/{total}] 🔍 Scraped: {award_summary['award_notice_number']}",
+                    f"       ✅ Winner: {awardee[:50]}",
+                    f"       🏛️  Agency: {agency[:50]}",
+                ]
+                if contract_amt:
+                    lines.append(f"       💰 Amount: PHP {contract_amt:,.2f}")
+                print("\n".join(lines))
 
-        return awards
+            except Exception as e:
+                counts['errors'] += 1
+                print(f"   [{i}/{total}] ❌ Error: {award_summary.get('award_notice_number')}: {str(e)}")
+                logger.error(f"Error scraping {award_summary.get('award_notice_number')}: {str(e)}")
+
+    def _save_pending(self, pending, counts):
+        """Save queued awards in one transaction and empty the queue."""
+        if not pending:
+            return
+
+        saved = self.db.save_awarded_contracts(pending)
+        counts['new_records'] += saved
+        counts['total_scraped'] += saved
+        counts['errors'] += len(pending) - saved
+        pending.clear()
+
+    @async_retry_on_failure(max_retries=2)
+    async def _fetch_detail(self, page, award_summary):
+        """Load an award detail page and parse it."""
+        await goto(page, award_summary['url'], timeout=15000)
+
+        detail_html = await page.content()
+        return await asyncio.to_thread(parse_award_page, detail_html)
 
 
 async def main():
@@ -9,24 +9,45 @@ Usage:
     python scrape_all_awarded.py --visible          # Scrape with visible browser
     python scrape_all_awarded.py --max-pages 10     # Limit to first 10 pages
     python scrape_all_awarded.py --start-page 5     # Resume from page 5
+    python scrape_all_awarded.py --concurrency 3    # 3 pages in parallel
+    python scrape_all_awarded.py --retry-failed     # Retry awards and pages that failed last run
 """
 
 import asyncio
+import json
+import os
+import re
 import sys
 import argparse
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 
 # Add backend directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'bidintel-main' / 'backend'))
 
+import httpx
 from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+from config.settings import settings
 from models.database import Database
-from scraper.parser import PhilGEPSParser
+from scraper.award_index import route_handler, goto, extract_awards, parse_award_page
+from scraper.parser import AwardRecord
 from scraper.stealth import PlaywrightStealth, HumanBehavior
 from utils.logger import logger
+from utils.rate_limit import HostRateLimiter
+
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Links inside the index's pagination list, and the page=N parameter in each
+_XP_PAGINATION_HREFS = etree.XPath(
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' pagination ')]//a/@href"
+)
+_PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)')
 
 
 class AwardedContractsScraper:
@@ -34,12 +55,27 @@ class AwardedContractsScraper:
 
     PUBLIC_INDEX_URL = "https://philgeps.gov.ph/Indexes/viewMoreAward"
 
-    def __init__(self, headless: bool = True, max_pages: Optional[int] = None, start_page: int = 1):
+    # Awards between progress lines in the detail phase
+    PROGRESS_EVERY = 25
+
+    # Awards and index pages that failed, one JSON object per line, for --retry-failed
+    FAILED_AWARDS_FILE = Path(__file__).parent / 'failed_awards.jsonl'
+
+    # A retry run's failures, moved over FAILED_AWARDS_FILE when the run ends
+    FAILED_AWARDS_TMP_FILE = FAILED_AWARDS_FILE.with_name('failed_awards.jsonl.tmp')
+
+    # Failed awards kept in memory for the summary
+    FAILED_SAMPLE_SIZE = 10
+
+    def __init__(self, headless: bool = True, max_pages: Optional[int] = None, start_page: int = 1,
+                 concurrency: int = 5, retry_failed: bool = False):
         self.db = Database()
         self.stealth = PlaywrightStealth()
         self.headless = headless
         self.max_pages = max_pages
         self.start_page = start_page
+        self.concurrency = max(1, concurrency)
+        self.retry_failed = retry_failed
 
         # Statistics
         self.total_awards_found = 0
@@ -47,7 +83,16 @@ class AwardedContractsScraper:
         self.new_records = 0
         self.skipped = 0
         self.errors = 0
-        self.failed_awards = []
+        self.failed_awards = []  # First FAILED_SAMPLE_SIZE only; all go to FAILED_AWARDS_FILE
+        self.failed_count = 0
+        self._failed_file = None
+
+        # Parsed awards for the database writer (created in run())
+        self._save_queue: Optional[asyncio.Queue] = None
+
+        # Plain HTTP client for index and detail pages (created once the browser has cookies)
+        self.http: Optional[httpx.AsyncClient] = None
+        self.http_limiter = HostRateLimiter(settings.HTTP_MAX_PER_HOST, settings.MAX_RETRIES)
 
     async def run(self):
         """Run the full scraper."""
@@ -55,7 +100,12 @@ class AwardedContractsScraper:
         print("🚀 FULL AWARDED CONTRACTS SCRAPER")
         print("="*80)
 
-        if self.max_pages:
+        # A retry run reads the previous failures; its own replace them once it ends
+        retry_pages, retry_awards = self._load_failures() if self.retry_failed else ([], [])
+
+        if self.retry_failed:
+            print(f"🔁 Mode: RETRY {len(retry_awards)} FAILED AWARDS, {len(retry_pages)} FAILED INDEX PAGES")
+        elif self.max_pages:
             print(f"📄 Max Pages: {self.max_pages}")
         else:
             print(f"📄 Mode: SCRAPE ALL PAGES")
@@ -81,59 +131,88 @@ class AwardedContractsScraper:
                 **self.stealth.get_context_options()
             )
 
+            # Skip assets and trackers on every page in the context
+            await context.route("**/*", route_handler)
+
+            # Apply stealth once for every page in the context
+            await self.stealth.apply_stealth_context(context)
+
             # Create page
             page = await context.new_page()
 
-            # Apply stealth to page
-            await self.stealth.apply_stealth(page)
+            # A retry run writes to a separate file, so the previous list
+            # survives until the run has finished
+            if self.retry_failed:
+                self._failed_file = open(self.FAILED_AWARDS_TMP_FILE, 'w', encoding='utf-8')
+            else:
+                self._failed_file = open(self.FAILED_AWARDS_FILE, 'a', encoding='utf-8')
+
+            # One writer saves every parsed award, so scraping never waits on
+            # a commit; the bounded queue holds workers back if saves fall behind
+            self._save_queue = asyncio.Queue(maxsize=4 * settings.SAVE_BATCH_SIZE)
+            writer = asyncio.create_task(self._db_writer())
 
             try:
                 # Navigate to awards page
                 print(f"🌐 Navigating to: {self.PUBLIC_INDEX_URL}")
-                await page.goto(self.PUBLIC_INDEX_URL, wait_until='domcontentloaded', timeout=30000)
-                await asyncio.sleep(2)
-
-                # Detect total pages
-                total_pages = await self._detect_total_pages(page)
-                print(f"\n📊 Total Pages Detected: {total_pages}")
-
-                # Determine which pages to scrape
-                end_page = min(total_pages, self.max_pages) if self.max_pages else total_pages
-                pages_to_scrape = range(self.start_page, end_page + 1)
-
-                print(f"📋 Will scrape pages {self.start_page} to {end_page}")
-                print("="*80)
-
-                # Scrape all pages
-                all_awards = []
-
-                for page_num in pages_to_scrape:
-                    try:
-                        print(f"\n{'='*80}")
-                        print(f"📄 PAGE {page_num}/{end_page}")
-                        print(f"{'='*80}")
-
-                        # Navigate to page
-                        if page_num > 1:
-                            pagination_url = f"{self.PUBLIC_INDEX_URL}?page={page_num}"
-                            await page.goto(pagination_url, wait_until='domcontentloaded', timeout=30000)
-                            await asyncio.sleep(2)
-
-                        # Extract awards from page
-                        html = await page.content()
-                        awards = self._extract_awards_from_page(html)
-
-                        print(f"   Found {len(awards)} awards on this page")
-                        all_awards.extend(awards)
-                        self.total_awards_found += len(awards)
-
-                        # Show running total
-                        print(f"   📊 Running Total: {self.total_awards_found} awards found")
-
-                    except Exception as e:
-                        print(f"   ❌ Error on page {page_num}: {str(e)}")
-                        logger.error(f"Error scraping page {page_num}: {str(e)}")
-                        continue
+                await goto(page, self.PUBLIC_INDEX_URL)
+
+                if settings.HTTP_DETAIL_FETCH:
+                    await self._init_http_client(page, context)
+
+                # Several pages in the context, lent out to workers that pull
+                # from a shared queue. Pages are needed only for what has to be
+                # rendered, so with the HTTP client up there can be more
+                # workers than pages
+                page_pool = asyncio.Queue()
+                page_pool.put_nowait(page)
+                for _ in range(1, self.concurrency):
+                    page_pool.put_nowait(await context.new_page())
+
+                workers = self.concurrency
+                if self.http is not None:
+                    workers = max(workers, settings.HTTP_MAX_PER_HOST)
+
+                # Index pages to scrape, keeping their awards in page order
+                page_awards = {}
+                queue = asyncio.Queue()
+
+                if self.retry_failed:
+                    # Index pages that failed last time are scraped again, and
+                    # their awards added to the failed ones
+                    self.total_awards_found = len(retry_awards)
+                    end_page = max(retry_pages, default=0)
+                    for page_num in retry_pages:
+                        queue.put_nowait(page_num)
+                else:
+                    # Detect total pages
+                    first_html = await page.content()
+                    total_pages = self._detect_total_pages(first_html)
+                    print(f"\n📊 Total Pages Detected: {total_pages}")
+
+                    # Determine which pages to scrape
+                    end_page = min(total_pages, self.max_pages) if self.max_pages else total_pages
+                    pages_to_scrape = range(self.start_page, end_page + 1)
+
+                    print(f"📋 Will scrape pages {self.start_page} to {end_page}")
+                    print(f"⚡ Concurrency: {self.concurrency} pages")
+                    print("="*80)
+
+                    for page_num in pages_to_scrape:
+                        if page_num == 1:
+                            # Already loaded for page detection
+                            page_awards[1] = extract_awards(first_html)
+                            self._report_index_page(1, end_page, page_awards[1])
+                        else:
+                            queue.put_nowait(page_num)
+
+                await asyncio.gather(*(
+                    self._index_worker(page_pool, queue, end_page, page_awards)
+                    for _ in range(workers)
+                ))
+                all_awards = retry_awards + [
+                    award for page_num in sorted(page_awards) for award in page_awards[page_num]
+                ]
 
                 print(f"\n{'='*80}")
                 print(f"📊 AWARDS EXTRACTION COMPLETE")
@@ -142,78 +221,35 @@ class AwardedContractsScraper:
                 print(f"Now scraping individual award details...")
                 print(f"{'='*80}")
 
+                # Award numbers already saved, looked up in one query for the
+                # whole list
+                existing = self.db.get_existing_award_numbers(
+                    [award_summary['award_notice_number'] for award_summary in all_awards]
+                )
+
                 # Scrape details for each award
-                for i, award_summary in enumerate(all_awards, 1):
-                    try:
-                        award_num = award_summary['award_notice_number']
-                        award_url = award_summary['url']
-
-                        # Check if already scraped
-                        if self.db.awarded_contract_exists(award_num):
-                            self.skipped += 1
-                            if i % 10 == 0 or i == 1:  # Show progress every 10 items
-                                print(f"   [{i}/{len(all_awards)}] ⏭️  Skip: {award_num} (exists)")
-                            continue
-
-                        # Progress indicator
-                        print(f"\n{'─'*80}")
-                        print(f"   [{i}/{len(all_awards)}] 🔍 Scraping: {award_num}")
-
-                        # Calculate and show progress
-                        progress_pct = (i / len(all_awards)) * 100
-                        print(f"   Progress: {progress_pct:.1f}% | New: {self.new_records} | Skipped: {self.skipped} | Errors: {self.errors}")
-
-                        # Navigate to detail page with retries
-                        retry_count = 0
-                        max_retries = 3
-                        success = False
-
-                        while retry_count < max_retries and not success:
-                            try:
-                                await page.goto(award_url, wait_until='domcontentloaded', timeout=30000)
-                                await asyncio.sleep(1.5)
-                                success = True
-                            except Exception as nav_error:
-                                retry_count += 1
-                                if retry_count < max_retries:
-                                    print(f"       ⚠️  Navigation failed, retry {retry_count}/{max_retries}...")
-                                    await asyncio.sleep(2)
-                                else:
-                                    raise nav_error
-
-                        # Parse the page
-                        detail_html = await page.content()
-                        parser = PhilGEPSParser(detail_html)
-                        award_data = parser.parse_awarded_contract()
-
-                        # Save to database
-                        self.db.save_awarded_contract(award_data)
-                        self.new_records += 1
-                        self.total_scraped += 1
-
-                        # Show preview
-                        awardee = award_data.get('awardee_name', 'N/A')
-                        agency = award_data.get('procuring_entity', 'N/A')
-                        contract_amt = award_data.get('contract_amount')
-
-                        print(f"       ✅ Winner: {awardee[:60]}")
-                        print(f"       🏛️  Agency: {agency[:60]}")
-                        if contract_amt:
-                            print(f"       💰 Amount: PHP {contract_amt:,.2f}")
-
-                    except Exception as e:
-                        self.errors += 1
-                        self.failed_awards.append({
-                            'award_number': award_summary.get('award_notice_number'),
-                            'error': str(e)
-                        })
-                        print(f"       ❌ Error: {str(e)}")
-                        logger.error(f"Error scraping {award_summary.get('award_notice_number')}: {str(e)}")
-                        continue
+                queue = asyncio.Queue()
+                for item in enumerate(all_awards, 1):
+                    queue.put_nowait(item)
+
+                await asyncio.gather(*(
+                    self._detail_worker(page_pool, queue, len(all_awards), existing)
+                    for _ in range(workers)
+                ))
 
             finally:
+                # Save whatever is left, even if the run stopped early
+                await self._save_queue.put(None)
+                await writer
+                self._failed_file.close()
+                if self.http is not None:
+                    await self.http.aclose()
                 await browser.close()
 
+        # Not reached if the run was interrupted, which keeps the previous list
+        if self.retry_failed:
+            os.replace(self.FAILED_AWARDS_TMP_FILE, self.FAILED_AWARDS_FILE)
+
         # Print final summary
         self._print_summary(start_time)
 
@@ -227,85 +263,340 @@ class AwardedContractsScraper:
             'failed_awards': self.failed_awards
         }
 
-    async def _detect_total_pages(self, page) -> int:
-        """Detect total number of pages from pagination."""
-        try:
-            html = await page.content()
-            soup = BeautifulSoup(html, 'lxml')
-
-            # Look for pagination links
-            # PhilGEPS uses pagination like: 1 2 3 ... 67
-            pagination_links = soup.select('.pagination a, .pager a, a[href*="page="]')
-
-            max_page = 1
-            for link in pagination_links:
-                text = link.get_text(strip=True)
-                # Try to extract page number
-                if text.isdigit():
-                    page_num = int(text)
-                    max_page = max(max_page, page_num)
-
-                # Also check href for page=X
-                href = link.get('href', '')
-                if 'page=' in href:
+    def _report_index_page(self, page_num: int, end_page: int, awards: List[Dict]):
+        """Count and print the awards found on one index page."""
+        self.total_awards_found += len(awards)
+        print(f"   📄 Page {page_num}/{end_page}: {len(awards)} awards "
+              f"(running total: {self.total_awards_found})")
+
+    async def _index_worker(self, page_pool: asyncio.Queue, queue: asyncio.Queue, end_page: int,
+                            page_awards: Dict[int, List[Dict]]):
+        """Scrape index pages from the queue until it is empty."""
+        while True:
+            try:
+                page_num = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                pagination_url = f"{self.PUBLIC_INDEX_URL}?page={page_num}"
+
+                # Index pages are server-rendered: try plain HTTP first
+                awards = await self._fetch_index_http(pagination_url) if self.http is not None else None
+
+                if awards is None:
+                    page = await page_pool.get()
                     try:
-                        page_param = href.split('page=')[1].split('&')[0]
-                        if page_param.isdigit():
-                            max_page = max(max_page, int(page_param))
-                    except:
-                        pass
+                        await goto(page, pagination_url)
+                        html = await page.content()
+                    finally:
+                        page_pool.put_nowait(page)
 
-            # If we couldn't detect, default to 67 (known from context)
-            if max_page == 1:
-                logger.warning("Could not detect total pages, defaulting to 67")
-                return 67
+                    # Extract awards from page
+                    awards = extract_awards(html)
 
-            return max_page
+                page_awards[page_num] = awards
+                self._report_index_page(page_num, end_page, awards)
+
+            except Exception as e:
+                self.errors += 1
+                self._record_failed_page(page_num, pagination_url, e)
+                print(f"   ❌ Error on page {page_num}: {str(e)}")
+                logger.error(f"Error scraping page {page_num}: {str(e)}")
+
+    async def _detail_worker(self, page_pool: asyncio.Queue, queue: asyncio.Queue, total: int, existing: Set[str]):
+        """Scrape award details from the queue until it is empty."""
+        while True:
+            try:
+                i, award_summary = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                await self._scrape_detail(page_pool, i, total, award_summary, existing)
+            except Exception as e:
+                self.errors += 1
+                self._record_failure(award_summary, e)
+                print(f"       ❌ Error: {str(e)}")
+                logger.error(f"Error scraping {award_summary.get('award_notice_number')}: {str(e)}")
+
+    async def _scrape_detail(self, page_pool: asyncio.Queue, i: int, total: int, award_summary: Dict, existing: Set[str]):
+        """Scrape, parse and save one award detail page, unless it is in existing."""
+        award_num = award_summary['award_notice_number']
+        award_url = award_summary['url']
+
+        # Check if already scraped
+        if award_num in existing:
+            self.skipped += 1
+            if i % 10 == 0 or i == 1:  # Show progress every 10 items
+                print(f"   [{i}/{total}] ⏭️  Skip: {award_num} (exists)")
+            return
+
+        # Claimed here, so an award listed twice isn't scraped by two pages at once
+        existing.add(award_num)
+
+        # Progress indicator, every PROGRESS_EVERY awards
+        if i % self.PROGRESS_EVERY == 0 or i == total:
+            progress_pct = (i / total) * 100
+            print(f"\n{'─'*80}\n"
+                  f"   [{i}/{total}] Progress: {progress_pct:.1f}% | New: {self.new_records} | "
+                  f"Skipped: {self.skipped} | Errors: {self.errors}")
+
+        # Detail pages are server-rendered: try plain HTTP first
+        award_data = await self._fetch_detail_http(award_url) if self.http is not None else None
+
+        if award_data is None:
+            award_data = await self._render_detail(page_pool, award_url)
+
+        # Hand over to the database writer, which saves in batches of SAVE_BATCH_SIZE
+        await self._save_queue.put((award_summary, award_data))
+
+        # Show preview
+        awardee = award_data.awardee_name or 'N/A'
+        agency = award_data.procuring_entity or 'N/A'
+        contract_amt = award_data.contract_amount
+
+        # One print per award, so concurrent pages don't interleave lines
+        lines = [
+            f"   [{i}/{total}] 🔍 Scraped: {award_num}",
+            f"       ✅ Winner: {awardee[:60]}",
+            f"       🏛️  Agency: {agency[:60]}",
+        ]
+        if contract_amt:
+            lines.append(f"       💰 Amount: PHP {contract_amt:,.2f}")
+        print("\n".join(lines))
+
+    async def _render_detail(self, page_pool: asyncio.Queue, award_url: str) -> AwardRecord:
+        """Render an award detail page in a pooled browser page and parse it."""
+        page = await page_pool.get()
+        try:
+            # Navigate to detail page with retries
+            retry_count = 0
+            max_retries = 3
+            success = False
+
+            while retry_count < max_retries and not success:
+                try:
+                    await goto(page, award_url)
+                    success = True
+                except Exception as nav_error:
+                    retry_count += 1
+                    if retry_count < max_retries:
+                        print(f"       ⚠️  Navigation failed, retry {retry_count}/{max_retries}...")
+                        await asyncio.sleep(2)
+                    else:
+                        raise nav_error
+
+            detail_html = await page.content()
+        finally:
+            page_pool.put_nowait(page)
+
+        # Parse the page
+        return await asyncio.to_thread(parse_award_page, detail_html)
+
+    async def _init_http_client(self, page, context):
+        """Create the HTTP client for index and detail pages, sharing the browser's cookies and user agent."""
+        try:
+            user_agent = await page.evaluate("navigator.userAgent")
+            context_options = self.stealth.get_context_options()
+            # One pooled client for every detail fetch, so connections are
+            # reused; over HTTP/2 (when h2 is installed) concurrent requests
+            # share a single connection
+            self.http = httpx.AsyncClient(
+                http2=_HTTP2,
+                headers={'User-Agent': user_agent, **context_options['extra_http_headers']},
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_PER_HOST,
+                    max_keepalive_connections=settings.HTTP_MAX_PER_HOST,
+                    keepalive_expiry=60
+                ),
+                verify=not context_options['ignore_https_errors'],
+                timeout=30,
+                follow_redirects=True
+            )
+            for cookie in await context.cookies():
+                self.http.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie.get('domain', ''), path=cookie.get('path', '/')
+                )
 
         except Exception as e:
-            logger.error(f"Error detecting total pages: {str(e)}")
-            return 67  # Default fallback
+            logger.warning(f"Could not initialize HTTP client, using browser only: {str(e)}")
+            self.http = None
 
-    def _extract_awards_from_page(self, html: str) -> List[Dict]:
-        """Extract award list from page HTML."""
-        soup = BeautifulSoup(html, 'lxml')
-        awards = []
+    async def _fetch_index_http(self, url: str) -> Optional[List[Dict]]:
+        """
+        Fetch an index page over plain HTTP and extract its award rows.
 
-        rows = soup.select('tbody tr')
+        Args:
+            url: Full URL of the index page
 
-        for row in rows:
-            try:
-                # Extract award notice number and URL
-                award_link = row.select_one('td:nth-of-type(1) a')
-                if not award_link:
-                    continue
-
-                award_notice_number = award_link.get_text(strip=True)
-                href = award_link.get('href', '')
-
-                # Handle both relative and absolute URLs
-                if href.startswith('http'):
-                    award_url = href
-                elif href.startswith('/'):
-                    award_url = "https://philgeps.gov.ph" + href
-                else:
-                    award_url = "https://philgeps.gov.ph/" + href
+        Returns:
+            list: Award summaries, or None if the page should be rendered in
+            the browser instead
+        """
+        try:
+            response = await self.http_limiter.get(self.http, url)
+            response.raise_for_status()
 
-                # Extract title
-                title_cell = row.select_one('td:nth-of-type(2)')
-                title = title_cell.get_text(strip=True) if title_cell else None
+            awards = extract_awards(response.text)
 
-                awards.append({
-                    'award_notice_number': award_notice_number,
-                    'url': award_url,
-                    'title': title
-                })
+            # No rows usually means a challenge or JS-only page
+            if not awards:
+                logger.debug(f"HTTP fetch of {url} found no awards, rendering in browser")
+                return None
 
+            return awards
+
+        except Exception as e:
+            logger.debug(f"HTTP fetch failed for {url}, rendering in browser: {str(e)}")
+            return None
+
+    async def _fetch_detail_http(self, url: str) -> Optional[AwardRecord]:
+        """
+        Fetch and parse an award detail page over plain HTTP (no rendering).
+
+        Args:
+            url: Full URL of the award detail page
+
+        Returns:
+            AwardRecord: Awarded contract data, or None if the page should
+            be rendered in the browser instead
+        """
+        try:
+            response = await self.http_limiter.get(self.http, url)
+            response.raise_for_status()
+
+            award_data = await asyncio.to_thread(parse_award_page, response.text)
+
+            # No award number usually means a challenge or JS-only page
+            if not award_data.award_notice_number:
+                logger.debug(f"HTTP fetch of {url} did not parse, rendering in browser")
+                return None
+
+            return award_data
+
+        except Exception as e:
+            logger.debug(f"HTTP fetch failed for {url}, rendering in browser: {str(e)}")
+            return None
+
+    def _load_failures(self) -> Tuple[List[int], List[Dict]]:
+        """
+        Read the index pages and awards recorded in FAILED_AWARDS_FILE.
+
+        Returns:
+            tuple: Failed index page numbers in order, and the failed awards
+            (one per award number)
+        """
+        pages = set()
+        awards = {}
+        if self.FAILED_AWARDS_FILE.exists():
+            with open(self.FAILED_AWARDS_FILE, encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    failed = json.loads(line)
+                    if 'page' in failed:
+                        pages.add(failed['page'])
+                    else:
+                        awards[failed['award_notice_number']] = {
+                            'award_notice_number': failed['award_notice_number'],
+                            'url': failed['url']
+                        }
+        return sorted(pages), list(awards.values())
+
+    def _record_failure(self, award_summary: Dict, error):
+        """Append a failed award to FAILED_AWARDS_FILE and keep a sample for the summary."""
+        award_num = award_summary.get('award_notice_number')
+        self._write_failure(award_num, {'award_notice_number': award_num, 'url': award_summary.get('url')}, error)
+
+    def _record_failed_page(self, page_num: int, url: str, error):
+        """Append a failed index page to FAILED_AWARDS_FILE and keep a sample for the summary."""
+        self._write_failure(f"page {page_num}", {'page': page_num, 'url': url}, error)
+
+    def _write_failure(self, label: str, entry: Dict, error):
+        """Write one FAILED_AWARDS_FILE line; the first FAILED_SAMPLE_SIZE are kept for the summary."""
+        self.failed_count += 1
+        if len(self.failed_awards) < self.FAILED_SAMPLE_SIZE:
+            self.failed_awards.append({
+                'award_number': label,
+                'error': str(error)
+            })
+
+        self._failed_file.write(json.dumps({**entry, 'error': str(error)[:200]}) + '\n')
+        self._failed_file.flush()
+
+    async def _db_writer(self):
+        """Save (award summary, award data) pairs from the save queue in batches until it yields None."""
+        batch = []
+        while True:
+            item = await self._save_queue.get()
+            if item is not None:
+                batch.append(item)
+
+            if batch and (item is None or len(batch) >= settings.SAVE_BATCH_SIZE):
+                await self._save_batch(batch)
+                batch = []
+
+            if item is None:
+                return
+
+    async def _save_batch(self, batch: List[Tuple[Dict, AwardRecord]]):
+        """Save a batch of awards in one transaction, off the event loop, recording any not saved."""
+        awards = [award_data for _, award_data in batch]
+        try:
+            saved = await asyncio.to_thread(self.db.save_awarded_contracts, awards)
+            error = "Not saved to the database"
+        except Exception as e:
+            logger.error(f"Error saving batch of {len(batch)} awards: {str(e)}")
+            saved = 0
+            error = e
+
+        self.new_records += saved
+        self.total_scraped += saved
+        self.errors += len(batch) - saved
+
+        if saved == len(batch):
+            return
+
+        # Part of the batch was saved one award at a time; look up which made it
+        stored = set()
+        if saved:
+            try:
+                stored = await asyncio.to_thread(
+                    self.db.get_existing_award_numbers,
+                    [award_data.award_notice_number for award_data in awards]
+                )
             except Exception as e:
-                logger.error(f"Error parsing award row: {str(e)}")
-                continue
+                logger.error(f"Error looking up saved awards: {str(e)}")
+
+        for award_summary, award_data in batch:
+            if award_data.award_notice_number not in stored:
+                self._record_failure(award_summary, error)
+
+    def _detect_total_pages(self, html: str) -> int:
+        """Detect total number of pages from the page=N links in the index pagination."""
+        try:
+            # PhilGEPS uses pagination like: 1 2 3 ... 67, with a "last" link
+            # to the final page; only hrefs in the pagination list are read
+            tree = lxml_html.fromstring(html)
+            page_numbers = (
+                int(match.group(1))
+                for href in _XP_PAGINATION_HREFS(tree)
+                for match in _PAGE_PARAM_RE.finditer(href)
+            )
+            max_page = max(page_numbers, default=1)
+
+            # If we couldn't detect, default to 67 (known from context)
+            if max_page == 1:
+                logger.warning("Could not detect total pages, defaulting to 67")
+                return 67
 
-        return awards
+            return max_page
+
+        except Exception as e:
+            logger.error(f"Error detecting total pages: {str(e)}")
+            return 67  # Default fallback
 
     def _print_summary(self, start_time: datetime):
         """Print final scraping summary."""
@@ -321,11 +612,12 @@ class AwardedContractsScraper:
         print(f"❌ Errors: {self.errors}")
 
         if self.errors > 0 and self.failed_awards:
-            print(f"\n⚠️  Failed Awards ({len(self.failed_awards)}):")
-            for failed in self.failed_awards[:10]:  # Show first 10
+            print(f"\n⚠️  Failed Awards ({self.failed_count}):")
+            for failed in self.failed_awards:  # First FAILED_SAMPLE_SIZE
                 print(f"   • {failed['award_number']}: {failed['error'][:60]}")
-            if len(self.failed_awards) > 10:
-                print(f"   ... and {len(self.failed_awards) - 10} more")
+            if self.failed_count > len(self.failed_awards):
+                print(f"   ... and {self.failed_count - len(self.failed_awards)} more")
+            print(f"   Retry them with: python scrape_all_awarded.py --retry-failed")
 
         print("="*80)
 
@@ -349,6 +641,8 @@ Examples:
   python scrape_all_awarded.py --visible          # Scrape with visible browser
   python scrape_all_awarded.py --max-pages 10     # Limit to first 10 pages
   python scrape_all_awarded.py --start-page 5     # Resume from page 5
+  python scrape_all_awarded.py --concurrency 3    # 3 pages in parallel
+  python scrape_all_awarded.py --retry-failed     # Retry awards and pages that failed last run
   python scrape_all_awarded.py --visible --max-pages 5  # Visible, first 5 pages
         """
     )
@@ -373,6 +667,19 @@ Examples:
         help='Page number to start from (default: 1)'
     )
 
+    parser.add_argument(
+        '--retry-failed',
+        action='store_true',
+        help='Only retry the awards and index pages recorded in failed_awards.jsonl'
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=5,
+        help='Browser pages scraping in parallel (default: 5)'
+    )
+
     return parser.parse_args()
 
 
@@ -383,7 +690,9 @@ async def main():
     scraper = AwardedContractsScraper(
         headless=not args.visible,
         max_pages=args.max_pages,
-        start_page=args.start_page
+        start_page=args.start_page,
+        concurrency=args.concurrency,
+        retry_failed=args.retry_failed
     )
 
     await scraper.run()
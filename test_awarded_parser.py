@@ -38,7 +38,7 @@ def test_awarded_contract_detail():
     parser = PhilGEPSParser(html)
 
     try:
-        award_data = parser.parse_awarded_contract()
+        award = parser.parse_awarded_contract()
 
         print("\n✅ Parsing successful!")
         print("\n" + "=" * 70)
@@ -47,51 +47,51 @@ def test_awarded_contract_detail():
 
         # Display key fields
         print(f"\n📋 IDENTIFIERS:")
-        print(f"   Award Notice Number: {award_data.get('award_notice_number')}")
-        print(f"   Bid Reference Number: {award_data.get('bid_reference_number')}")
-        print(f"   Control Number: {award_data.get('control_number')}")
+        print(f"   Award Notice Number: {award.award_notice_number}")
+        print(f"   Bid Reference Number: {award.bid_reference_number}")
+        print(f"   Control Number: {award.control_number}")
 
         print(f"\n🏆 AWARDEE INFORMATION:")
-        print(f"   Awardee Name: {award_data.get('awardee_name')}")
-        print(f"   Contact Person: {award_data.get('awardee_contact_person')}")
-        print(f"   Address: {award_data.get('awardee_address')}")
-        print(f"   Corporate Title: {award_data.get('awardee_corporate_title')}")
+        print(f"   Awardee Name: {award.awardee_name}")
+        print(f"   Contact Person: {award.awardee_contact_person}")
+        print(f"   Address: {award.awardee_address}")
+        print(f"   Corporate Title: {award.awardee_corporate_title}")
 
         print(f"\n💰 FINANCIAL INFORMATION:")
-        print(f"   ABC (Approved Budget): PHP {award_data.get('approved_budget'):,.2f}" if award_data.get('approved_budget') else "   ABC: None")
-        print(f"   Contract Amount (Awarded Price): PHP {award_data.get('contract_amount'):,.2f}" if award_data.get('contract_amount') else "   Contract Amount: None")
+        print(f"   ABC (Approved Budget): PHP {award.approved_budget:,.2f}" if award.approved_budget else "   ABC: None")
+        print(f"   Contract Amount (Awarded Price): PHP {award.contract_amount:,.2f}" if award.contract_amount else "   Contract Amount: None")
 
-        if award_data.get('approved_budget') and award_data.get('contract_amount'):
-            savings = award_data['approved_budget'] - award_data['contract_amount']
-            savings_pct = (savings / award_data['approved_budget']) * 100
+        if award.approved_budget and award.contract_amount:
+            savings = award.approved_budget - award.contract_amount
+            savings_pct = (savings / award.approved_budget) * 100
             print(f"   💡 Savings: PHP {savings:,.2f} ({savings_pct:.2f}%)")
 
         print(f"\n📅 DATES:")
-        print(f"   Award Date: {award_data.get('award_date')}")
-        print(f"   Publish Date: {award_data.get('publish_date')}")
-        print(f"   Date Created: {award_data.get('date_created')}")
-        print(f"   Date Last Updated: {award_data.get('date_last_updated')}")
+        print(f"   Award Date: {award.award_date}")
+        print(f"   Publish Date: {award.publish_date}")
+        print(f"   Date Created: {award.date_created}")
+        print(f"   Date Last Updated: {award.date_last_updated}")
 
         print(f"\n📝 CONTRACT DETAILS:")
-        print(f"   Contract Number: {award_data.get('contract_number') or 'N/A'}")
-        print(f"   Period of Contract: {award_data.get('period_of_contract')}")
-        print(f"   Contract Effectivity Date: {award_data.get('contract_effectivity_date') or 'N/A'}")
-        print(f"   Contract End Date: {award_data.get('contract_end_date') or 'N/A'}")
-        print(f"   Proceed Date: {award_data.get('proceed_date') or 'N/A'}")
+        print(f"   Contract Number: {award.contract_number or 'N/A'}")
+        print(f"   Period of Contract: {award.period_of_contract}")
+        print(f"   Contract Effectivity Date: {award.contract_effectivity_date or 'N/A'}")
+        print(f"   Contract End Date: {award.contract_end_date or 'N/A'}")
+        print(f"   Proceed Date: {award.proceed_date or 'N/A'}")
 
         print(f"\n🏢 PROCUREMENT INFORMATION:")
-        print(f"   Award Title: {award_data.get('award_title')}")
-        print(f"   Award Type: {award_data.get('award_type')}")
-        print(f"   Classification: {award_data.get('classification')}")
-        print(f"   Procurement Mode: {award_data.get('procurement_mode')}")
-        print(f"   Category: {award_data.get('category')}")
-        print(f"   Procurement Rules: {award_data.get('procurement_rules')}")
+        print(f"   Award Title: {award.award_title}")
+        print(f"   Award Type: {award.award_type}")
+        print(f"   Classification: {award.classification}")
+        print(f"   Procurement Mode: {award.procurement_mode}")
+        print(f"   Category: {award.category}")
+        print(f"   Procurement Rules: {award.procurement_rules}")
 
         print(f"\n🏛️ PROCURING ENTITY:")
-        print(f"   Entity: {award_data.get('procuring_entity')}")
-        print(f"   Delivery Location: {award_data.get('delivery_location')}")
-        print(f"   Funding Source: {award_data.get('funding_source')}")
-        print(f"   Created By: {award_data.get('created_by')}")
+        print(f"   Entity: {award.procuring_entity}")
+        print(f"   Delivery Location: {award.delivery_location}")
+        print(f"   Funding Source: {award.funding_source}")
+        print(f"   Created By: {award.created_by}")
 
         # Check for missing critical fields
         print("\n" + "=" * 70)
@@ -108,7 +108,7 @@ def test_awarded_contract_detail():
 
         missing_fields = []
         for field, label in critical_fields.items():
-            if not award_data.get(field):
+            if not getattr(award, field):
                 missing_fields.append(label)
                 print(f"❌ Missing: {label}")
             else:
@@ -19,6 +19,11 @@ sys.path.insert(0, str(Path(__file__).parent / 'bidintel-main' / 'backend'))
 from models.database import Database
 
 
+def truncate(text: str, length: int) -> str:
+    """Cut text to length characters, marking the cut with '...'."""
+    return text if len(text) <= length else f"{text[:length]}..."
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='View scraped awarded contracts data')
@@ -37,9 +42,9 @@ def main():
 
     db = Database()
 
-    # Get total count
-    all_awards = db.get_all_awarded_contracts(limit=1000)
-    total = len(all_awards)
+    # Get total count and aggregates (computed in SQL)
+    totals = db.get_award_totals()
+    total = totals['total_awards']
 
     print(f"\n📈 Total records in database: {total}")
 
@@ -72,8 +77,7 @@ def main():
         print(f"   Company: {award.awardee_name or 'N/A'}")
         print(f"   Contact Person: {award.awardee_contact_person or 'N/A'}")
         if award.awardee_address:
-            addr = award.awardee_address[:100] + "..." if len(award.awardee_address) > 100 else award.awardee_address
-            print(f"   Address: {addr}")
+            print(f"   Address: {truncate(award.awardee_address, 100)}")
 
         # Financial
         print(f"\n💰 FINANCIAL:")
@@ -95,8 +99,7 @@ def main():
         # Contract details
         print(f"\n📝 CONTRACT DETAILS:")
         if award.award_title:
-            title = award.award_title[:80] + "..." if len(award.award_title) > 80 else award.award_title
-            print(f"   Title: {title}")
+            print(f"   Title: {truncate(award.award_title, 80)}")
         print(f"   Classification: {award.classification or 'N/A'}")
         print(f"   Period: {award.period_of_contract or 'N/A'}")
         print(f"   Award Date: {award.award_date or 'N/A'}")
@@ -106,8 +109,7 @@ def main():
         print(f"\n🏛️ PROCURING ENTITY:")
         print(f"   Agency: {award.procuring_entity or 'N/A'}")
         if award.agency_address:
-            addr = award.agency_address[:80] + "..." if len(award.agency_address) > 80 else award.agency_address
-            print(f"   Address: {addr}")
+            print(f"   Address: {truncate(award.agency_address, 80)}")
         print(f"   Delivery Location: {award.delivery_location or 'N/A'}")
 
         # Other info
@@ -135,8 +137,8 @@ def main():
     if total > 0:
         print(f"\n📊 QUICK STATS:")
 
-        total_abc = sum(a.approved_budget for a in all_awards if a.approved_budget)
-        total_contract = sum(a.contract_amount for a in all_awards if a.contract_amount)
+        total_abc = totals['total_abc']
+        total_contract = totals['total_contract_amount']
         total_savings = total_abc - total_contract
 
         print(f"   Total ABC: PHP {total_abc:,.2f}")
@@ -147,8 +149,8 @@ def main():
             print(f"   Average Savings: {avg_savings_pct:.1f}%")
 
         # Count unique entities
-        unique_agencies = len(set(a.procuring_entity for a in all_awards if a.procuring_entity))
-        unique_awardees = len(set(a.awardee_name for a in all_awards if a.awardee_name))
+        unique_agencies = totals['unique_agencies']
+        unique_awardees = totals['unique_awardees']
 
         print(f"\n   Unique Procuring Entities: {unique_agencies}")
         print(f"   Unique Awardees: {unique_awardees}")